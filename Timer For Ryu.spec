@@ -6,9 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
-        ('assets/alert.wav', 'assets'),
-        ('assets/fonts/Pretendard-Regular.otf', 'assets/fonts'),
-        ('assets/fonts/Pretendard-Bold.otf', 'assets/fonts'),
+        ('assets/assets.rcc', 'assets'),
     ],
     hiddenimports=[],
     hookspath=[],
@@ -0,0 +1,12 @@
+"""
+Performance benchmarks for Timer For Ryu.
+
+Each benchmark lives in a ``bench_<name>.py`` module exposing ``main()``.
+
+Usage:
+    uv run python -m benchmarks              # list available benchmarks
+    uv run python -m benchmarks widgets      # run one benchmark
+
+    # Headless machines
+    QT_QPA_PLATFORM=offscreen uv run python -m benchmarks widgets
+"""
@@ -0,0 +1,43 @@
+"""
+Benchmark runner.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+"""
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+
+def available_benchmarks() -> list:
+    """
+    List benchmark names (bench_<name>.py modules in this package).
+
+    Returns:
+        list: Sorted benchmark names
+    """
+    package_dir = Path(__file__).parent
+    return sorted(
+        module.name[len("bench_"):]
+        for module in pkgutil.iter_modules([str(package_dir)])
+        if module.name.startswith("bench_")
+    )
+
+
+def main():
+    """Run the benchmark named on the command line."""
+    names = available_benchmarks()
+    if len(sys.argv) < 2 or sys.argv[1] not in names:
+        print("Usage: python -m benchmarks <name> [args...]")
+        print(f"Available: {', '.join(names)}")
+        return 1
+
+    module = importlib.import_module(f"benchmarks.bench_{sys.argv[1]}")
+    return module.main(sys.argv[2:]) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
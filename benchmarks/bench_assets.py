@@ -0,0 +1,107 @@
+"""
+Asset loading benchmark: loose files vs compiled resource bundle.
+
+Loads the fonts, control icons and alert sound the way startup does, in a
+fresh process per mode, and reports elapsed time plus read syscalls and
+bytes read (from /proc/self/io, Linux only). The bundle is compiled into a
+temporary file with build_resources.py.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks assets [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_RUNS = 5
+ICONS = ["play.svg", "pause.svg", "stop.svg"]
+
+
+def _read_io_counters() -> dict:
+    """Get this process's I/O counters (empty if /proc is unavailable)."""
+    try:
+        with open('/proc/self/io') as f:
+            return {key: int(value) for key, value in (line.split(':') for line in f)}
+    except OSError:
+        return {}
+
+
+def _load_assets(bundle_path: str) -> dict:
+    """Load startup assets in this process and measure the cost."""
+    from PySide6.QtCore import QResource
+    from PySide6.QtGui import QFontDatabase
+    from PySide6.QtSvg import QSvgRenderer  # noqa: F401 (import cost is not asset I/O)
+    import ui.utils.assets as assets
+    from ui.font_loader import load_fonts
+    from ui.utils.icon_loader import create_svg_icon
+
+    app = get_app()
+    # Populate the system font database first; its fontconfig scan is the same in both modes
+    QFontDatabase.families()
+
+    before = _read_io_counters()
+    start = time.perf_counter()
+    if bundle_path:
+        assets._bundle_registered = QResource.registerResource(bundle_path)
+    else:
+        assets._bundle_registered = False
+
+    load_fonts()
+    for icon_name in ICONS:
+        create_svg_icon(icon_name, "#43a047", size=30)
+    assets.read_asset("alert.wav")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    after = _read_io_counters()
+
+    app.processEvents()
+    return {
+        'ms': elapsed_ms,
+        'read syscalls': after.get('syscr', 0) - before.get('syscr', 0),
+        'bytes read': after.get('rchar', 0) - before.get('rchar', 0),
+    }
+
+
+def _run_mode(bundle_path: str, runs: int) -> dict:
+    """Measure one mode in fresh processes and collect samples."""
+    samples = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks', 'assets', '--child', bundle_path],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True, timeout=120
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        for name, value in report.items():
+            samples.setdefault(name, []).append(value)
+    return samples
+
+
+def main(args):
+    """Compare loose-file and bundled asset loading."""
+    if args and args[0] == '--child':
+        print(json.dumps(_load_assets(args[1])))
+        return
+
+    from build_resources import build_resources
+
+    runs = int(args[0]) if args else DEFAULT_RUNS
+    bundle_path = Path(tempfile.mkdtemp()) / "assets.rcc"
+    if not build_resources(bundle_path):
+        return 1
+
+    print_header(f"STARTUP ASSET LOADING (2 fonts, {len(ICONS)} icons, 1 sound, median of {runs} runs)")
+    for label, path in (("Loose files", ""), ("Resource bundle", str(bundle_path))):
+        samples = _run_mode(path, runs)
+        medians = {name: statistics.median(values) for name, values in samples.items()}
+        print(f"{label:<16} {medians['ms']:7.1f} ms  "
+              f"{medians['read syscalls']:6.0f} read syscalls  {medians['bytes read']:10,.0f} bytes read")
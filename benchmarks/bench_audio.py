@@ -0,0 +1,87 @@
+"""
+Alert audio benchmark: 20 near-simultaneous timer completions.
+
+Drives AlertMixer the way QAudioSink pulls it (one period of PERIOD_MS at
+a time) while 20 completions arrive within BURST_MS, and reports the CPU
+time spent mixing relative to the audio duration, plus the play-to-sound
+latency: frames between play() and the first beep sample in the stream,
+on top of the sink buffer (BUFFER_MS) that bounds it. Runs once with all
+completions on one sound (coalesced burst) and once with 20 different
+sounds (20 voices mixed).
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks audio [completions]
+"""
+import time
+
+from benchmarks.common import print_header
+
+DEFAULT_COMPLETIONS = 20
+BURST_MS = 200  # Completions are spread over this window
+PERIOD_MS = 10  # Audio pulled per sink read
+BEEPS = 10
+BEEP_INTERVAL_MS = 500
+
+
+def _run_burst(completions: int, distinct_sounds: bool) -> dict:
+    """Mix one burst until silent and collect timing."""
+    from ui.utils.assets import read_asset
+    from ui.utils.audio import BUFFER_MS, MIX_RATE, AlertMixer, decode_wav
+
+    clip = decode_wav(read_asset("alert.wav"), MIX_RATE)
+    mixer = AlertMixer(MIX_RATE)
+    period = MIX_RATE * PERIOD_MS // 1000
+    spacing = max(1, BURST_MS // PERIOD_MS // completions)
+
+    latencies = []
+    pending = {}  # Sound key -> stream frame of its play() call
+    periods = 0
+    cpu = 0.0
+    while True:
+        if periods % spacing == 0 and periods // spacing < completions:
+            key = f"sound-{periods // spacing}" if distinct_sounds else "alert"
+            start = time.process_time()
+            mixer.play(key, clip, BEEPS, BEEP_INTERVAL_MS)
+            cpu += time.process_time() - start
+            pending.setdefault(key, mixer.frame)
+
+        start = time.process_time()
+        samples = mixer.read(period)
+        cpu += time.process_time() - start
+        periods += 1
+
+        if pending and any(samples):
+            first = next(i for i, sample in enumerate(samples) if sample)
+            for key, frame in list(pending.items()):
+                latencies.append((mixer.frame - period + first - frame) * 1000 / MIX_RATE)
+                del pending[key]
+        if mixer.is_idle() and periods // spacing >= completions:
+            break
+
+    audio_ms = periods * PERIOD_MS
+    return {
+        'audio ms': audio_ms,
+        'cpu ms': cpu * 1000,
+        'cpu %': cpu * 1000 / audio_ms * 100,
+        'latency ms': max(latencies) if latencies else 0.0,
+        'buffer ms': BUFFER_MS,
+        'coalesced': mixer.coalesced,
+    }
+
+
+def main(args):
+    """Measure alert mixing cost and latency for a completion burst."""
+    completions = int(args[0]) if args else DEFAULT_COMPLETIONS
+
+    print_header(f"ALERT BURST ({completions} completions within {BURST_MS} ms, "
+                 f"{BEEPS} beeps x {BEEP_INTERVAL_MS} ms)")
+    for label, distinct in (("One sound (coalesced)", False), (f"{completions} sounds (mixed)", True)):
+        result = _run_burst(completions, distinct)
+        print(f"{label:<24} CPU {result['cpu ms']:7.1f} ms for {result['audio ms'] / 1000:.1f} s audio "
+              f"({result['cpu %']:.2f}%)  play-to-stream {result['latency ms']:.1f} ms "
+              f"+ sink buffer ≤ {result['buffer ms']} ms  coalesced {result['coalesced']}")
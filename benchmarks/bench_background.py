@@ -0,0 +1,94 @@
+"""
+Background CPU benchmark: process CPU time with the window visible and minimized.
+
+Runs 200 timers in a window wired like MainWindow (TimerPanel driven by a
+RenderPolicy) and measures the process CPU time over a stretch of event
+loop, once with the window visible and once minimized, extrapolated to an
+hour (pass 3600 as seconds to measure a real hour). A few timers are set
+to complete during each stretch; their completion signal must arrive on
+time in both cases.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks background [timers] [seconds]
+"""
+import time
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_TIMERS = 200
+DEFAULT_SECONDS = 30
+COMPLETING = 5  # Timers completing during each stretch
+
+
+def main(args):
+    """Compare CPU time per hour with the window visible and minimized."""
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QMainWindow
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from ui.font_loader import load_fonts
+    from ui.panels.timer_panel import TimerPanel
+    from ui.utils.render_policy import RenderPolicy
+
+    count = int(args[0]) if len(args) > 0 else DEFAULT_TIMERS
+    seconds = float(args[1]) if len(args) > 1 else DEFAULT_SECONDS
+    app = get_app()
+    load_fonts()
+
+    window = QMainWindow()
+    window.resize(1000, 600)
+    panel = TimerPanel()
+    window.setCentralWidget(panel)
+    policy = RenderPolicy(window)
+    policy.visibility_changed.connect(panel.set_rendering)
+    window.show()
+
+    template = TimerTemplate.create("상담", timedelta(hours=2), 0)
+    for i in range(count):
+        panel.add_timer_item(TimerInstance.create(f"고객 {i}", template.id, template.duration, i), template)
+    for item_widget in panel.timer_items:
+        item_widget._on_start()
+    app.processEvents()
+
+    completed = {}
+    def on_completed(timers, missed):
+        for timer in timers:
+            completed[timer.id] = time.monotonic()
+    panel.timers_completed.connect(on_completed)
+
+    def run(label: str):
+        # Restart a few timers so they complete during this stretch
+        deadlines = {}
+        for i, item_widget in enumerate(panel.timer_items[:COMPLETING]):
+            item_widget._on_stop()
+            item_widget.timer.remaining_seconds = round(seconds * (i + 1) / (COMPLETING + 1))
+            item_widget._on_start()
+            deadlines[item_widget.timer.id] = time.monotonic() + item_widget.timer.remaining_seconds
+        panel.blinker.clear()
+        completed.clear()
+
+        loop = QEventLoop()  # Not app.exec(): app.quit() would close the window
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        cpu_start = time.process_time()
+        loop.exec()
+        cpu = time.process_time() - cpu_start
+
+        late = [completed[timer_id] - deadline for timer_id, deadline in deadlines.items() if timer_id in completed]
+        assert len(late) == len(deadlines), "a completion did not fire"
+        print(f"{label:<10} CPU {cpu * 1000 / seconds:7.2f} ms/s  ({cpu * 3600 / seconds:6.1f} s per hour)  "
+              f"completions {len(late)}/{len(deadlines)}, latest {max(late) * 1000:5.1f} ms after deadline")
+
+    print_header(f"BACKGROUND CPU ({count} running timers, {seconds:g} s per run)")
+    run("visible")
+    window.showMinimized()
+    app.processEvents()
+    assert not policy.is_visible()
+    run("minimized")
+    window.showNormal()
+    app.processEvents()
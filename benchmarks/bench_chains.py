@@ -0,0 +1,209 @@
+"""
+Chain benchmark: 1000 concurrent template chains advancing on their own.
+
+Runs 1000 customers through a three-stage chain (greeting 2 min ->
+diagnosis 10 min -> wrap-up 3 min) in a shown TimerPanel on a VirtualClock,
+with a temporary database saving stage changes as MainWindow does:
+    shift   chains start at random seconds over 5 minutes; the panel wakes
+            at engine deadlines only, advances each batch of stages inside
+            the engine poll and saves it in one write (the shift's stage
+            changes are then saved again one write per batch and one write
+            per change, for comparison)
+    sleep   all chains start together and the machine sleeps for 13
+            minutes: one catch-up pass moves every chain through two stages
+Checks that every chain advances twice, completes exactly 15 minutes after
+its start and is back on its first stage, in the database as well.
+
+Version: 1.0.2
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks chains [chains]
+"""
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_CHAINS = 1000
+STAGES = (("인사", 2), ("진단", 10), ("마무리", 3))  # (template name, minutes)
+START_SPREAD = 300  # Seconds over which the shift's chains start
+SLEEP = 13 * 60
+SEED = 5
+
+
+def main(args):
+    """Time chained stage transitions during a shift and after a sleep."""
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+    from models.clock import VirtualClock, set_clock
+    from models.enums import TimerStatus
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.database import DatabaseService
+    from ui.font_loader import load_fonts
+    from ui.panels.timer_panel import TimerPanel
+    from ui.utils.toast import ToastManager, show_toast
+
+    count = int(args[0]) if args else DEFAULT_CHAINS
+    app = get_app()
+    load_fonts()
+    rng = random.Random(SEED)
+    chain_seconds = sum(minutes for _, minutes in STAGES) * 60
+
+    # Linked last stage first, so each template can name its successor
+    templates = []
+    next_template_id = None
+    for name, minutes in reversed(STAGES):
+        template = TimerTemplate.create(name, timedelta(minutes=minutes), len(STAGES) - len(templates),
+                                        next_template_id=next_template_id)
+        templates.insert(0, template)
+        next_template_id = template.id
+    first, last = templates[0], templates[-1]
+
+    clock = VirtualClock(datetime(2026, 10, 19, 9, 0))
+    previous = set_clock(clock)  # Before the panel: its engine takes the clock
+    with tempfile.TemporaryDirectory() as directory:
+        db = DatabaseService(Path(directory) / "bench.db")
+        for template in templates:
+            db.create_template(template)
+        timers = [TimerInstance.create(f"고객 {i}", first.id, first.duration, i) for i in range(count)]
+        # Fixture rows in bulk (DatabaseService writes one row per transaction)
+        with sqlite3.connect(db.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO timers (id, customer_name, template_id, display_order, created_at, chain_template_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [tuple(timer.to_dict().values()) for timer in timers]
+            )
+
+        window = QWidget()
+        window.resize(1000, 600)
+        layout = QVBoxLayout(window)
+        panel = TimerPanel()
+        layout.addWidget(panel)
+        window.show()
+        panel.set_templates(templates)
+        for timer in timers:
+            panel.add_timer_item(timer, first)
+        app.processEvents()
+
+        batches = []  # Timers of each stages_advanced batch
+        writes = []  # Timers of each timer_stages_changed batch (advances and returns to the first stage)
+        completed_at = {}
+
+        def on_advanced(advanced):
+            # As MainWindow does: one toast request per batch
+            batches.append(list(advanced))
+            show_toast(window, f"타이머 {len(advanced)}개 다음 단계 시작", key="timer_stage",
+                       group_message="타이머 {count}개 다음 단계 시작", count=len(advanced))
+
+        def on_stages_changed(changed):
+            # As MainWindow does: one write per batch
+            db.update_timer_templates(changed)
+            writes.append(list(changed))
+
+        def on_completed(completed, missed):
+            for timer in completed:
+                completed_at[timer.id] = clock.monotonic()
+
+        panel.stages_advanced.connect(on_advanced)
+        panel.timer_stages_changed.connect(on_stages_changed)
+        panel.timers_completed.connect(on_completed)
+
+        def check(started_at, label):
+            assert all(timer.status == TimerStatus.STOPPED for timer in timers), f"{label}: chains still running"
+            assert all(completed_at[timer.id] - started_at[timer.id] == chain_seconds for timer in timers), \
+                f"{label}: a chain did not take {chain_seconds} s"
+            assert all(timer.template_id == first.id and timer.chain_template_id is None for timer in timers), \
+                f"{label}: a chain not back on its first stage"
+            with sqlite3.connect(db.db_path) as conn:
+                (stale,) = conn.execute(
+                    "SELECT COUNT(*) FROM timers WHERE template_id != ? OR chain_template_id IS NOT NULL",
+                    (str(first.id),)
+                ).fetchone()
+            assert not stale, f"{label}: {stale} timers not saved back on their first stage"
+
+        print_header(f"TEMPLATE CHAINS ({count:,} chains of {' -> '.join(name for name, _ in STAGES)})")
+
+        # Shift: staggered starts, waking at deadlines only
+        starts = sorted((rng.randint(0, START_SPREAD), i) for i in range(count))
+        origin = clock.monotonic()
+        started_at = {}
+        wakeups = 0
+        position = 0
+        began = time.perf_counter()
+        while position < len(starts) or panel.engine:
+            candidates = []
+            if position < len(starts):
+                candidates.append(origin + starts[position][0])
+            delay = panel.engine.seconds_until_next()
+            if delay is not None:
+                candidates.append(clock.monotonic() + delay)
+            clock.advance(min(candidates) - clock.monotonic())
+            wakeups += 1
+            panel._on_deadline()
+            while position < len(starts) and origin + starts[position][0] <= clock.monotonic():
+                item_widget = panel.timer_items[starts[position][1]]
+                item_widget.start()
+                started_at[item_widget.timer.id] = clock.monotonic()
+                position += 1
+        shift = time.perf_counter() - began
+        check(started_at, "shift")
+        transitions = sum(len(batch) for batch in batches)
+        assert transitions == count * (len(STAGES) - 1), f"shift: {transitions} stage changes"
+
+        # The shift's stage changes saved again, back to back
+        changes = sum(len(batch) for batch in writes)
+        began = time.perf_counter()
+        for batch in writes:
+            db.update_timer_templates(batch)
+        per_batch = time.perf_counter() - began
+        began = time.perf_counter()
+        for batch in writes:
+            for timer in batch:
+                db.update_timer_templates([timer])
+        per_change = time.perf_counter() - began
+        print(f"shift  {shift * 1000:8.1f} ms  ({transitions:,} stage changes in {len(batches):,} batches, "
+              f"{wakeups:,} wake-ups)")
+        print(f"  save {per_batch * 1000:8.1f} ms  one write per batch ({len(writes):,} writes, including returns "
+              f"to the first stage); {per_change * 1000:8.1f} ms one write per change ({changes:,})")
+
+        # Sleep: all chains start together, the machine sleeps through two stages
+        batches.clear()
+        writes.clear()
+        completed_at.clear()
+        started_at = {}
+        for item_widget in panel.timer_items:
+            item_widget.start()
+            started_at[item_widget.timer.id] = clock.monotonic()
+        clock.sleep(SLEEP)
+        began = time.perf_counter()
+        panel._on_deadline()
+        catch_up = time.perf_counter() - began
+        assert len(batches) == 1 and len(writes) == 1 and not completed_at, "sleep: not one batch"
+        assert all(timer.template_id == last.id and timer.chain_template_id == first.id for timer in timers), \
+            "sleep: chains not in their last stage"
+        remaining = {panel.engine.refresh(timer) for timer in timers}
+        assert remaining == {chain_seconds - SLEEP}, f"sleep: remaining {remaining}"
+        print(f"sleep  {catch_up * 1000:8.1f} ms  ({len(batches[0]):,} chains through {len(STAGES) - 1} stages "
+              f"in one pass and one write)")
+        # The monotonic clock stood still during the sleep; the chains end SLEEP seconds early on it
+        clock.advance(chain_seconds - SLEEP)
+        panel._on_deadline()
+        check({timer_id: at - SLEEP for timer_id, at in started_at.items()}, "sleep")
+        print(f"\nEvery chain advanced twice and ran {chain_seconds // 60} minutes in both runs.")
+
+        player = panel._alert_player
+        toasts = ToastManager.for_widget(window)
+
+        if player is not None:
+            player.stop()
+        toasts.clear()
+        panel.clear_timers()
+        window.close()
+    set_clock(previous)
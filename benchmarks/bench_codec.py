@@ -0,0 +1,71 @@
+"""
+Model codec benchmark: binary blocks vs to_dict()/from_dict().
+
+Round-trips 100k templates and 100k timers through models.codec and
+through the dict path (to_dict/from_dict, and the same dicts as JSON for a
+byte-size comparison), reporting objects per second each way and the
+encoded size.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks codec [count]
+"""
+import json
+import time
+from datetime import timedelta
+
+from benchmarks.common import print_header
+
+DEFAULT_COUNT = 100_000
+TEMPLATES = 20
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds / 1000:7.0f}k/s"
+
+
+def main(args):
+    """Compare binary and dict serialization throughput."""
+    from models.codec import decode_templates, decode_timers, encode_templates, encode_timers
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+
+    count = int(args[0]) if args else DEFAULT_COUNT
+    templates = [TimerTemplate.create(f"상담 {i}분", timedelta(minutes=i % 99 + 1), i) for i in range(count)]
+    timers = [TimerInstance.create(f"고객 {i}", templates[i % TEMPLATES].id, templates[i % TEMPLATES].duration, i)
+              for i in range(count)]
+    durations = {str(template.id): template.duration for template in templates[:TEMPLATES]}
+
+    print_header(f"MODEL CODEC ({count:,} objects per model)")
+    for label, objects, encode, decode, from_dict in (
+        ("TimerTemplate", templates, encode_templates, decode_templates,
+         TimerTemplate.from_dict),
+        ("TimerInstance", timers, encode_timers, decode_timers,
+         lambda data: TimerInstance.from_dict(data, durations[data['template_id']])),
+    ):
+        start = time.perf_counter()
+        data = encode(objects)
+        encode_s = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded, _ = decode(data)
+        decode_s = time.perf_counter() - start
+        assert decoded == objects
+
+        start = time.perf_counter()
+        dicts = [obj.to_dict() for obj in objects]
+        to_dict_s = time.perf_counter() - start
+        start = time.perf_counter()
+        [from_dict(item) for item in dicts]
+        from_dict_s = time.perf_counter() - start
+        json_bytes = len(json.dumps(dicts, default=str, ensure_ascii=False).encode('utf-8'))
+
+        print(f"{label}")
+        print(f"  binary  encode {_rate(count, encode_s)}  decode {_rate(count, decode_s)}  "
+              f"{len(data) / count:5.1f} B/object")
+        print(f"  dict    encode {_rate(count, to_dict_s)}  decode {_rate(count, from_dict_s)}  "
+              f"{json_bytes / count:5.1f} B/object as JSON")
+        print(f"  round trip {(to_dict_s + from_dict_s) / (encode_s + decode_s):.1f}x faster")
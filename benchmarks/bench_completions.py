@@ -0,0 +1,103 @@
+"""
+Completion benchmark: 1000 timers running out at the same moment.
+
+Starts 1000 timers with the same duration in a shown TimerPanel on a
+VirtualClock, moves the clock to their deadline and times the deadline
+handler completing them. Compared with dispatching the same completions
+one timer at a time (each with its own beep request, signal and toast
+request, as before batching). Reports the time taken, the beep sequences
+started and merged, the toast requests and toasts created, and the cost of
+one blink toggle for all completed rows.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks completions [timers]
+"""
+import time
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_TIMERS = 1000
+
+
+def main(args):
+    """Time completing simultaneous expiries as one batch and one by one."""
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+    from models.clock import VirtualClock, set_clock
+    from models.enums import TimerStatus
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from ui.font_loader import load_fonts
+    from ui.panels.timer_panel import TimerPanel
+    from ui.utils.toast import ToastManager, show_toast
+
+    count = int(args[0]) if args else DEFAULT_TIMERS
+    app = get_app()
+    load_fonts()
+    template = TimerTemplate.create("상담", timedelta(minutes=10), 0)
+
+    def run(label: str, batched: bool):
+        clock = VirtualClock()
+        previous = set_clock(clock)  # Before the panel: its engine takes the clock
+        window = QWidget()
+        window.resize(1000, 600)
+        layout = QVBoxLayout(window)
+        panel = TimerPanel()
+        layout.addWidget(panel)
+        window.show()
+
+        signals = []
+
+        def on_completed(timers, missed):
+            # As MainWindow does
+            signals.append(len(timers))
+            message = f"'{timers[0].customer_name}' 타이머 완료" if len(timers) == 1 else f"타이머 {len(timers)}개 완료"
+            show_toast(window, message, key="timer_completed", group_message="타이머 {count}개 완료",
+                       count=len(timers))
+        panel.timers_completed.connect(on_completed)
+
+        for i in range(count):
+            panel.add_timer_item(TimerInstance.create(f"고객 {i}", template.id, template.duration, i), template)
+        for item_widget in panel.timer_items:
+            item_widget._on_start()
+        app.processEvents()
+
+        clock.advance(template.duration_seconds)
+        start = time.perf_counter()
+        if batched:
+            panel._on_deadline()
+        else:
+            panel._check_clock()
+            for timer in panel.engine.poll():
+                panel._complete_batch([timer])
+            panel._schedule_next_deadline()
+        elapsed = time.perf_counter() - start
+
+        assert all(item_widget.timer.status == TimerStatus.STOPPED for item_widget in panel.timer_items)
+        assert len(panel.blinker) == count and not panel.engine
+        assert not panel.has_active_timers(template.id)
+
+        toggle_start = time.perf_counter()
+        panel.blinker._toggle()
+        toggle = time.perf_counter() - toggle_start
+
+        player = panel._alert_player
+        toasts = ToastManager.for_widget(window)
+        print(f"{label:<12} {elapsed * 1000:8.1f} ms  {len(signals):5} signals  "
+              f"{len(signals) - player.coalesced:2} beep sequences ({player.coalesced} merged)  "
+              f"{len(signals):5} toast requests ({toasts.created} shown)  blink toggle {toggle * 1000:5.2f} ms")
+
+        player.stop()
+        toasts.clear()
+        panel.clear_timers()
+        window.close()
+        set_clock(previous)
+
+    print_header(f"SIMULTANEOUS COMPLETIONS ({count:,} timers)")
+    run("one by one", batched=False)
+    run("batched", batched=True)
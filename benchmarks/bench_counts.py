@@ -0,0 +1,82 @@
+"""
+Active timer counter scaling benchmark.
+
+Replays random start/pause/stop transitions over 500 templates and 10k
+timers, comparing ActiveTimerCounter with the scans it replaced: the
+per-event scan in TimerPanel._on_timer_status_changed and the
+templates x timers refresh in MainWindow._update_all_template_buttons.
+The counter is checked against a full recount at the end.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks counts
+"""
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+from benchmarks.common import print_header, timed
+
+TEMPLATES = 500
+TIMERS = 10_000
+EVENTS = 10_000
+
+
+def main(args):
+    """Run active timer counter comparisons."""
+    from models.enums import TimerStatus
+    from ui.panels.indexing import ActiveTimerCounter
+
+    active_statuses = (TimerStatus.RUNNING, TimerStatus.PAUSED)
+    rng = random.Random(0)
+    template_ids = [uuid4() for _ in range(TEMPLATES)]
+    timers = [
+        SimpleNamespace(id=uuid4(), template_id=rng.choice(template_ids), status=TimerStatus.STOPPED)
+        for _ in range(TIMERS)
+    ]
+    events = [
+        (rng.choice(timers), rng.choice(list(TimerStatus)))
+        for _ in range(EVENTS)
+    ]
+
+    print_header(f"STATUS TRANSITIONS ({TEMPLATES} templates, {TIMERS:,} timers)")
+    scanned = EVENTS // 10
+    with timed("Scan all timers per event (previous)", scanned):
+        for timer, status in events[:scanned]:
+            timer.status = status
+            template_id = str(timer.template_id)
+            for other in timers:
+                if str(other.template_id) == template_id and other.status in active_statuses:
+                    break
+
+    for timer in timers:
+        timer.status = TimerStatus.STOPPED
+    counter = ActiveTimerCounter()
+    crossings = 0
+    with timed("ActiveTimerCounter.set_active", EVENTS):
+        for timer, status in events:
+            timer.status = status
+            if counter.set_active(timer.id, timer.template_id, status in active_statuses):
+                crossings += 1
+    print(f"Button updates emitted: {crossings:,} of {EVENTS:,} transitions")
+
+    print_header(f"FULL BUTTON REFRESH ({TEMPLATES} templates, {TIMERS:,} timers)")
+    with timed("templates x timers scan (previous)"):
+        for template_id in template_ids:
+            for timer in timers:
+                if timer.template_id == template_id and timer.status in active_statuses:
+                    break
+    with timed("ActiveTimerCounter.has_active per template"):
+        for template_id in template_ids:
+            counter.has_active(template_id)
+
+    recount = {template_id: 0 for template_id in template_ids}
+    for timer in timers:
+        if timer.status in active_statuses:
+            recount[timer.template_id] += 1
+    assert all(counter.count(template_id) == n for template_id, n in recount.items())
+    print(f"\nCounter matches full recount ({len(counter):,} active timers)")
@@ -0,0 +1,58 @@
+"""
+Font factory and readout relayout benchmark.
+
+Compares cached Theme.Fonts lookups with constructing QFont on every call,
+and measures setText() on a countdown label with and without the fixed size
+taken from Theme.Fonts.timer_metrics().
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks fonts
+"""
+from benchmarks.common import get_app, print_header, timed
+
+
+def main(args):
+    """Run font factory and label update comparisons."""
+    app = get_app()
+
+    from PySide6.QtGui import QFont
+    from PySide6.QtWidgets import QHBoxLayout, QLabel, QWidget
+    from ui.theme import Theme
+    from ui.widgets.base_list_item import format_time_display
+
+    calls = 100_000
+    print_header(f"FONT FACTORY ({calls:,} calls)")
+    with timed("QFont() per call", calls):
+        for _ in range(calls):
+            QFont(Theme.Fonts.FAMILY, Theme.Fonts.SIZE_MEDIUM, QFont.Weight.Bold)
+    with timed("Theme.Fonts.header() cached", calls):
+        for _ in range(calls):
+            Theme.Fonts.header()
+
+    rows, ticks = 200, 20
+    print_header(f"READOUT UPDATES ({rows} labels x {ticks} ticks)")
+    for fixed in (False, True):
+        host = QWidget()
+        layout = QHBoxLayout(host)
+        labels = []
+        for _ in range(rows):
+            label = QLabel("00 : 00")
+            label.setFont(Theme.Fonts.timer_display())
+            if fixed:
+                label.setFixedSize(Theme.Fonts.timer_metrics().readout_size)
+            layout.addWidget(label)
+            labels.append(label)
+        host.show()
+        app.processEvents()
+        with timed(f"setText + event loop ({'fixed size' if fixed else 'size from text'})", rows * ticks):
+            for tick in range(ticks):
+                text = format_time_display(59 - tick, 59 - tick)
+                for label in labels:
+                    label.setText(text)
+                app.processEvents()
+        host.close()
@@ -0,0 +1,68 @@
+"""
+Row lookup benchmark for the panel RowIndex.
+
+Compares RowIndex lookups with the linear scans the panels used before, at
+1k and 10k rows, and measures remove and drag-reorder bookkeeping. Rows are
+lightweight stand-ins carrying a ``timer`` model (with an ``id``), the
+RowIndex model getter's result, so 10k rows need no widgets.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks index
+"""
+import random
+from types import SimpleNamespace
+from uuid import uuid4
+
+from benchmarks.common import print_header, timed
+
+
+def _make_rows(count: int) -> list:
+    return [SimpleNamespace(timer=SimpleNamespace(id=uuid4())) for _ in range(count)]
+
+
+def main(args):
+    """Run row index comparisons."""
+    from ui.panels.indexing import RowIndex
+
+    lookups = 10_000
+    rng = random.Random(0)
+    for count in (1_000, 10_000):
+        rows = _make_rows(count)
+        index = RowIndex(lambda row: row.timer)
+        for row in rows:
+            index.append(row)
+        targets = [str(rng.choice(rows).timer.id) for _ in range(lookups)]
+
+        print_header(f"ROW LOOKUP ({count:,} rows, {lookups:,} lookups)")
+        scan_lookups = 1_000
+        with timed("Linear scan by str(id) (previous)", scan_lookups):
+            for target in targets[:scan_lookups]:
+                for row in rows:
+                    if str(row.timer.id) == target:
+                        break
+        with timed("RowIndex.get", lookups):
+            for target in targets:
+                index.get(target)
+        with timed("RowIndex.row", lookups):
+            for target in targets:
+                index.row(target)
+
+        moves = 1_000
+        print_header(f"ROW MUTATIONS ({count:,} rows)")
+        with timed("move, adjacent rows (typical drag)", moves):
+            for _ in range(moves):
+                start = rng.randrange(count - 1)
+                index.move(start, start, start + 2)
+        with timed("move, random rows", moves):
+            for _ in range(moves):
+                start = rng.randrange(count)
+                index.move(start, start, rng.randrange(count + 1))
+        removals = 100
+        with timed("remove from middle (back to back)", removals):
+            for _ in range(removals):
+                index.remove(index.items[len(index) // 2].timer.id)
@@ -0,0 +1,110 @@
+"""
+Model memory benchmark: plain vs slotted TimerTemplate / TimerInstance.
+
+Builds 100k objects of each model with tracemalloc running and reports the
+bytes allocated per object (the object itself plus its UUIDs, datetimes,
+timedeltas and attribute dict) and the construction time (measured untraced). The "plain"
+classes are copies of the models before they were slotted, kept here only
+as the baseline. Timers are spread over 20 templates; with the slotted
+models they share their template's interned UUID.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks models [count]
+"""
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from benchmarks.common import print_header
+
+DEFAULT_COUNT = 100_000
+TEMPLATES = 20
+
+
+@dataclass
+class _PlainTemplate:
+    """TimerTemplate before slots (baseline)."""
+    id: UUID
+    name: str
+    duration: timedelta
+    display_order: int
+    created_at: datetime
+    updated_at: datetime
+    alert_frequency: int
+    alert_pattern: object
+
+
+@dataclass
+class _PlainTimer:
+    """TimerInstance before slots (baseline)."""
+    id: UUID
+    customer_name: str
+    template_id: UUID
+    remaining_time: timedelta
+    status: object
+    display_order: int
+    created_at: datetime
+
+
+def _measure(build) -> tuple:
+    """Return (bytes kept under tracemalloc, seconds untraced, objects) for build()."""
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = build()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return kept, elapsed, result
+
+
+def main(args):
+    """Compare memory per model object."""
+    from models.enums import AlertPattern, TimerStatus
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+
+    count = int(args[0]) if args else DEFAULT_COUNT
+    template_ids = [str(uuid4()) for _ in range(TEMPLATES)]
+    names = [f"고객 {i}" for i in range(count)]  # Shared by both runs (not measured)
+    now = datetime.now().isoformat()
+
+    def plain_templates():
+        return [_PlainTemplate(UUID(template_ids[i % TEMPLATES]), names[i], timedelta(seconds=300), i,
+                               datetime.fromisoformat(now), datetime.fromisoformat(now), 800, AlertPattern.SINGLE)
+                for i in range(count)]
+
+    def slotted_templates():
+        return [TimerTemplate.from_dict({'id': template_ids[i % TEMPLATES], 'name': names[i],
+                                         'duration_seconds': 300, 'display_order': i,
+                                         'created_at': now, 'updated_at': now})
+                for i in range(count)]
+
+    def plain_timers():
+        return [_PlainTimer(uuid4(), names[i], UUID(template_ids[i % TEMPLATES]), timedelta(seconds=300),
+                            TimerStatus.STOPPED, i, datetime.fromisoformat(now))
+                for i in range(count)]
+
+    def slotted_timers():
+        return [TimerInstance.from_dict({'id': uuid4(), 'customer_name': names[i],
+                                         'template_id': template_ids[i % TEMPLATES],
+                                         'display_order': i, 'created_at': now}, timedelta(seconds=300))
+                for i in range(count)]
+
+    print_header(f"MODEL MEMORY ({count:,} objects, {TEMPLATES} templates)")
+    for label, plain, slotted in (("TimerTemplate", plain_templates, slotted_templates),
+                                  ("TimerInstance", plain_timers, slotted_timers)):
+        plain_bytes, plain_s, _ = _measure(plain)
+        slotted_bytes, slotted_s, objects = _measure(slotted)
+        assert not hasattr(objects[0], '__dict__')
+        print(f"{label:<14} plain {plain_bytes / count:6.0f} B/object ({plain_s * 1000:5.0f} ms)  "
+              f"slotted {slotted_bytes / count:6.0f} B/object ({slotted_s * 1000:5.0f} ms)  "
+              f"saved {(plain_bytes - slotted_bytes) / 2 ** 20:5.1f} MiB")
@@ -0,0 +1,71 @@
+"""
+Row widget pool benchmark.
+
+Reloads a TimerPanel and a TemplatePanel with 2k rows several times, once
+with the panels' widget pools disabled (every reload constructs fresh
+widgets) and once with pooling, then prints pool statistics.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks pool [rows]
+"""
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header, timed
+
+DEFAULT_ROWS = 2_000
+RELOADS = 3
+
+
+def _flush_deletes(app):
+    """Run pending deleteLater() calls so widget teardown is included in timings."""
+    from PySide6.QtCore import QEvent
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def main(args):
+    """Run pooled vs unpooled reload comparisons."""
+    app = get_app()
+
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from ui.panels.template_panel import TemplatePanel
+    from ui.panels.timer_panel import TimerPanel
+
+    rows = int(args[0]) if args else DEFAULT_ROWS
+    templates = [
+        TimerTemplate.create(f"상담 {i}", timedelta(minutes=5 + i % 30), i)
+        for i in range(rows)
+    ]
+    timers = [
+        (TimerInstance.create(f"고객 {i}", template.id, template.duration, i), template)
+        for i, template in enumerate(templates)
+    ]
+
+    for label, panel_type, data, load in (
+        ("TIMER PANEL", TimerPanel, timers, TimerPanel.set_timers),
+        ("TEMPLATE PANEL", TemplatePanel, templates, TemplatePanel.set_templates),
+    ):
+        print_header(f"{label} RELOAD ({rows:,} rows x {RELOADS} reloads)")
+        for pooled in (False, True):
+            panel = panel_type()
+            if not pooled:
+                panel.item_pool.max_size = 0
+            load(panel, data)
+            _flush_deletes(app)
+
+            with timed(f"Reload ({'pooled' if pooled else 'no pool'})", RELOADS * rows):
+                for _ in range(RELOADS):
+                    load(panel, data)
+                    _flush_deletes(app)
+
+            if pooled:
+                stats = panel.item_pool.stats()
+                print(f"Pool: size {stats.size}, high-water {stats.high_water:,}, "
+                      f"hits {stats.hits:,}, misses {stats.misses:,}, hit rate {stats.hit_rate:.0%}")
+            panel.deleteLater()
+            _flush_deletes(app)
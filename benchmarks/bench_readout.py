@@ -0,0 +1,74 @@
+"""
+Countdown readout repaint benchmark.
+
+Updates 1k readouts per tick and compares QLabel.setText(f-string) with
+TimeReadout (precomputed strings + cached QStaticText).
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks readout [readout_count] [ticks]
+"""
+from benchmarks.common import get_app, print_header, timed
+
+
+def main(args):
+    """Run formatting and repaint comparisons."""
+    app = get_app()
+
+    from PySide6.QtWidgets import QGridLayout, QLabel, QWidget
+    from ui.theme import Theme
+    from ui.widgets.base_list_item import format_time_seconds
+    from ui.widgets.time_readout import TimeReadout
+
+    count = int(args[0]) if len(args) > 0 else 1000
+    ticks = int(args[1]) if len(args) > 1 else 30
+
+    calls = 600_000
+    print_header(f"FORMATTING ({calls:,} calls)")
+    with timed("f-string per call", calls):
+        for i in range(calls):
+            value = i % 6000
+            f"{value // 60:02d} : {value % 60:02d}"
+    with timed("format_time_seconds() table lookup", calls):
+        for i in range(calls):
+            format_time_seconds(i % 6000)
+
+    print_header(f"REPAINT ({count} readouts x {ticks} ticks)")
+
+    def make_label():
+        label = QLabel("00 : 00")
+        label.setFont(Theme.Fonts.timer_display())
+        return label
+
+    def update_label(label, value):
+        label.setText(f"{value // 60:02d} : {value % 60:02d}")
+
+    def update_readout(readout, value):
+        readout.set_seconds(value)
+
+    for name, factory, update in [
+        ("QLabel.setText", make_label, update_label),
+        ("TimeReadout", TimeReadout, update_readout),
+    ]:
+        host = QWidget()
+        grid = QGridLayout(host)
+        widgets = [factory() for _ in range(count)]
+        columns = 25
+        for i, widget in enumerate(widgets):
+            grid.addWidget(widget, i // columns, i % columns)
+        host.resize(columns * 90, (count // columns + 1) * 30)
+        host.show()
+        app.processEvents()
+
+        with timed(f"{name}: update + repaint per tick", ticks):
+            for tick in range(ticks):
+                value = 5999 - tick
+                for widget in widgets:
+                    update(widget, value)
+                host.repaint()
+                app.processEvents()
+        host.close()
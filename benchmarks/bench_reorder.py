@@ -0,0 +1,106 @@
+"""
+Drag & drop reorder benchmark.
+
+Builds a TemplatePanel with 5k rows backed by a temporary database and
+moves single rows through the list model, as a drop does. Compares the
+previous handling (rebuild the item list with itemWidget() on every row,
+then write every template) with the RowMove delta persisted through
+update_template_orders(). The previous handling leaves display orders
+0, 1, 2, ... as older databases have them; the database is then reopened
+as after an upgrade, so the one-time migration spreads them before the
+delta drags, which must not need a rebalance.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks reorder [rows]
+"""
+import random
+import sqlite3
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from benchmarks.common import get_app, print_header, timed
+
+DEFAULT_ROWS = 5_000
+
+
+def main(args):
+    """Run reorder comparisons."""
+    get_app()
+
+    from PySide6.QtCore import QModelIndex
+    from models.template import TimerTemplate
+    from services.database import DatabaseService
+    from ui.containers.template_item import TemplateItem
+    from ui.panels.indexing import ORDER_GAP
+    from ui.panels.template_panel import TemplatePanel
+
+    rows = int(args[0]) if args else DEFAULT_ROWS
+    db = DatabaseService(Path(tempfile.mkdtemp()) / "bench_reorder.db")
+    templates = [
+        TimerTemplate.create(f"템플릿 {i}", timedelta(minutes=5), i * ORDER_GAP)
+        for i in range(rows)
+    ]
+    for template in templates:
+        db.create_template(template)
+
+    panel = TemplatePanel()
+    with timed(f"Build panel ({rows:,} rows)", rows):
+        panel.set_templates(db.get_all_templates())
+    model = panel.list_widget.model()
+    rng = random.Random(0)
+
+    def drag():
+        start = rng.randrange(rows)
+        model.moveRows(QModelIndex(), start, 1, QModelIndex(), rng.randrange(rows + 1))
+
+    drags = 5
+    print_header(f"SINGLE ROW DRAG ({rows:,} rows, {drags} drags)")
+
+    def previous_handler(move):
+        widgets = []
+        for i in range(panel.list_widget.count()):
+            widget = panel.list_widget.itemWidget(panel.list_widget.item(i))
+            if isinstance(widget, TemplateItem):
+                widgets.append(widget)
+        for i, widget in enumerate(widgets):
+            widget.template.display_order = i
+            db.update_template(widget.template)
+
+    panel.templates_reordered.connect(previous_handler)
+    with timed("Full list rebuild + per-row writes (previous)", drags):
+        for _ in range(drags):
+            drag()
+    panel.templates_reordered.disconnect(previous_handler)
+
+    # Reopen as an upgraded database: orders 0, 1, 2, ... are spread once
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("PRAGMA user_version = 0")
+    with timed(f"Reopen + display order migration ({rows:,} rows)", rows):
+        db = DatabaseService(db.db_path)
+    panel.set_templates(db.get_all_templates())
+    model = panel.list_widget.model()
+
+    changed_counts = []
+
+    def delta_handler(move):
+        changed_counts.append(len(move.changed))
+        db.update_template_orders(move.changed)
+
+    panel.templates_reordered.connect(delta_handler)
+    drags = 200
+    with timed("RowMove delta + bulk write", drags):
+        for _ in range(drags):
+            drag()
+    print(f"Rows written per drag: max {max(changed_counts):,}, "
+          f"rebalances {sum(1 for n in changed_counts if n == rows)}")
+    assert max(changed_counts) == 1, "a drag rebalanced the migrated orders"
+
+    stored = [template.id for template in db.get_all_templates()]
+    assert stored == [widget.template.id for widget in panel.template_items]
+    print("\nDatabase order matches panel order")
@@ -0,0 +1,102 @@
+"""
+Resume benchmark: catching up running timers after the machine slept.
+
+Starts running timers with random remaining times on a VirtualClock, then
+lets it sleep (the wall clock moves on, the monotonic clock stands still)
+and times the reconciliation: ClockJumpDetector.check(), one
+TimerEngine.catch_up() and one refresh of all remaining times. Checks that
+exactly the timers due during the sleep were completed, in deadline order,
+and that the others lost the slept time. Then sets the wall clock an hour
+ahead without a sleep, as NTP, daylight saving or the user would, through
+a TimerPanel's clock check: no timer may complete or lose time.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks resume [timers]
+"""
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_TIMERS = 10_000
+SLEEPS = (5 * 60, 30 * 60, 2 * 3600)  # Seconds
+CLOCK_CHANGE = 3600  # Seconds the wall clock is set ahead
+
+
+def main(args):
+    """Time the catch-up pass after sleeps of several lengths."""
+    from models.clock import ClockJumpDetector, VirtualClock
+    from models.enums import TimerStatus
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.timer_engine import TimerEngine
+
+    count = int(args[0]) if args else DEFAULT_TIMERS
+    template = TimerTemplate.create("상담", timedelta(hours=1), 0)
+
+    print_header(f"RESUME CATCH-UP ({count:,} running timers)")
+    for sleep in SLEEPS:
+        rng = random.Random(sleep)
+        clock = VirtualClock()
+        engine = TimerEngine(clock)
+        detector = ClockJumpDetector(clock)
+        timers = []
+        for i in range(count):
+            timer = TimerInstance.create(f"고객 {i}", template.id, template.duration, i)
+            timer.remaining_seconds = rng.randint(1, 3 * 3600)
+            engine.start(timer)
+            timers.append(timer)
+        deadlines = {timer.id: timer.remaining_seconds for timer in timers}
+        expected = {timer.id for timer in timers if timer.remaining_seconds <= sleep}
+        left = {timer.id: timer.remaining_seconds - sleep for timer in timers if timer.remaining_seconds > sleep}
+
+        clock.sleep(sleep)
+        start = time.perf_counter()
+        jump = detector.check()
+        missed = engine.catch_up(jump.slept)
+        running = engine.refresh_all()
+        elapsed = time.perf_counter() - start
+
+        assert {timer.id for timer in missed} == expected
+        order = [deadlines[timer.id] for timer in missed]
+        assert order == sorted(order), "not in deadline order"
+        assert all(timer.status == TimerStatus.STOPPED and timer.remaining_seconds == 0 for timer in missed)
+        assert {timer.id: timer.remaining_seconds for timer in running} == left
+        print(f"sleep {sleep / 60:5.0f} min  {len(missed):6,} completed  {len(running):6,} still running  "
+              f"catch-up {elapsed * 1000:6.2f} ms")
+
+    # Clock set ahead while awake: the panel's check must not catch up
+    from models.clock import set_clock
+    from ui.panels.timer_panel import TimerPanel
+
+    get_app()
+    clock = VirtualClock()
+    previous = set_clock(clock)  # Before the panel: its engine takes the clock
+    panel = TimerPanel()
+    rng = random.Random(CLOCK_CHANGE)
+    completed = []
+    panel.timers_completed.connect(lambda timers, missed: completed.extend(timers))
+    timers = []
+    for i in range(count):
+        timer = TimerInstance.create(f"고객 {i}", template.id, template.duration, i)
+        timer.remaining_seconds = rng.randint(1, CLOCK_CHANGE)
+        panel.engine.start(timer)
+        timers.append(timer)
+    panel._jump_detector.reset()
+    remaining = {timer.id: timer.remaining_seconds for timer in timers}
+
+    clock.jump(CLOCK_CHANGE)
+    panel._check_clock()
+    panel.engine.refresh_all()
+    assert not completed, f"clock change completed {len(completed):,} timers"
+    assert {timer.id: timer.remaining_seconds for timer in timers} == remaining, "clock change moved a countdown"
+    print(f"clock set {CLOCK_CHANGE / 60:3.0f} min ahead  {len(completed):6,} completed  "
+          f"{len(timers):6,} still running, unchanged")
+    panel.engine.clear()
+    set_clock(previous)
@@ -0,0 +1,120 @@
+"""
+Schedule benchmark: auto-start schedules of 10,000 timers.
+
+Stores 10,000 schedules (most repeating every 15-60 minutes, some once) in
+a temporary database and times, on a VirtualClock:
+    load        reading them and building the scheduler heap (app start)
+    catch-up    the single poll after the app was closed for 3 hours, and
+                saving its result in one transaction vs. one write per
+                schedule
+    shift       8 hours of scheduler wake-ups at due times only, compared
+                with the number of checks a once-per-second poll would make
+Checks that every schedule due during the downtime starts exactly once.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks schedules [schedules]
+"""
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from benchmarks.common import print_header
+
+DEFAULT_SCHEDULES = 10_000
+DOWNTIME = 3 * 3600  # Seconds the app was closed
+SHIFT = 8 * 3600
+SEED = 11
+
+
+def main(args):
+    """Time loading, catching up and running auto-start schedules."""
+    from models.clock import VirtualClock
+    from models.schedule import TimerSchedule
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.database import DatabaseService
+    from services.scheduler import StartScheduler
+
+    count = int(args[0]) if args else DEFAULT_SCHEDULES
+    rng = random.Random(SEED)
+    start = datetime(2026, 10, 19, 9, 0)
+    clock = VirtualClock(start)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = DatabaseService(Path(directory) / "bench.db")
+        template = TimerTemplate.create("상담", timedelta(minutes=10), 0)
+        db.create_template(template)
+        timers = [TimerInstance.create(f"고객 {i}", template.id, template.duration, i) for i in range(count)]
+        schedules = []
+        for timer in timers:
+            first = start + timedelta(minutes=rng.randint(0, 120))  # Set as HH:MM in the dialog
+            interval = timedelta(minutes=rng.choice((15, 30, 60))) if rng.random() < 0.8 else None
+            schedules.append(TimerSchedule.create(timer.id, first, interval, start + timedelta(hours=12)))
+        # Fixture rows in bulk (DatabaseService writes one row per transaction)
+        with sqlite3.connect(db.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO timers (id, customer_name, template_id, display_order, created_at, chain_template_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [tuple(timer.to_dict().values()) for timer in timers]
+            )
+            conn.executemany(
+                "INSERT INTO schedules (timer_id, next_at, interval_seconds, until_at) VALUES (?, ?, ?, ?)",
+                [tuple(schedule.to_dict().values()) for schedule in schedules]
+            )
+        reopened = start + timedelta(seconds=DOWNTIME)
+        expected = {schedule.timer_id for schedule in schedules if schedule.next_at <= reopened}
+
+        print_header(f"AUTO-START SCHEDULES ({count:,} schedules on a virtual clock)")
+
+        # App start after the downtime
+        clock.advance(DOWNTIME)
+        began = time.perf_counter()
+        scheduler = StartScheduler(clock)
+        scheduler.set_schedules(db.get_all_schedules())
+        load = time.perf_counter() - began
+        print(f"load        {load * 1000:8.1f} ms  ({len(scheduler):,} schedules)")
+
+        began = time.perf_counter()
+        due, finished = scheduler.poll()
+        poll = time.perf_counter() - began
+        assert {schedule.timer_id for schedule in due} == expected, "wrong schedules started"
+        assert len(due) == len({schedule.timer_id for schedule in due}), "a schedule started twice"
+        finished_ids = {schedule.timer_id for schedule in finished}
+        advanced = [schedule for schedule in due if schedule.timer_id not in finished_ids]
+
+        began = time.perf_counter()
+        db.update_schedules(advanced, finished)
+        batched = time.perf_counter() - began
+        began = time.perf_counter()
+        for schedule in advanced:
+            db.save_schedule(schedule)
+        for schedule in finished:
+            db.delete_schedule(str(schedule.timer_id))
+        per_row = time.perf_counter() - began
+        print(f"catch-up    {poll * 1000:8.1f} ms  ({len(due):,} starts after {DOWNTIME // 3600} h closed, "
+              f"{len(finished):,} finished)")
+        print(f"  save      {batched * 1000:8.1f} ms in one transaction, {per_row * 1000:8.1f} ms one write each")
+
+        # A shift, waking at due times only
+        wakeups = starts = 0
+        end = clock.monotonic() + SHIFT
+        began = time.perf_counter()
+        while True:
+            delay = scheduler.seconds_until_next()
+            if delay is None or clock.monotonic() + delay > end:
+                break
+            clock.advance(delay)
+            wakeups += 1
+            due, _ = scheduler.poll()
+            starts += len(due)
+        shift = time.perf_counter() - began
+        print(f"shift       {shift * 1000:8.1f} ms  ({starts:,} starts in {wakeups:,} wake-ups; "
+              f"a 1 s poll would check {SHIFT:,} times)")
@@ -0,0 +1,95 @@
+"""
+Startup timeline benchmark.
+
+Seeds a temporary database, then launches ``main.py --startup-report``
+several times with HOME pointed at it and prints the median time of each
+startup milestone (imports, fonts, window, first paint, database, data
+loaded), once without and once with the startup snapshot written on the
+previous exit. Compare runs before and after a change to catch regressions.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks startup [timers] [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from benchmarks.common import print_header
+
+DEFAULT_TIMERS = 200
+DEFAULT_RUNS = 5
+TEMPLATES = 20
+
+
+def _seed_database(home: Path, timer_count: int) -> Path:
+    """Create templates and timers in the database main.py will open."""
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.database import DatabaseService
+    from ui.panels.indexing import ORDER_GAP
+
+    data_dir = home / ('AppData/TimerForRyu' if os.name == 'nt' else '.timer_for_ryu')
+    data_dir.mkdir(parents=True, exist_ok=True)
+    db = DatabaseService(data_dir / 'timer_data.db')
+
+    templates = [
+        TimerTemplate.create(f"상담 {i}", timedelta(minutes=5 + i), i * ORDER_GAP)
+        for i in range(TEMPLATES)
+    ]
+    for template in templates:
+        db.create_template(template)
+    for i in range(timer_count):
+        template = templates[i % TEMPLATES]
+        db.create_timer(TimerInstance.create(f"고객 {i}", template.id, template.duration, i * ORDER_GAP))
+    return db.db_path
+
+
+def _run_startups(env: dict, runs: int, snapshot_path: Path, use_snapshot: bool) -> dict:
+    """Launch main.py runs times and collect milestone samples."""
+    main_script = Path(__file__).parent.parent / 'main.py'
+    samples = {}
+    for _ in range(runs):
+        if not use_snapshot:
+            snapshot_path.unlink(missing_ok=True)
+        result = subprocess.run(
+            [sys.executable, str(main_script), '--startup-report'],
+            env=env, capture_output=True, text=True, timeout=300
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        for name, elapsed in report.items():
+            samples.setdefault(name, []).append(elapsed)
+    return samples
+
+
+def _print_medians(title: str, samples: dict):
+    print_header(title)
+    for name, values in samples.items():
+        print(f"{name:<14} {statistics.median(values):8.1f} ms")
+
+
+def main(args):
+    """Run main.py repeatedly and report median startup milestones."""
+    timer_count = int(args[0]) if args else DEFAULT_TIMERS
+    runs = int(args[1]) if len(args) > 1 else DEFAULT_RUNS
+
+    from services.snapshot import get_snapshot_path
+
+    home = Path(tempfile.mkdtemp())
+    snapshot_path = get_snapshot_path(_seed_database(home, timer_count))
+    env = dict(os.environ, HOME=str(home), APPDATA=str(home / 'AppData'))
+
+    rows = f"{TEMPLATES} templates, {timer_count} timers, median of {runs} runs"
+    _print_medians(f"STARTUP WITHOUT SNAPSHOT ({rows})", _run_startups(env, runs, snapshot_path, False))
+    # Prime the snapshot (every run writes it on exit)
+    _run_startups(env, 1, snapshot_path, True)
+    _print_medians(f"STARTUP WITH SNAPSHOT ({rows})", _run_startups(env, runs, snapshot_path, True))
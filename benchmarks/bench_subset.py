@@ -0,0 +1,90 @@
+"""
+Font subset benchmark: full Pretendard vs "Pretendard UI" subset at startup.
+
+Registers the fonts and paints a timer row in a fresh process per mode
+(loose files and resource bundle) and reports font loading time, time to
+the first painted row and resident memory (VmRSS, Linux only). Run
+subset_fonts.py first; the bundle is compiled into a temporary file.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks subset [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from benchmarks.common import get_app, print_header, read_rss_kb
+
+DEFAULT_RUNS = 5
+
+
+def _load_and_paint(use_subset: bool, bundle_path: str) -> dict:
+    """Register fonts and paint one timer row in this process."""
+    from PySide6.QtCore import QResource
+    import ui.utils.assets as assets
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from ui.font_loader import load_fonts
+    from ui.widgets.timer_list_item import TimerListItem
+
+    assets._bundle_registered = QResource.registerResource(bundle_path) if bundle_path else False
+    app = get_app()
+    rss_before = read_rss_kb()
+
+    start = time.perf_counter()
+    load_fonts(use_subset=use_subset)
+    fonts_ms = (time.perf_counter() - start) * 1000
+
+    template = TimerTemplate.create("상담 30분", timedelta(minutes=30), 0)
+    item = TimerListItem(TimerInstance.create("김민수 고객", template.id, template.duration, 0), template)
+    item.resize(600, 90)
+    item.grab()
+    paint_ms = (time.perf_counter() - start) * 1000
+
+    app.processEvents()
+    return {'fonts ms': fonts_ms, 'row ms': paint_ms, 'rss kb': read_rss_kb() - rss_before}
+
+
+def _run_mode(use_subset: bool, bundle_path: str, runs: int) -> dict:
+    """Measure one mode in fresh processes and return medians."""
+    samples = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks', 'subset', '--child', str(int(use_subset)), bundle_path],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True, timeout=120
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        for name, value in report.items():
+            samples.setdefault(name, []).append(value)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def main(args):
+    """Compare full and subset font startup cost."""
+    if args and args[0] == '--child':
+        print(json.dumps(_load_and_paint(args[1] == '1', args[2])))
+        return
+
+    from build_resources import build_resources
+
+    runs = int(args[0]) if args else DEFAULT_RUNS
+    bundle_path = Path(tempfile.mkdtemp()) / "assets.rcc"
+    if not build_resources(bundle_path):
+        return 1
+
+    print_header(f"FONT STARTUP: FULL VS SUBSET (median of {runs} runs)")
+    for source, path in (("files", ""), ("bundle", str(bundle_path))):
+        for label, use_subset in (("full", False), ("subset", True)):
+            medians = _run_mode(use_subset, path, runs)
+            print(f"{source:<7} {label:<7} fonts {medians['fonts ms']:6.1f} ms  "
+                  f"first row {medians['row ms']:6.1f} ms  RSS +{medians['rss kb'] / 1024:5.1f} MiB")
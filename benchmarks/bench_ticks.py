@@ -0,0 +1,104 @@
+"""
+Idle wakeup benchmark: event loop wakeups per second with running timers.
+
+Runs 100 timers in a shown TimerPanel and counts, over a few seconds of
+the event loop, how often the event loop woke up (QAbstractEventDispatcher
+awake), the timer events delivered and the widgets painted. Compared:
+    per-row timers   one 1 s QTimer per row at its own phase (as before the
+                     shared ticker), redrawing its row
+    shared ticker    the panel's ticker on wall-clock second boundaries
+    minimized        shared ticker with the window minimized
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks ticks [timers] [seconds]
+"""
+import random
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header
+
+DEFAULT_TIMERS = 100
+DEFAULT_SECONDS = 5
+
+
+def main(args):
+    """Count wakeups per second with per-row timers and with the shared ticker."""
+    from PySide6.QtCore import QAbstractEventDispatcher, QEvent, QEventLoop, QObject, QTimer
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from ui.font_loader import load_fonts
+    from ui.panels.timer_panel import TimerPanel
+    from ui.utils.render_policy import RenderPolicy
+
+    count = int(args[0]) if len(args) > 0 else DEFAULT_TIMERS
+    seconds = float(args[1]) if len(args) > 1 else DEFAULT_SECONDS
+    app = get_app()
+    load_fonts()
+
+    class Counter(QObject):
+        wakeups = timer_events = paints = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Timer:
+                self.timer_events += 1
+            elif event.type() == QEvent.Type.Paint:
+                self.paints += 1
+            return False
+
+        def on_awake(self):
+            self.wakeups += 1
+
+    def measure(label: str):
+        counter = Counter()
+        app.installEventFilter(counter)
+        dispatcher = QAbstractEventDispatcher.instance()
+        dispatcher.awake.connect(counter.on_awake)
+        loop = QEventLoop()  # Not app.exec(): app.quit() would close the window
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+        dispatcher.awake.disconnect(counter.on_awake)
+        app.removeEventFilter(counter)
+        print(f"{label:<16} {counter.wakeups / seconds:7.1f} wakeups/s  "
+              f"{counter.timer_events / seconds:7.1f} timer events/s  {counter.paints / seconds:7.1f} paints/s")
+
+    template = TimerTemplate.create("상담", timedelta(hours=1), 0)
+    panel = TimerPanel()
+    panel.resize(500, 800)
+    policy = RenderPolicy(panel)  # As MainWindow does for its timer panel
+    policy.visibility_changed.connect(panel.set_rendering)
+    panel.show()
+    for i in range(count):
+        panel.add_timer_item(TimerInstance.create(f"고객 {i}", template.id, template.duration, i), template)
+    for item_widget in panel.timer_items:
+        item_widget._on_start()
+    app.processEvents()
+
+    print_header(f"IDLE WAKEUPS ({count} running timers, {seconds:g} s each)")
+
+    # Before: every row had its own 1 s timer, started whenever the row was started
+    panel._ticker.stop()
+    rng = random.Random(0)
+    row_timers = []
+    for item_widget in panel.timer_items:
+        def tick(item_widget=item_widget):
+            panel.engine.refresh(item_widget.timer)
+            item_widget.refresh()
+        row_timer = QTimer(panel)
+        row_timer.timeout.connect(tick)
+        QTimer.singleShot(rng.randint(0, 999), row_timer, lambda row_timer=row_timer: row_timer.start(1000))
+        row_timers.append(row_timer)
+    measure("per-row timers")
+    for row_timer in row_timers:
+        row_timer.stop()
+
+    panel._arm_ticker()
+    measure("shared ticker")
+
+    panel.showMinimized()
+    app.processEvents()
+    measure("minimized")
@@ -0,0 +1,77 @@
+"""
+Toast soak benchmark: a shift's worth of notifications through ToastManager.
+
+Shows messages in bursts (completions arriving together, coalesced under
+one key) and singles, with display and fade durations shortened so a
+shift runs in seconds. Samples toast widgets alive, resident memory
+(VmRSS, Linux only) and queue length after every block; a flat widget
+count and RSS means nothing leaks.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks toasts [messages]
+"""
+import time
+
+from benchmarks.common import get_app, print_header, read_rss_kb
+
+DEFAULT_MESSAGES = 5000  # Roughly a 10 hour shift at a busy desk
+BLOCKS = 10
+BURST = 5  # Completions per burst
+DISPLAY_MS = 5
+FADE_MS = 2
+GAP_MS = 3  # Pause between messages
+
+
+def main(args):
+    """Soak ToastManager and report widget count and memory."""
+    from PySide6.QtWidgets import QLabel, QWidget
+    from ui.utils.toast import ToastManager, ToastMessage, show_toast
+
+    messages = int(args[0]) if args else DEFAULT_MESSAGES
+    app = get_app()
+    ToastMessage.ANIMATION_DURATION = FADE_MS
+    window = QWidget()
+    window.resize(1000, 700)
+    window.show()
+
+    def pause(ms: int):
+        """Run the event loop for a while."""
+        until = time.perf_counter() + ms / 1000
+        while time.perf_counter() < until:
+            app.processEvents()
+
+    def settle():
+        """Run the event loop until every toast has faded out."""
+        manager = ToastManager.for_widget(window)
+        while manager.visible_count or manager.pending_count:
+            app.processEvents()
+            time.sleep(0.001)
+
+    print_header(f"TOAST SOAK ({messages:,} messages, bursts of {BURST})")
+    sent = 0
+    per_block = messages // BLOCKS
+    start = time.perf_counter()
+    for block in range(BLOCKS):
+        while sent < per_block * (block + 1):
+            # A burst of completions, then a single message, each followed by a short pause
+            for _ in range(BURST):
+                show_toast(window, f"'고객 {sent}' 타이머 완료", DISPLAY_MS,
+                           key="timer_completed", group_message="타이머 {count}개 완료")
+                sent += 1
+            pause(GAP_MS)
+            show_toast(window, f"저장되었습니다 ({sent})", DISPLAY_MS)
+            sent += 1
+            pause(GAP_MS)
+        settle()
+        manager = ToastManager.for_widget(window)
+        print(f"{sent:>7,} messages  toast widgets {len(window.findChildren(QLabel)):>2}  "
+              f"RSS {read_rss_kb() / 1024:6.1f} MiB  coalesced {manager.coalesced:,}  "
+              f"dropped {manager.dropped:,}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nWidgets created: {ToastManager.for_widget(window).created}, {elapsed:.1f} s total")
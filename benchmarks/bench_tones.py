@@ -0,0 +1,62 @@
+"""
+Alert tone benchmark: generate_alert_sound.py WAV files vs in-process synthesis.
+
+Renders one tone per template (distinct frequencies and patterns) three
+ways: the per-sample generate_alert_sound.py loop writing a WAV file that
+is then decoded, synthesize() straight into a sample array, and ToneCache
+lookups after the first render (what repeated completions hit).
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks tones [templates]
+"""
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import print_header, timed
+
+DEFAULT_TEMPLATES = 20
+LOOKUPS = 1000  # Cache lookups per template
+
+
+def main(args):
+    """Compare alert tone generation paths."""
+    from generate_alert_sound import generate_soft_beep
+    from models.enums import AlertPattern
+    from ui.utils.audio import MIX_RATE, decode_wav
+    from ui.utils.tones import Tone, ToneCache, synthesize
+
+    count = int(args[0]) if args else DEFAULT_TEMPLATES
+    patterns = list(AlertPattern)
+    tones = [Tone(500 + 50 * i, patterns[i % len(patterns)]) for i in range(count)]
+    wav_path = Path(tempfile.mkdtemp()) / "alert.wav"
+
+    print_header(f"ALERT TONES ({count} templates, {MIX_RATE} Hz)")
+
+    with timed("generate_alert_sound.py (write WAV + decode)", count):
+        for tone in tones:
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_soft_beep(str(wav_path), duration=0.3, frequency=tone.frequency)
+            decode_wav(wav_path.read_bytes(), MIX_RATE)
+
+    with timed("synthesize() in process", count):
+        for tone in tones:
+            synthesize(tone, MIX_RATE)
+
+    cache = ToneCache(max_size=count)
+    for tone in tones:
+        cache.get(tone, MIX_RATE)
+    with timed(f"ToneCache hits ({LOOKUPS} per template)", count * LOOKUPS):
+        for _ in range(LOOKUPS):
+            for tone in tones:
+                cache.get(tone, MIX_RATE)
+
+    rendered = sum(len(cache.get(tone, MIX_RATE)) * 2 for tone in tones)
+    print(f"Cache: {len(cache)} tones, {rendered / 1024:.0f} KiB PCM, "
+          f"{cache.hits:,} hits / {cache.misses} misses")
@@ -0,0 +1,138 @@
+"""
+Warning benchmark: pre-expiry warning stages of 10,000 timers.
+
+Runs 10,000 timers with three warning stages each (5 minutes, 2 minutes
+and 30 seconds before the end) on a VirtualClock until all of them have
+completed. Timers start at random times and some are paused and resumed
+on the way. The same seeded run is done twice:
+    tick checks        every simulated second, refresh every running timer
+                       and compare its remaining time with its stages (a
+                       threshold check per timer per tick)
+    engine deadlines   stages are TimerEngine deadlines; wake only at the
+                       next deadline or event and poll
+Both runs must deliver the same warnings; the engine's are checked to
+arrive exactly at their stage.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks warnings [timers]
+"""
+import heapq
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import print_header
+
+DEFAULT_TIMERS = 10_000
+STAGES = (300, 120, 30)  # Seconds before the end
+SEED = 7
+
+START, PAUSE, RESUME = range(3)
+
+
+def _simulate(count: int, ticks: bool) -> dict:
+    """Run one seeded round of timers; return counters and the warnings delivered."""
+    from models.clock import VirtualClock
+    from models.enums import TimerStatus
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.timer_engine import TimerEngine
+
+    rng = random.Random(SEED)
+    clock = VirtualClock(datetime(2026, 10, 19, 9, 0))
+    engine = TimerEngine(clock)
+    template = TimerTemplate.create("상담", timedelta(minutes=30), 0, warning_seconds=STAGES)
+    timers = []
+    for i in range(count):
+        timer = TimerInstance.create(f"고객 {i}", template.id, template.duration, i)
+        timer.remaining_seconds = rng.randint(10 * 60, 30 * 60)
+        timers.append(timer)
+
+    events = []  # (second, sequence, action, timer)
+    sequence = 0
+
+    def schedule(second: int, action: int, timer: TimerInstance):
+        nonlocal sequence
+        sequence += 1
+        heapq.heappush(events, (second, sequence, action, timer))
+
+    for timer in timers:
+        schedule(rng.randint(0, 600), START, timer)
+
+    next_stage = {timer.id: 0 for timer in timers}  # Tick checks: index of the next stage
+    warnings = []  # (second, timer index, stage)
+    stages = () if ticks else template.warning_seconds  # Tick checks arm no engine warnings
+    now = wakeups = completions = 0
+    start = time.perf_counter()
+    while True:
+        clock.advance(now - clock.monotonic())
+        wakeups += 1
+
+        completions += len(engine.poll())
+        if ticks:
+            for timer in engine.refresh_all():
+                index = next_stage[timer.id]
+                reached = None
+                while index < len(STAGES) and timer.remaining_seconds <= STAGES[index]:
+                    reached = STAGES[index]
+                    index += 1
+                if reached is not None:
+                    next_stage[timer.id] = index
+                    warnings.append((now, timer.display_order, reached))
+        else:
+            for timer, stage in engine.poll_warnings():
+                assert engine.refresh(timer) == stage, "warning not at its stage"
+                warnings.append((now, timer.display_order, stage))
+
+        while events and events[0][0] <= now:
+            _, _, action, timer = heapq.heappop(events)
+            if action == START:
+                engine.start(timer, stages)
+                if rng.random() < 0.3:
+                    schedule(now + rng.randint(1, timer.remaining_seconds - 1), PAUSE, timer)
+            elif action == PAUSE and timer.status == TimerStatus.RUNNING:
+                engine.pause(timer)
+                schedule(now + rng.randint(10, 120), RESUME, timer)
+            elif action == RESUME:
+                engine.start(timer, stages)
+
+        if completions == count:
+            break
+        if ticks:
+            now += 1
+        else:
+            next_deadline = engine.next_deadline()
+            candidates = [int(next_deadline)] if next_deadline is not None else []
+            if events:
+                candidates.append(events[0][0])
+            now = min(candidates)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'elapsed': elapsed,
+        'wakeups': wakeups,
+        'simulated': now,
+        'warnings': sorted(warnings),
+    }
+
+
+def main(args):
+    """Deliver warning stages with per-tick checks and as engine deadlines."""
+    count = int(args[0]) if args else DEFAULT_TIMERS
+
+    print_header(f"PRE-EXPIRY WARNINGS ({count:,} timers x {len(STAGES)} stages on a virtual clock)")
+    results = {}
+    for label, ticks in (("tick checks", True), ("engine deadlines", False)):
+        result = results[label] = _simulate(count, ticks)
+        print(f"{label:<17} {result['elapsed']:6.2f} s  {result['wakeups']:6,} wakeups  "
+              f"{len(result['warnings']):6,} warnings  "
+              f"({result['simulated'] / 60:.0f} simulated min)")
+
+    ticked, evented = results.values()
+    assert ticked['warnings'] == evented['warnings'], "runs delivered different warnings"
+    print("\nBoth runs deliver the same warnings; every engine warning arrived at its stage.")
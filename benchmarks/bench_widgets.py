@@ -0,0 +1,49 @@
+"""
+Row widget construction benchmark.
+
+Measures how long it takes to build and polish TimerItem / TemplateItem rows
+under the compiled application stylesheet.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    uv run python -m benchmarks widgets [row_count]
+"""
+from datetime import timedelta
+
+from benchmarks.common import get_app, print_header, timed
+
+
+def main(args):
+    """Build rows inside a visible host widget and report per-row cost."""
+    app = get_app()
+
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+    from models.template import TimerTemplate
+    from models.timer import TimerInstance
+    from services.timer_engine import TimerEngine
+    from ui.containers.template_item import TemplateItem
+    from ui.containers.timer_item import TimerItem
+
+    count = int(args[0]) if args else 300
+    template = TimerTemplate.create("상담", timedelta(minutes=5), 0)
+    engine = TimerEngine()
+
+    print_header(f"ROW WIDGET CONSTRUCTION ({count} rows)")
+
+    for label, factory in [
+        ("TimerItem", lambda i: TimerItem(
+            TimerInstance.create(f"고객 {i}", template.id, template.duration, i), template, engine)),
+        ("TemplateItem", lambda i: TemplateItem(template)),
+    ]:
+        host = QWidget()
+        layout = QVBoxLayout(host)
+        host.show()
+        with timed(f"{label} construct + polish", count):
+            for i in range(count):
+                layout.addWidget(factory(i))
+            app.processEvents()
+        host.close()
@@ -0,0 +1,67 @@
+"""
+Shared helpers for benchmarks.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+# Make project modules importable when run as `python -m benchmarks`
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def get_app():
+    """
+    Get (or create) the QApplication with the compiled theme stylesheet.
+
+    Returns:
+        QApplication: Application instance
+    """
+    from PySide6.QtWidgets import QApplication
+    from ui.theme import Theme
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv[:1])
+        app.setStyleSheet(Theme.Styles.application())
+    return app
+
+
+def read_rss_kb() -> int:
+    """Get this process's resident set size in KiB (0 if /proc is unavailable)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def print_header(title: str):
+    """Print a section header in the style of the measurement scripts."""
+    print("\n" + "=" * 80)
+    print(title)
+    print("=" * 80 + "\n")
+
+
+@contextmanager
+def timed(label: str, count: int = 1):
+    """
+    Time a block and print total and per-item milliseconds.
+
+    Args:
+        label: Description printed with the result
+        count: Number of items processed inside the block
+    """
+    start = time.perf_counter()
+    yield
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    per_item = f", {elapsed_ms / count:.3f} ms/item" if count > 1 else ""
+    print(f"{label}: {elapsed_ms:.1f} ms{per_item}")
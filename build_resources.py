@@ -0,0 +1,54 @@
+"""
+Compile fonts, icons and sounds into a single Qt resource bundle.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Packs the files listed in assets/assets.qrc into assets/assets.rcc, which
+the app memory-maps at startup (see ui/utils/assets.py) instead of opening
+and reading each asset from disk. Data is left uncompressed so Qt can serve
+it straight from the mapping. Re-run after changing anything in assets/.
+
+Usage:
+    uv run python build_resources.py
+"""
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+QRC_FILE = ASSETS_DIR / "assets.qrc"
+RCC_FILE = ASSETS_DIR / "assets.rcc"
+
+
+def build_resources(output: Path = RCC_FILE) -> bool:
+    """
+    Compile assets.qrc into a binary resource file.
+
+    Args:
+        output: Resource file to write (default: assets/assets.rcc)
+
+    Returns:
+        bool: True if the resource file was written
+    """
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        print("Error: pyside6-rcc not found (install PySide6 in this environment)")
+        return False
+
+    cmd = [rcc, "--binary", "--no-compress", str(QRC_FILE), "-o", str(output)]
+    result = subprocess.run(cmd)
+    if result.returncode != 0:
+        print("❌ Resource compilation failed!")
+        return False
+
+    print(f"✅ Resources compiled: {output} ({output.stat().st_size:,} bytes)")
+    return True
+
+
+if __name__ == "__main__":
+    success = build_resources()
+    sys.exit(0 if success else 1)
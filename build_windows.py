@@ -1,10 +1,10 @@
 """
 Windows executable build script for Timer For Ryu.
 
-Version: 1.0.0
+Version: 1.0.1
 Author: rowan@lionrocket.ai
 Created: 2025-10-20
-Last Modified: 2025-10-20
+Last Modified: 2026-10-19
 
 Usage:
     # Install PyInstaller first
@@ -31,6 +31,11 @@ def build_windows_exe():
         print("PyInstaller not found. Installing...")
         subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
 
+    # Pack fonts, icons and sounds into assets/assets.rcc (bundled by the spec)
+    from build_resources import build_resources
+    if not build_resources():
+        return False
+
     # Build using spec file
     spec_file = Path(__file__).parent / "timer_for_ryu_windows.spec"
 
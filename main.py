@@ -1,19 +1,23 @@
 """
 Timer For Ryu - Customer Service Timer Manager
 
-Version: 1.0.0
+Version: 1.0.5
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 
 Usage:
     uv run python main.py
+    uv run python main.py --startup-report   # Print startup timeline as JSON and exit
 """
+import time
+
+STARTUP_ORIGIN = time.perf_counter()  # Startup timeline origin, taken before Qt is imported
+
 import sys
 import traceback
 from PySide6.QtWidgets import QApplication, QMessageBox
-from ui.main_window import MainWindow
-from ui.font_loader import load_fonts
+from ui.utils.startup import StartupTimeline
 
 
 def exception_hook(exctype, value, tb):
@@ -35,6 +39,9 @@ def exception_hook(exctype, value, tb):
 
 def main():
     """Main application entry point."""
+    timeline = StartupTimeline(STARTUP_ORIGIN)
+    startup_report = "--startup-report" in sys.argv
+
     # Enable high DPI support (with compatibility check for older PySide6 versions)
     from PySide6.QtCore import Qt
     from PySide6.QtGui import QFont, QFontDatabase
@@ -55,6 +62,12 @@ def main():
     app.setApplicationName("Timer For Ryu")
     app.setOrganizationName("TimerForRyu")
 
+    # Window, panels and widgets (dialogs, QtSvg and QtMultimedia load on first use)
+    from ui.font_loader import load_fonts
+    from ui.main_window import MainWindow
+    from ui.theme import Theme
+    timeline.mark("imports")
+
     # Load custom fonts first
     loaded_fonts = load_fonts()
     print(f"\n[MAIN] Loaded custom fonts: {loaded_fonts}")
@@ -65,8 +78,10 @@ def main():
     print(f"[MAIN] Total system fonts available: {len(font_families)}")
 
     default_font = None
-    if "Pretendard" in font_families or "Pretendard" in loaded_fonts:
-        default_font = QFont("Pretendard", 11, QFont.Weight.Normal)
+    if "Pretendard" in font_families or "Pretendard" in loaded_fonts or Theme.Fonts.FAMILY in loaded_fonts:
+        # Subset family first; characters outside it come from the full font
+        default_font = QFont(Theme.Fonts.FAMILY, 11, QFont.Weight.Normal)
+        default_font.setFamilies([Theme.Fonts.FAMILY, Theme.Fonts.FAMILY_FULL])
         print("[MAIN] ✅ Using Pretendard font")
     else:
         # Platform-specific fallback fonts
@@ -86,16 +101,29 @@ def main():
         default_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
         app.setFont(default_font)
 
-    # Apply platform-specific style sheet for consistent rendering
-    platform_stylesheet = """
-        * {
-            font-family: "Pretendard", "Malgun Gothic", "Microsoft YaHei", "SF Pro Text", system-ui, sans-serif;
-        }
-    """
-    app.setStyleSheet(platform_stylesheet)
+    timeline.mark("fonts")
+
+    # Drop cached theme fonts/metrics when a screen's DPI changes
+    Theme.Fonts.install_dpi_hook(app)
+
+    # Apply the compiled application stylesheet (font stack + all widget rules) once
+    app.setStyleSheet(Theme.Styles.application())
 
     window = MainWindow()
+    timeline.mark("window")
+
+    def _on_data_loaded():
+        print(timeline.report())
+        if startup_report:
+            print(timeline.to_json())
+            app.quit()
+
+    # Show the window first; rows come from the startup snapshot, or stream
+    # in from the database after the first paint
+    window.initial_data_loaded.connect(_on_data_loaded)
+    app.aboutToQuit.connect(window.save_snapshot)
     window.show()
+    window.start_loading(timeline)
 
     sys.exit(app.exec())
 
@@ -2,15 +2,26 @@
 Data models for Timer For Ryu application.
 """
 from models.base import Serializable, get_current_time, parse_uuid
-from models.enums import TimerStatus
+from models.clock import Clock, ClockJump, ClockJumpDetector, SystemClock, VirtualClock, get_clock, set_clock
+from models.enums import AlertPattern, TimerStatus
+from models.schedule import TimerSchedule
 from models.template import TimerTemplate
 from models.timer import TimerInstance
 
 __all__ = [
+    'AlertPattern',
+    'Clock',
+    'ClockJump',
+    'ClockJumpDetector',
     'Serializable',
+    'SystemClock',
     'TimerStatus',
     'TimerTemplate',
     'TimerInstance',
+    'TimerSchedule',
+    'VirtualClock',
+    'get_clock',
     'get_current_time',
-    'parse_uuid'
+    'parse_uuid',
+    'set_clock'
 ]
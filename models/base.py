@@ -1,20 +1,31 @@
 """
 Base models and utilities for Timer For Ryu application.
 
-Version: 1.0.0
+Version: 1.0.3
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict
 from uuid import UUID
 
+from models.clock import get_clock
+
+EPOCH = datetime(1970, 1, 1)  # Naive, like the stored timestamps
+_MICROSECOND = timedelta(microseconds=1)
+ORDER_GAP = 1024  # display_order spacing left between rows after a rebalance
+
+# One shared UUID object per template id (timers refer to it instead of a copy)
+_interned_uuids: Dict[str | UUID, UUID] = {}
+
 
 class Serializable(ABC):
     """Base class for models that can be serialized to/from dictionaries."""
 
+    __slots__ = ()  # Lets slotted subclasses drop the per-instance __dict__
+
     @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary for database storage."""
@@ -28,10 +39,31 @@ class Serializable(ABC):
 
 
 def get_current_time() -> datetime:
-    """Get current datetime. Centralized for easier testing and consistency."""
-    return datetime.now()
+    """Get current datetime from the application clock (see models.clock)."""
+    return get_clock().now()
 
 
 def parse_uuid(value: str | UUID) -> UUID:
     """Parse UUID from string or UUID object."""
-    return value if isinstance(value, UUID) else UUID(value)
\ No newline at end of file
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def intern_uuid(value: str | UUID) -> UUID:
+    """Parse UUID and return the shared instance for its value (template ids)."""
+    uuid = _interned_uuids.get(value)
+    if uuid is None:
+        uuid = parse_uuid(value)
+        uuid = _interned_uuids.setdefault(uuid, uuid)
+        if isinstance(value, str):
+            _interned_uuids[value] = uuid  # Database rows repeat the same id strings
+    return uuid
+
+
+def to_micros(value: datetime) -> int:
+    """Convert naive datetime to microseconds since EPOCH (exact)."""
+    return (value - EPOCH) // _MICROSECOND
+
+
+def from_micros(value: int) -> datetime:
+    """Convert microseconds since EPOCH back to naive datetime."""
+    return EPOCH + timedelta(microseconds=value)
\ No newline at end of file
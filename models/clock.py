@@ -0,0 +1,230 @@
+"""
+Clock used by the models, database timestamps and timer engine.
+
+Version: 1.0.2
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+A clock has three readings: monotonic() for measuring durations (countdown
+deadlines; never goes back, unaffected by clock changes), now() for
+wall-clock timestamps (created_at/updated_at, local and naive like the
+stored ones) and suspended(), the seconds the system has spent asleep. The
+application uses SystemClock; a VirtualClock only moves when advanced, so a
+whole shift can be simulated in a loop and tests see exact, repeatable
+times.
+
+On Linux and macOS the monotonic clock stops while the machine sleeps, and
+suspended() is the difference between a clock that counts sleep and one
+that does not (CLOCK_BOOTTIME - CLOCK_MONOTONIC, CLOCK_MONOTONIC -
+CLOCK_UPTIME_RAW). Elsewhere (Windows) the monotonic clock runs through
+sleep, deadlines stay right by themselves and suspended() stays 0.
+ClockJumpDetector reports both kinds of gap between two checks: sleep,
+which running timers must catch up on, and wall-clock changes (NTP, DST,
+the user), measured on UTC epoch time, which countdowns ignore.
+
+Usage:
+    from models.clock import ClockJumpDetector, VirtualClock, get_clock, set_clock
+
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    ...
+    clock.advance(60)           # One minute passes
+    clock.sleep(3600)           # An hour of sleep: the monotonic clock stands still
+    clock.jump(3600)            # Wall clock set an hour ahead
+    set_clock(previous)
+
+    detector = ClockJumpDetector()
+    jump = detector.check()     # ClockJump(slept, changed) since the last check
+"""
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+JUMP_THRESHOLD = 2.0  # Seconds; normal drift between checks is far below this
+
+# (counts sleep, stops during sleep) clock ids; None where time.monotonic() counts sleep
+if hasattr(time, 'CLOCK_BOOTTIME'):  # Linux
+    _SUSPEND_CLOCKS = (time.CLOCK_BOOTTIME, time.CLOCK_MONOTONIC)
+elif hasattr(time, 'CLOCK_UPTIME_RAW'):  # macOS
+    _SUSPEND_CLOCKS = (time.CLOCK_MONOTONIC, time.CLOCK_UPTIME_RAW)
+else:
+    _SUSPEND_CLOCKS = None
+
+
+class Clock:
+    """Monotonic and wall-clock time source."""
+
+    __slots__ = ()
+
+    def monotonic(self) -> float:
+        """Seconds on a clock that never goes back (arbitrary origin)."""
+        raise NotImplementedError
+
+    def now(self) -> datetime:
+        """Current local wall-clock time (naive, like the stored timestamps)."""
+        raise NotImplementedError
+
+    def timestamp(self) -> float:
+        """Wall-clock seconds since the UTC epoch (unaffected by DST)."""
+        raise NotImplementedError
+
+    def suspended(self) -> float:
+        """Seconds asleep that monotonic() did not count (arbitrary origin)."""
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """The operating system clocks."""
+
+    __slots__ = ()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def timestamp(self) -> float:
+        return time.time()
+
+    def suspended(self) -> float:
+        if _SUSPEND_CLOCKS is None:
+            return 0.0
+        with_sleep, without_sleep = _SUSPEND_CLOCKS
+        return time.clock_gettime(with_sleep) - time.clock_gettime(without_sleep)
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when advanced (simulation and tests)."""
+
+    __slots__ = ('_monotonic', '_wall', '_suspended')
+
+    def __init__(self, start: Optional[datetime] = None):
+        """
+        Initialize virtual clock.
+
+        Args:
+            start: Wall-clock time to start at (default: the current time)
+        """
+        self._monotonic = 0.0
+        self._wall = datetime.now() if start is None else start
+        self._suspended = 0.0
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def now(self) -> datetime:
+        return self._wall
+
+    def timestamp(self) -> float:
+        return (self._wall - datetime(1970, 1, 1)).total_seconds()  # No time zone: no DST
+
+    def suspended(self) -> float:
+        return self._suspended
+
+    def advance(self, seconds: float):
+        """
+        Let time pass: both readings move forward.
+
+        Args:
+            seconds: Seconds to advance (>= 0)
+        """
+        if seconds < 0:
+            raise ValueError("A clock cannot advance by a negative time")
+        self._monotonic += seconds
+        self._wall += timedelta(seconds=seconds)
+
+    def sleep(self, seconds: float):
+        """
+        Let the system sleep: the wall clock moves on, the monotonic clock stands still.
+
+        Args:
+            seconds: Seconds asleep (>= 0)
+        """
+        if seconds < 0:
+            raise ValueError("A clock cannot sleep for a negative time")
+        self._suspended += seconds
+        self._wall += timedelta(seconds=seconds)
+
+    def jump(self, seconds: float):
+        """
+        Move the wall clock only, like a clock change (NTP, user).
+
+        Args:
+            seconds: Seconds to move the wall clock (negative: back)
+        """
+        self._wall += timedelta(seconds=seconds)
+
+
+class ClockJump(NamedTuple):
+    """Clock gaps found by ClockJumpDetector.check() (0.0 below the threshold)."""
+    slept: float  # Seconds the system slept (running timers must catch up)
+    changed: float  # Seconds the wall clock was set ahead (negative: back) besides the sleep
+
+
+class ClockJumpDetector:
+    """Detect system sleep and wall-clock changes between periodic checks."""
+
+    __slots__ = ('_clock', '_threshold', '_monotonic', '_wall', '_suspended')
+
+    def __init__(self, clock: Optional[Clock] = None, threshold: float = JUMP_THRESHOLD):
+        """
+        Initialize clock jump detector.
+
+        Args:
+            clock: Clock to watch (default: the application clock)
+            threshold: Smallest difference in seconds reported as a jump
+        """
+        self._clock = clock if clock is not None else get_clock()
+        self._threshold = threshold
+        self.reset()
+
+    def reset(self):
+        """Take the current readings as the reference for the next check."""
+        self._monotonic = self._clock.monotonic()
+        self._wall = self._clock.timestamp()
+        self._suspended = self._clock.suspended()
+
+    def check(self) -> ClockJump:
+        """
+        Compare the readings with the last check and take them as the new reference.
+
+        Returns:
+            ClockJump: Seconds slept, and seconds the wall clock moved beyond
+                the monotonic clock and the sleep (a clock change)
+        """
+        monotonic, wall, suspended = self._clock.monotonic(), self._clock.timestamp(), self._clock.suspended()
+        slept = suspended - self._suspended
+        changed = (wall - self._wall) - (monotonic - self._monotonic) - slept
+        self._monotonic, self._wall, self._suspended = monotonic, wall, suspended
+        return ClockJump(
+            slept=slept if slept >= self._threshold else 0.0,
+            changed=changed if abs(changed) >= self._threshold else 0.0
+        )
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """Get the application clock."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replace the application clock.
+
+    Objects that took the clock when created (e.g. a TimerEngine) keep it,
+    so set the clock before creating them.
+
+    Args:
+        clock: New clock
+
+    Returns:
+        Clock: Previous clock (to restore)
+    """
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
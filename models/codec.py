@@ -0,0 +1,232 @@
+"""
+Binary codec for TimerTemplate and TimerInstance lists.
+
+Version: 1.0.3
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+A compact alternative to to_dict()/from_dict() for snapshots, IPC and
+journaling: fixed-layout little-endian records (struct) in blocks of one
+model type, with the variable-length text of all records in one UTF-8
+string after them. Records are unpacked with struct.iter_unpack and the
+text is decoded once per block, so no per-object dicts, ISO strings or
+str(uuid) are built. Unlike to_dict(), timers keep their runtime fields
+(remaining seconds, status).
+
+Block layout (little endian):
+    header   magic "TFRC", version u16, kind u8 (1 template, 2 timer),
+             reserved u8, record count u32, text length u32 (bytes)
+    records  template: id 16s, duration s i32, display_order i64,
+                       created/updated us i64 x2, alert frequency i32,
+                       alert pattern u8, warning seconds i32 x3 (0: unused),
+                       next template id 16s (zero bytes: none),
+                       name length u16 (characters)
+             timer:    id 16s, template id 16s, remaining s i32, status u8,
+                       display_order i64, created us i64,
+                       chain template id 16s (zero bytes: none),
+                       customer name length u16 (characters)
+    text     names of all records, concatenated, UTF-8
+
+Usage:
+    from models.codec import decode_templates, encode_templates
+
+    data = encode_templates(templates)
+    templates, end = decode_templates(data)   # end: offset after the block
+"""
+import struct
+from typing import List, Tuple
+from uuid import UUID
+
+from models.enums import AlertPattern, TimerStatus
+from models.template import MAX_WARNING_STAGES, TimerTemplate
+from models.timer import TimerInstance
+
+MAGIC = b'TFRC'
+VERSION = 4  # 2: template warning stages, 3: template chains, 4: timer chain start
+
+KIND_TEMPLATE = 1
+KIND_TIMER = 2
+
+MAX_TEXT_LENGTH = 0xFFFF  # Characters per name (u16 length)
+
+_HEADER = struct.Struct('<4sHBBII')
+_TEMPLATE = struct.Struct('<16siqqqiB' + 'i' * MAX_WARNING_STAGES + '16sH')
+_NO_WARNINGS = (0,) * MAX_WARNING_STAGES
+_NO_TEMPLATE = bytes(16)
+_TIMER = struct.Struct('<16s16siBqq16sH')
+
+# Enums are stored as their index
+_PATTERNS = list(AlertPattern)
+_PATTERN_INDEX = {pattern: index for index, pattern in enumerate(_PATTERNS)}
+_STATUSES = list(TimerStatus)
+_STATUS_INDEX = {status: index for index, status in enumerate(_STATUSES)}
+
+
+def _text_length(text: str) -> int:
+    if len(text) > MAX_TEXT_LENGTH:
+        raise ValueError(f"Text longer than {MAX_TEXT_LENGTH} characters")
+    return len(text)
+
+
+def _encode_block(kind: int, records: List[bytes], texts: List[str]) -> bytes:
+    text = ''.join(texts).encode('utf-8')
+    header = _HEADER.pack(MAGIC, VERSION, kind, 0, len(records), len(text))
+    return b''.join((header, *records, text))
+
+
+def _read_block(data: bytes, offset: int, kind: int, record: struct.Struct) -> Tuple[memoryview, str, int]:
+    """Validate a block header; return (records view, decoded text, end offset)."""
+    try:
+        magic, version, block_kind, _, count, text_length = _HEADER.unpack_from(data, offset)
+    except struct.error as e:
+        raise ValueError(f"Malformed codec block: {e}") from e
+    if magic != MAGIC or version != VERSION or block_kind != kind:
+        raise ValueError(f"Unsupported codec block (magic {magic!r}, version {version}, kind {block_kind})")
+
+    records_start = offset + _HEADER.size
+    text_start = records_start + count * record.size
+    end = text_start + text_length
+    if end > len(data):
+        raise ValueError("Malformed codec block: truncated")
+    view = memoryview(data)
+    try:
+        text = str(view[text_start:end], 'utf-8')
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Malformed codec block: {e}") from e
+    return view[records_start:text_start], text, end
+
+
+def encode_templates(templates: List[TimerTemplate]) -> bytes:
+    """
+    Encode templates as one block.
+
+    Args:
+        templates: Templates to encode
+
+    Returns:
+        bytes: Block
+
+    Raises:
+        ValueError: If a name is longer than MAX_TEXT_LENGTH
+    """
+    pack = _TEMPLATE.pack
+    records = [
+        pack(
+            template.id.bytes,
+            template.duration_seconds,
+            template.display_order,
+            template.created_micros,
+            template.updated_micros,
+            template.alert_frequency,
+            _PATTERN_INDEX[template.alert_pattern],
+            *(template.warning_seconds + _NO_WARNINGS)[:MAX_WARNING_STAGES],
+            template.next_template_id.bytes if template.next_template_id else _NO_TEMPLATE,
+            _text_length(template.name)
+        )
+        for template in templates
+    ]
+    return _encode_block(KIND_TEMPLATE, records, [template.name for template in templates])
+
+
+def decode_templates(data: bytes, offset: int = 0) -> Tuple[List[TimerTemplate], int]:
+    """
+    Decode a template block.
+
+    Args:
+        data: Buffer holding the block
+        offset: Start of the block in data
+
+    Returns:
+        tuple: (templates, offset after the block)
+
+    Raises:
+        ValueError: If the block is malformed or of another version/kind
+    """
+    records, text, end = _read_block(data, offset, KIND_TEMPLATE, _TEMPLATE)
+    templates = []
+    position = 0
+    try:
+        for id_bytes, duration, display_order, created, updated, frequency, pattern, *warnings, next_bytes, length in (
+            _TEMPLATE.iter_unpack(records)
+        ):
+            templates.append(TimerTemplate(
+                UUID(bytes=id_bytes), text[position:position + length], duration, display_order,
+                created, updated, frequency, _PATTERNS[pattern],
+                tuple(stage for stage in warnings if stage),
+                UUID(bytes=next_bytes) if next_bytes != _NO_TEMPLATE else None
+            ))
+            position += length
+    except IndexError as e:
+        raise ValueError(f"Malformed codec block: {e}") from e
+    if position != len(text):
+        raise ValueError("Malformed codec block: text length mismatch")
+    return templates, end
+
+
+def encode_timers(timers: List[TimerInstance]) -> bytes:
+    """
+    Encode timers (including remaining time and status) as one block.
+
+    Args:
+        timers: Timers to encode
+
+    Returns:
+        bytes: Block
+
+    Raises:
+        ValueError: If a customer name is longer than MAX_TEXT_LENGTH
+    """
+    pack = _TIMER.pack
+    records = [
+        pack(
+            timer.id.bytes,
+            timer.template_id.bytes,
+            timer.remaining_seconds,
+            _STATUS_INDEX[timer.status],
+            timer.display_order,
+            timer.created_micros,
+            timer.chain_template_id.bytes if timer.chain_template_id else _NO_TEMPLATE,
+            _text_length(timer.customer_name)
+        )
+        for timer in timers
+    ]
+    return _encode_block(KIND_TIMER, records, [timer.customer_name for timer in timers])
+
+
+def decode_timers(data: bytes, offset: int = 0) -> Tuple[List[TimerInstance], int]:
+    """
+    Decode a timer block.
+
+    Args:
+        data: Buffer holding the block
+        offset: Start of the block in data
+
+    Returns:
+        tuple: (timers, offset after the block)
+
+    Raises:
+        ValueError: If the block is malformed or of another version/kind
+    """
+    records, text, end = _read_block(data, offset, KIND_TIMER, _TIMER)
+    timers = []
+    template_ids = {}  # Timers share a few template ids; build each UUID once
+    position = 0
+    try:
+        for id_bytes, template_id_bytes, remaining, status, display_order, created, chain_bytes, length in (
+            _TIMER.iter_unpack(records)
+        ):
+            template_id = template_ids.get(template_id_bytes)
+            if template_id is None:
+                template_id = template_ids[template_id_bytes] = UUID(bytes=template_id_bytes)
+            timers.append(TimerInstance(
+                UUID(bytes=id_bytes), text[position:position + length], template_id,
+                remaining, _STATUSES[status], display_order, created,
+                UUID(bytes=chain_bytes) if chain_bytes != _NO_TEMPLATE else None
+            ))
+            position += length
+    except IndexError as e:
+        raise ValueError(f"Malformed codec block: {e}") from e
+    if position != len(text):
+        raise ValueError("Malformed codec block: text length mismatch")
+    return timers, end
@@ -1,10 +1,10 @@
 """
 Enums for Timer For Ryu application.
 
-Version: 1.0.0
+Version: 1.0.1
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from enum import Enum
 
@@ -14,3 +14,10 @@ class TimerStatus(Enum):
     STOPPED = "stopped"
     RUNNING = "running"
     PAUSED = "paused"
+
+
+class AlertPattern(Enum):
+    """Tone pulses per alert beep."""
+    SINGLE = "single"
+    DOUBLE = "double"
+    TRIPLE = "triple"
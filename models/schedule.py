@@ -0,0 +1,128 @@
+"""
+Timer auto-start schedule data model.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+A schedule starts one timer at a wall-clock time (next_at), once or every
+interval_seconds, optionally only until a wall-clock time (until_at; e.g.
+every 30 minutes until the end of the shift). Slotted dataclass like the
+other models: times kept as integer microseconds since EPOCH, 0 for no end.
+
+advance() moves next_at past a given time in one step, however many
+occurrences were missed (sleep, app not running): a missed run of starts
+becomes a single start.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from models.base import Serializable, from_micros, parse_uuid, to_micros
+
+_MICROS_PER_SECOND = 1_000_000
+
+
+@dataclass(slots=True)
+class TimerSchedule(Serializable):
+    """Scheduled (optionally recurring) automatic start of a timer."""
+    timer_id: UUID  # One schedule per timer
+    next_micros: int  # Next start, microseconds since EPOCH (wall clock)
+    interval_seconds: int = 0  # Seconds between starts (0: start once)
+    until_micros: int = 0  # No starts after this time (0: no end)
+
+    def __post_init__(self):
+        self.timer_id = parse_uuid(self.timer_id)
+        if self.interval_seconds < 0:
+            raise ValueError("Schedule interval cannot be negative")
+
+    @property
+    def next_at(self) -> datetime:
+        """Next start time."""
+        return from_micros(self.next_micros)
+
+    @next_at.setter
+    def next_at(self, value: datetime):
+        self.next_micros = to_micros(value)
+
+    @property
+    def until_at(self) -> Optional[datetime]:
+        """Time after which the schedule ends (None: no end)."""
+        return from_micros(self.until_micros) if self.until_micros else None
+
+    @property
+    def is_recurring(self) -> bool:
+        """Check whether the timer starts more than once."""
+        return self.interval_seconds > 0
+
+    def advance(self, now_micros: int) -> bool:
+        """
+        Move next_at to the first occurrence after now, skipping missed ones.
+
+        Args:
+            now_micros: Current wall-clock time, microseconds since EPOCH
+
+        Returns:
+            bool: True if there is a next occurrence (False: schedule finished)
+        """
+        if not self.is_recurring:
+            return False
+        interval = self.interval_seconds * _MICROS_PER_SECOND
+        if self.next_micros <= now_micros:
+            self.next_micros += ((now_micros - self.next_micros) // interval + 1) * interval
+        return not self.until_micros or self.next_micros <= self.until_micros
+
+    @classmethod
+    def create(
+        cls,
+        timer_id: UUID,
+        start_at: datetime,
+        interval: Optional[timedelta] = None,
+        until: Optional[datetime] = None
+    ) -> 'TimerSchedule':
+        """
+        Create a new schedule.
+
+        Args:
+            timer_id: Timer to start
+            start_at: First start (wall clock)
+            interval: Time between starts (None: start once)
+            until: No starts after this time (None: no end)
+
+        Returns:
+            TimerSchedule: New schedule
+
+        Raises:
+            ValueError: If the interval is negative or the end is before the first start
+        """
+        if until is not None and until < start_at:
+            raise ValueError("Schedule ends before its first start")
+        return cls(
+            timer_id=timer_id,
+            next_micros=to_micros(start_at),
+            interval_seconds=int(interval.total_seconds()) if interval else 0,
+            until_micros=to_micros(until) if until is not None else 0
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert schedule to dictionary for database storage."""
+        until_at = self.until_at
+        return {
+            'timer_id': str(self.timer_id),
+            'next_at': self.next_at.isoformat(),
+            'interval_seconds': self.interval_seconds,
+            'until_at': until_at.isoformat() if until_at else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TimerSchedule':
+        """Create schedule from dictionary loaded from database."""
+        return cls(
+            timer_id=data['timer_id'],
+            next_micros=to_micros(datetime.fromisoformat(data['next_at'])),
+            interval_seconds=data['interval_seconds'],
+            until_micros=to_micros(datetime.fromisoformat(data['until_at'])) if data.get('until_at') else 0
+        )
+
@@ -1,31 +1,161 @@
 """
 Timer template data model.
 
-Version: 1.0.1
+Version: 1.0.5
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+Slotted dataclass: no per-instance __dict__, duration kept as integer
+seconds and timestamps as integer microseconds since EPOCH. The duration,
+created_at and updated_at properties convert on access. Ids are interned,
+so every timer of a template shares the template's UUID object.
+
+Pre-expiry warnings are stored as warning_seconds: up to MAX_WARNING_STAGES
+distinct times before the end (e.g. (120, 30): 2 minutes and 30 seconds
+left), largest first. The database keeps them as text ("120,30").
+
+Templates can be chained into a pipeline (greeting 2m -> diagnosis 10m ->
+wrap-up 3m): next_template_id names the stage a timer continues with when
+this one runs out (None: the timer completes). Chains must not loop, see
+chain_loops().
 """
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple
 from uuid import UUID, uuid4
 
-from models.base import Serializable, get_current_time, parse_uuid
+from models.base import Serializable, from_micros, get_current_time, intern_uuid, to_micros
+from models.enums import AlertPattern
+
+DEFAULT_ALERT_FREQUENCY = 800  # Hz (same tone as the original alert.wav)
+MAX_WARNING_STAGES = 3  # Pre-expiry warnings per template
+
+
+def normalize_warnings(seconds: Iterable[int]) -> Tuple[int, ...]:
+    """
+    Validate warning stages and order them largest first.
+
+    Args:
+        seconds: Seconds before the end at which to warn
+
+    Returns:
+        tuple: Distinct stages, largest first
+
+    Raises:
+        ValueError: If a stage is not positive or there are too many
+    """
+    stages = tuple(sorted({int(stage) for stage in seconds}, reverse=True))
+    if stages and stages[-1] <= 0:
+        raise ValueError("Warning times must be positive")
+    if len(stages) > MAX_WARNING_STAGES:
+        raise ValueError(f"At most {MAX_WARNING_STAGES} warnings per template")
+    return stages
+
+
+def format_warnings(stages: Tuple[int, ...]) -> str:
+    """Warning stages as stored in the database ("120,30")."""
+    return ','.join(str(stage) for stage in stages)
+
+
+def parse_warnings(text: str) -> Tuple[int, ...]:
+    """
+    Parse warning stages stored by format_warnings().
+
+    Args:
+        text: Comma-separated seconds ("" for none)
 
+    Returns:
+        tuple: Stages, largest first
 
-@dataclass
+    Raises:
+        ValueError: If the text is malformed
+    """
+    return normalize_warnings(int(part) for part in text.split(',') if part.strip())
+
+
+def chain_loops(template_id: UUID, next_template_id: Optional[UUID], templates: Mapping[UUID, 'TimerTemplate']) -> bool:
+    """
+    Check whether linking a template to a next stage would make its chain loop.
+
+    Args:
+        template_id: Template to link
+        next_template_id: Proposed next stage (None: end of chain)
+        templates: Existing templates by id
+
+    Returns:
+        bool: True if following the chain from next_template_id comes back
+            to template_id (or into another loop)
+    """
+    seen = set()
+    current = next_template_id
+    while current is not None and current not in seen:
+        if current == template_id:
+            return True
+        seen.add(current)
+        template = templates.get(current)
+        current = template.next_template_id if template is not None else None
+    return current is not None
+
+
+@dataclass(slots=True)
 class TimerTemplate(Serializable):
     """Timer template model for storing template configurations."""
     id: UUID
     name: str
-    duration: timedelta  # Format: MM:SS (minutes: 00-99, seconds: 00-59)
+    duration_seconds: int  # Format: MM:SS (minutes: 00-99, seconds: 00-59)
     display_order: int
-    created_at: datetime
-    updated_at: datetime
+    created_micros: int  # Microseconds since EPOCH
+    updated_micros: int
+    alert_frequency: int = DEFAULT_ALERT_FREQUENCY  # Completion tone pitch in Hz
+    alert_pattern: AlertPattern = AlertPattern.SINGLE  # Tone pulses per beep
+    warning_seconds: Tuple[int, ...] = ()  # Pre-expiry warnings, seconds before the end, largest first
+    next_template_id: Optional[UUID] = None  # Chain: stage started when this one runs out
+
+    def __post_init__(self):
+        self.id = intern_uuid(self.id)
+        self.warning_seconds = normalize_warnings(self.warning_seconds)
+        if self.next_template_id is not None:
+            self.next_template_id = intern_uuid(self.next_template_id)
+
+    @property
+    def duration(self) -> timedelta:
+        """Timer duration."""
+        return timedelta(seconds=self.duration_seconds)
+
+    @duration.setter
+    def duration(self, value: timedelta):
+        self.duration_seconds = int(value.total_seconds())
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time."""
+        return from_micros(self.created_micros)
+
+    @created_at.setter
+    def created_at(self, value: datetime):
+        self.created_micros = to_micros(value)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Last modification time."""
+        return from_micros(self.updated_micros)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self.updated_micros = to_micros(value)
 
     @classmethod
-    def create(cls, name: str, duration: timedelta, display_order: int) -> 'TimerTemplate':
+    def create(
+        cls,
+        name: str,
+        duration: timedelta,
+        display_order: int,
+        alert_frequency: int = DEFAULT_ALERT_FREQUENCY,
+        alert_pattern: AlertPattern = AlertPattern.SINGLE,
+        warning_seconds: Iterable[int] = (),
+        next_template_id: Optional[UUID] = None
+    ) -> 'TimerTemplate':
         """
         Create a new timer template.
 
@@ -33,18 +163,29 @@ class TimerTemplate(Serializable):
             name: Template name
             duration: Timer duration (timedelta)
             display_order: Display order in list
+            alert_frequency: Completion tone pitch in Hz
+            alert_pattern: Tone pulses per beep
+            warning_seconds: Seconds before the end at which to warn
+            next_template_id: Chain stage to continue with (None: complete)
 
         Returns:
             TimerTemplate: New template instance
+
+        Raises:
+            ValueError: If the warning stages are invalid
         """
-        now = get_current_time()
+        now = to_micros(get_current_time())
         return cls(
             id=uuid4(),
             name=name,
-            duration=duration,
+            duration_seconds=int(duration.total_seconds()),
             display_order=display_order,
-            created_at=now,
-            updated_at=now
+            created_micros=now,
+            updated_micros=now,
+            alert_frequency=alert_frequency,
+            alert_pattern=alert_pattern,
+            warning_seconds=tuple(warning_seconds),
+            next_template_id=next_template_id
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -52,20 +193,28 @@ class TimerTemplate(Serializable):
         return {
             'id': str(self.id),
             'name': self.name,
-            'duration_seconds': int(self.duration.total_seconds()),
+            'duration_seconds': self.duration_seconds,
             'display_order': self.display_order,
             'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'updated_at': self.updated_at.isoformat(),
+            'alert_frequency': self.alert_frequency,
+            'alert_pattern': self.alert_pattern.value,
+            'warning_seconds': format_warnings(self.warning_seconds),
+            'next_template_id': str(self.next_template_id) if self.next_template_id else None
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TimerTemplate':
         """Create template from dictionary."""
         return cls(
-            id=parse_uuid(data['id']),
+            id=data['id'],
             name=data['name'],
-            duration=timedelta(seconds=data['duration_seconds']),
+            duration_seconds=data['duration_seconds'],
             display_order=data['display_order'],
-            created_at=datetime.fromisoformat(data['created_at']),
-            updated_at=datetime.fromisoformat(data['updated_at'])
+            created_micros=to_micros(datetime.fromisoformat(data['created_at'])),
+            updated_micros=to_micros(datetime.fromisoformat(data['updated_at'])),
+            alert_frequency=data.get('alert_frequency', DEFAULT_ALERT_FREQUENCY),
+            alert_pattern=AlertPattern(data.get('alert_pattern', AlertPattern.SINGLE.value)),
+            warning_seconds=parse_warnings(data.get('warning_seconds') or ''),
+            next_template_id=data.get('next_template_id') or None
         )
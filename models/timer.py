@@ -1,30 +1,63 @@
 """
 Timer instance data model.
 
-Version: 1.0.1
+Version: 1.0.3
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+Slotted dataclass like TimerTemplate: remaining time kept as integer
+seconds and created_at as integer microseconds since EPOCH, exposed through
+the remaining_time and created_at properties. template_id is interned.
+
+template_id is the template the timer currently runs. While a timer runs a
+later stage of a template chain, chain_template_id keeps the chain's first
+template, so completing the last stage or stopping the timer can return it
+there (None: not past the first stage of a chain).
 """
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from uuid import UUID, uuid4
 
-from models.base import Serializable, get_current_time, parse_uuid
+from models.base import Serializable, from_micros, get_current_time, intern_uuid, parse_uuid, to_micros
 from models.enums import TimerStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerInstance(Serializable):
     """Timer instance model for active customer timers."""
     id: UUID
     customer_name: str
     template_id: UUID
-    remaining_time: timedelta  # Runtime only - NOT saved to DB
+    remaining_seconds: int  # Runtime only - NOT saved to DB
     status: TimerStatus  # Runtime only - NOT saved to DB
     display_order: int  # Saved to DB
-    created_at: datetime  # Saved to DB
+    created_micros: int  # Saved to DB (as created_at); microseconds since EPOCH
+    chain_template_id: Optional[UUID] = None  # Saved to DB; first stage while running a later one
+
+    def __post_init__(self):
+        self.template_id = intern_uuid(self.template_id)
+        if self.chain_template_id is not None:
+            self.chain_template_id = intern_uuid(self.chain_template_id)
+
+    @property
+    def remaining_time(self) -> timedelta:
+        """Time left on the countdown."""
+        return timedelta(seconds=self.remaining_seconds)
+
+    @remaining_time.setter
+    def remaining_time(self, value: timedelta):
+        self.remaining_seconds = int(value.total_seconds())
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time."""
+        return from_micros(self.created_micros)
+
+    @created_at.setter
+    def created_at(self, value: datetime):
+        self.created_micros = to_micros(value)
 
     @classmethod
     def create(
@@ -50,10 +83,10 @@ class TimerInstance(Serializable):
             id=uuid4(),
             customer_name=customer_name,
             template_id=template_id,
-            remaining_time=initial_duration,
+            remaining_seconds=int(initial_duration.total_seconds()),
             status=TimerStatus.STOPPED,
             display_order=display_order,
-            created_at=get_current_time()
+            created_micros=to_micros(get_current_time())
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -63,7 +96,8 @@ class TimerInstance(Serializable):
             'customer_name': self.customer_name,
             'template_id': str(self.template_id),
             'display_order': self.display_order,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at.isoformat(),
+            'chain_template_id': str(self.chain_template_id) if self.chain_template_id else None
         }
 
     @classmethod
@@ -81,9 +115,10 @@ class TimerInstance(Serializable):
         return cls(
             id=parse_uuid(data['id']),
             customer_name=data['customer_name'],
-            template_id=parse_uuid(data['template_id']),
-            remaining_time=template_duration,  # Reset to template duration
+            template_id=data['template_id'],
+            remaining_seconds=int(template_duration.total_seconds()),  # Reset to template duration
             status=TimerStatus.STOPPED,  # Always start as STOPPED
             display_order=data['display_order'],
-            created_at=datetime.fromisoformat(data['created_at'])
+            created_micros=to_micros(datetime.fromisoformat(data['created_at'])),
+            chain_template_id=data.get('chain_template_id') or None
         )
@@ -1,10 +1,10 @@
 """
 SQLite database service for Timer For Ryu.
 
-Version: 1.0.1
+Version: 1.0.11
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 
 Usage:
     from services.database import DatabaseService
@@ -20,6 +20,8 @@ from pathlib import Path
 from typing import List, Optional, Callable, TypeVar, Any
 from contextlib import contextmanager
 from datetime import timedelta
+from models.base import ORDER_GAP
+from models.schedule import TimerSchedule
 from models.template import TimerTemplate
 from models.timer import TimerInstance
 
@@ -27,6 +29,22 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# (column, definition) added to the templates table after the first release
+TEMPLATE_COLUMN_MIGRATIONS = [
+    ('alert_frequency', "INTEGER NOT NULL DEFAULT 800"),
+    ('alert_pattern', "TEXT NOT NULL DEFAULT 'single'"),
+    ('warning_seconds', "TEXT NOT NULL DEFAULT ''"),
+    ('next_template_id', "TEXT"),
+]
+
+# (column, definition) added to the timers table after the first release
+TIMER_COLUMN_MIGRATIONS = [
+    ('chain_template_id', "TEXT"),
+]
+
+# Data migrations recorded in PRAGMA user_version
+SPREAD_ORDERS_VERSION = 1  # display_order renumbered to ORDER_GAP spacing
+
 
 def get_data_dir() -> Path:
     """
@@ -119,10 +137,22 @@ class DatabaseService:
                     duration_seconds INTEGER NOT NULL,
                     display_order INTEGER NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    alert_frequency INTEGER NOT NULL DEFAULT 800,
+                    alert_pattern TEXT NOT NULL DEFAULT 'single',
+                    warning_seconds TEXT NOT NULL DEFAULT '',
+                    next_template_id TEXT
                 )
             """)
 
+            # Add columns introduced after the first release to existing databases
+            cursor.execute("PRAGMA table_info(templates)")
+            columns = {row[1] for row in cursor.fetchall()}
+            for column, definition in TEMPLATE_COLUMN_MIGRATIONS:
+                if column not in columns:
+                    logger.info(f"Migrating templates table: adding {column}")
+                    cursor.execute(f"ALTER TABLE templates ADD COLUMN {column} {definition}")
+
             # Create timers table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS timers (
@@ -131,12 +161,57 @@ class DatabaseService:
                     template_id TEXT NOT NULL,
                     display_order INTEGER NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    chain_template_id TEXT,
                     FOREIGN KEY (template_id) REFERENCES templates(id) ON DELETE CASCADE
                 )
             """)
 
+            cursor.execute("PRAGMA table_info(timers)")
+            columns = {row[1] for row in cursor.fetchall()}
+            for column, definition in TIMER_COLUMN_MIGRATIONS:
+                if column not in columns:
+                    logger.info(f"Migrating timers table: adding {column}")
+                    cursor.execute(f"ALTER TABLE timers ADD COLUMN {column} {definition}")
+
+            # Once per start, so loading timers stays read-only
+            self._reset_chain_stages(cursor)
+
+            # Create schedules table (auto-starts; at most one per timer)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schedules (
+                    timer_id TEXT PRIMARY KEY,
+                    next_at TIMESTAMP NOT NULL,
+                    interval_seconds INTEGER NOT NULL DEFAULT 0,
+                    until_at TIMESTAMP,
+                    FOREIGN KEY (timer_id) REFERENCES timers(id) ON DELETE CASCADE
+                )
+            """)
+
+            # Older databases number rows 0, 1, 2, ...: leave room for reorders once
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] < SPREAD_ORDERS_VERSION:
+                logger.info("Migrating display orders to ORDER_GAP spacing")
+                self._spread_display_orders(cursor, 'templates')
+                self._spread_display_orders(cursor, 'timers')
+                cursor.execute(f"PRAGMA user_version = {SPREAD_ORDERS_VERSION}")
+
         self._execute_query(_create_tables, "Database initialization error")
 
+    @staticmethod
+    def _spread_display_orders(cursor: sqlite3.Cursor, table: str) -> None:
+        """
+        Renumber a table's display_order to ORDER_GAP spacing, keeping the row order.
+
+        Args:
+            cursor: Database cursor
+            table: 'templates' or 'timers'
+        """
+        cursor.execute(f"SELECT id FROM {table} ORDER BY display_order ASC")
+        cursor.executemany(
+            f"UPDATE {table} SET display_order = ? WHERE id = ?",
+            [(row * ORDER_GAP, row_id) for row, (row_id,) in enumerate(cursor.fetchall())]
+        )
+
     # Template CRUD operations
 
     def create_template(self, template: TimerTemplate) -> None:
@@ -149,15 +224,22 @@ class DatabaseService:
         def _insert(cursor: sqlite3.Cursor) -> None:
             data = template.to_dict()
             cursor.execute("""
-                INSERT INTO templates (id, name, duration_seconds, display_order, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                INSERT INTO templates (
+                    id, name, duration_seconds, display_order, created_at, updated_at,
+                    alert_frequency, alert_pattern, warning_seconds, next_template_id
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 data['id'],
                 data['name'],
                 data['duration_seconds'],
                 data['display_order'],
                 data['created_at'],
-                data['updated_at']
+                data['updated_at'],
+                data['alert_frequency'],
+                data['alert_pattern'],
+                data['warning_seconds'],
+                data['next_template_id']
             ))
 
         self._execute_query(_insert, "Error creating template")
@@ -172,7 +254,8 @@ class DatabaseService:
         def _select(cursor: sqlite3.Cursor) -> List[TimerTemplate]:
             cursor.row_factory = sqlite3.Row
             cursor.execute("""
-                SELECT id, name, duration_seconds, display_order, created_at, updated_at
+                SELECT id, name, duration_seconds, display_order, created_at, updated_at,
+                       alert_frequency, alert_pattern, warning_seconds, next_template_id
                 FROM templates
                 ORDER BY display_order ASC
             """)
@@ -194,26 +277,67 @@ class DatabaseService:
             data = template.to_dict()
             cursor.execute("""
                 UPDATE templates
-                SET name = ?, duration_seconds = ?, display_order = ?, updated_at = ?
+                SET name = ?, duration_seconds = ?, display_order = ?, updated_at = ?,
+                    alert_frequency = ?, alert_pattern = ?, warning_seconds = ?,
+                    next_template_id = ?
                 WHERE id = ?
             """, (
                 data['name'],
                 data['duration_seconds'],
                 data['display_order'],
                 data['updated_at'],
+                data['alert_frequency'],
+                data['alert_pattern'],
+                data['warning_seconds'],
+                data['next_template_id'],
                 data['id']
             ))
 
         self._execute_query(_update, "Error updating template")
 
+    def update_template_orders(self, templates: List[TimerTemplate]) -> None:
+        """
+        Update display_order of several templates in one transaction.
+
+        Args:
+            templates: TimerTemplate instances with updated display_order
+        """
+        def _update(cursor: sqlite3.Cursor) -> None:
+            cursor.executemany(
+                "UPDATE templates SET display_order = ? WHERE id = ?",
+                [(template.display_order, str(template.id)) for template in templates]
+            )
+
+        self._execute_query(_update, "Error updating template order")
+
     def delete_template(self, template_id: str) -> None:
         """
         Delete template and cascade delete associated timers.
 
+        Timers that are only on this template as a later chain stage are kept
+        and go back to their chain's first template.
+
         Args:
             template_id: UUID string of template to delete
         """
         def _delete(cursor: sqlite3.Cursor) -> None:
+            cursor.execute("""
+                UPDATE timers SET template_id = chain_template_id, chain_template_id = NULL
+                WHERE template_id = ? AND chain_template_id IS NOT NULL
+            """, (template_id,))
+            cursor.execute(
+                "DELETE FROM schedules WHERE timer_id IN (SELECT id FROM timers WHERE template_id = ?)",
+                (template_id,)
+            )
+            # Chains through the template end before it
+            cursor.execute(
+                "UPDATE templates SET next_template_id = NULL WHERE next_template_id = ?",
+                (template_id,)
+            )
+            cursor.execute(
+                "UPDATE timers SET chain_template_id = NULL WHERE chain_template_id = ?",
+                (template_id,)
+            )
             # SQLite CASCADE DELETE automatically deletes associated timers
             cursor.execute("DELETE FROM templates WHERE id = ?", (template_id,))
 
@@ -231,14 +355,15 @@ class DatabaseService:
         def _insert(cursor: sqlite3.Cursor) -> None:
             data = timer.to_dict()
             cursor.execute("""
-                INSERT INTO timers (id, customer_name, template_id, display_order, created_at)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO timers (id, customer_name, template_id, display_order, created_at, chain_template_id)
+                VALUES (?, ?, ?, ?, ?, ?)
             """, (
                 data['id'],
                 data['customer_name'],
                 data['template_id'],
                 data['display_order'],
-                data['created_at']
+                data['created_at'],
+                data['chain_template_id']
             ))
 
         self._execute_query(_insert, "Error creating timer")
@@ -262,10 +387,11 @@ class DatabaseService:
         """
         query = f"""
             SELECT
-                t.id, t.customer_name, t.template_id, t.display_order, t.created_at,
+                t.id, t.customer_name, t.template_id, t.display_order, t.created_at, t.chain_template_id,
                 tp.id as template_id_full, tp.name, tp.duration_seconds,
                 tp.display_order as template_display_order, tp.created_at as template_created_at,
-                tp.updated_at as template_updated_at
+                tp.updated_at as template_updated_at,
+                tp.alert_frequency, tp.alert_pattern, tp.warning_seconds, tp.next_template_id
             FROM timers t
             JOIN templates tp ON t.template_id = tp.id
             {where_clause}
@@ -275,19 +401,15 @@ class DatabaseService:
         cursor.execute(query, params)
 
         timers = []
+        templates = {}  # One template object per id, shared by its timers
         for row in cursor.fetchall():
             row_dict = dict(row)
 
             # Extract template data
-            template_data = {
-                'id': row_dict['template_id_full'],
-                'name': row_dict['name'],
-                'duration_seconds': row_dict['duration_seconds'],
-                'display_order': row_dict['template_display_order'],
-                'created_at': row_dict['template_created_at'],
-                'updated_at': row_dict['template_updated_at']
-            }
-            template = TimerTemplate.from_dict(template_data)
+            template = templates.get(row_dict['template_id_full'])
+            if template is None:
+                template = self._template_from_row(row_dict)
+                templates[row_dict['template_id_full']] = template
 
             # Extract timer data
             timer_data = {
@@ -295,7 +417,8 @@ class DatabaseService:
                 'customer_name': row_dict['customer_name'],
                 'template_id': row_dict['template_id'],
                 'display_order': row_dict['display_order'],
-                'created_at': row_dict['created_at']
+                'created_at': row_dict['created_at'],
+                'chain_template_id': row_dict['chain_template_id']
             }
             timer = TimerInstance.from_dict(timer_data, template.duration)
 
@@ -303,18 +426,43 @@ class DatabaseService:
 
         return timers
 
+    @staticmethod
+    def _template_from_row(row_dict: dict) -> TimerTemplate:
+        """Build the template of a timers-with-templates row."""
+        return TimerTemplate.from_dict({
+            'id': row_dict['template_id_full'],
+            'name': row_dict['name'],
+            'duration_seconds': row_dict['duration_seconds'],
+            'display_order': row_dict['template_display_order'],
+            'created_at': row_dict['template_created_at'],
+            'updated_at': row_dict['template_updated_at'],
+            'alert_frequency': row_dict['alert_frequency'],
+            'alert_pattern': row_dict['alert_pattern'],
+            'warning_seconds': row_dict['warning_seconds'],
+            'next_template_id': row_dict['next_template_id']
+        })
+
+    @staticmethod
+    def _reset_chain_stages(cursor: sqlite3.Cursor) -> None:
+        """Return timers left in a later chain stage to the chain's first template."""
+        cursor.execute("""
+            UPDATE timers SET template_id = chain_template_id, chain_template_id = NULL
+            WHERE chain_template_id IS NOT NULL
+        """)
+
     def get_all_timers(self) -> List[tuple[TimerInstance, TimerTemplate]]:
         """
         Get all timers with their associated templates.
 
+        Read-only (safe on a worker thread). Timers left in a later chain
+        stage when the app closed were returned to their chain's first
+        template by _init_database.
+
         Returns:
             List[tuple[TimerInstance, TimerTemplate]]: List of (timer, template) tuples
         """
-        def _select(cursor: sqlite3.Cursor) -> List[tuple[TimerInstance, TimerTemplate]]:
-            return self._fetch_timers_with_templates(cursor)
-
         try:
-            return self._execute_query(_select, "Error getting timers")
+            return self._execute_query(self._fetch_timers_with_templates, "Error getting timers")
         except Exception:
             return []
 
@@ -339,6 +487,37 @@ class DatabaseService:
 
         self._execute_query(_update, "Error updating timer")
 
+    def update_timer_orders(self, timers: List[TimerInstance]) -> None:
+        """
+        Update display_order of several timers in one transaction.
+
+        Args:
+            timers: TimerInstance objects with updated display_order
+        """
+        def _update(cursor: sqlite3.Cursor) -> None:
+            cursor.executemany(
+                "UPDATE timers SET display_order = ? WHERE id = ?",
+                [(timer.display_order, str(timer.id)) for timer in timers]
+            )
+
+        self._execute_query(_update, "Error updating timer order")
+
+    def update_timer_templates(self, timers: List[TimerInstance]) -> None:
+        """
+        Save the chain stage of several timers in one transaction.
+
+        Args:
+            timers: TimerInstance objects with updated template_id and chain_template_id
+        """
+        def _update(cursor: sqlite3.Cursor) -> None:
+            cursor.executemany(
+                "UPDATE timers SET template_id = ?, chain_template_id = ? WHERE id = ?",
+                [(str(timer.template_id), str(timer.chain_template_id) if timer.chain_template_id else None,
+                  str(timer.id)) for timer in timers]
+            )
+
+        self._execute_query(_update, "Error updating timer templates")
+
     def delete_timer(self, timer_id: str) -> None:
         """
         Delete timer instance.
@@ -347,6 +526,7 @@ class DatabaseService:
             timer_id: UUID string of timer to delete
         """
         def _delete(cursor: sqlite3.Cursor) -> None:
+            cursor.execute("DELETE FROM schedules WHERE timer_id = ?", (timer_id,))
             cursor.execute("DELETE FROM timers WHERE id = ?", (timer_id,))
 
         self._execute_query(_delete, "Error deleting timer")
@@ -374,3 +554,81 @@ class DatabaseService:
             return self._execute_query(_select, "Error getting timers by template")
         except Exception:
             return []
+
+    # Schedule operations
+
+    def save_schedule(self, schedule: TimerSchedule) -> None:
+        """
+        Create or replace a timer's schedule.
+
+        Args:
+            schedule: TimerSchedule to save
+        """
+        def _upsert(cursor: sqlite3.Cursor) -> None:
+            data = schedule.to_dict()
+            cursor.execute("""
+                INSERT OR REPLACE INTO schedules (timer_id, next_at, interval_seconds, until_at)
+                VALUES (?, ?, ?, ?)
+            """, (
+                data['timer_id'],
+                data['next_at'],
+                data['interval_seconds'],
+                data['until_at']
+            ))
+
+        self._execute_query(_upsert, "Error saving schedule")
+
+    def get_all_schedules(self) -> List[TimerSchedule]:
+        """
+        Get the schedules of all existing timers.
+
+        Returns:
+            List[TimerSchedule]: Schedules ordered by next start
+        """
+        def _select(cursor: sqlite3.Cursor) -> List[TimerSchedule]:
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("""
+                SELECT s.timer_id, s.next_at, s.interval_seconds, s.until_at
+                FROM schedules s
+                JOIN timers t ON s.timer_id = t.id
+                JOIN templates tp ON t.template_id = tp.id
+                ORDER BY s.next_at ASC
+            """)
+            return [TimerSchedule.from_dict(dict(row)) for row in cursor.fetchall()]
+
+        try:
+            return self._execute_query(_select, "Error getting schedules")
+        except Exception:
+            return []
+
+    def update_schedules(self, advanced: List[TimerSchedule], finished: List[TimerSchedule]) -> None:
+        """
+        Save the result of a scheduler poll in one transaction.
+
+        Args:
+            advanced: Recurring schedules moved to their next start
+            finished: Schedules without further starts (deleted)
+        """
+        def _update(cursor: sqlite3.Cursor) -> None:
+            cursor.executemany(
+                "UPDATE schedules SET next_at = ? WHERE timer_id = ?",
+                [(schedule.next_at.isoformat(), str(schedule.timer_id)) for schedule in advanced]
+            )
+            cursor.executemany(
+                "DELETE FROM schedules WHERE timer_id = ?",
+                [(str(schedule.timer_id),) for schedule in finished]
+            )
+
+        self._execute_query(_update, "Error updating schedules")
+
+    def delete_schedule(self, timer_id: str) -> None:
+        """
+        Delete a timer's schedule.
+
+        Args:
+            timer_id: UUID string of timer
+        """
+        def _delete(cursor: sqlite3.Cursor) -> None:
+            cursor.execute("DELETE FROM schedules WHERE timer_id = ?", (timer_id,))
+
+        self._execute_query(_delete, "Error deleting schedule")
@@ -0,0 +1,200 @@
+"""
+Start scheduler: due times of timer auto-start schedules on the wall clock.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Schedules are kept in a heap by next start time, like the deadlines of
+TimerEngine, so the owner only has to wake for the first entry and poll()
+costs O(k log n) for k due schedules. Unlike countdown deadlines, starts
+are wall-clock times ("09:30"), so the scheduler reads clock.now().
+
+poll() handles every schedule that is due, however late: each starts once,
+recurring ones move past the current time in one step (missed occurrences
+are skipped, not replayed) and finished ones are dropped. Catching up
+after a restart or sleep is therefore the same single pass as a normal
+wake-up. Nothing here depends on Qt or the database: the main window wakes
+the scheduler with a QTimer and saves the result of each poll in one write.
+
+Usage:
+    from services.scheduler import StartScheduler
+
+    scheduler = StartScheduler()             # Uses models.clock.get_clock()
+    scheduler.add(schedule)                  # Replaces the timer's previous schedule
+    delay = scheduler.seconds_until_next()   # None when nothing is scheduled
+    due, finished = scheduler.poll()         # Start due[...]; forget finished
+"""
+import heapq
+import itertools
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from models.base import parse_uuid, to_micros
+from models.clock import Clock, get_clock
+from models.schedule import TimerSchedule
+
+COMPACT_MIN = 64  # Cancelled heap entries tolerated before the heap is rebuilt
+
+
+class _Entry:
+    """Heap entry of a schedule (cancelled entries are skipped when popped)."""
+
+    __slots__ = ('at', 'sequence', 'schedule', 'cancelled')
+
+    def __init__(self, at: int, sequence: int, schedule: TimerSchedule):
+        self.at = at  # Microseconds since EPOCH (schedule.next_micros when pushed)
+        self.sequence = sequence  # Equal times start in scheduling order
+        self.schedule = schedule
+        self.cancelled = False
+
+    def __lt__(self, other: '_Entry') -> bool:
+        return (self.at, self.sequence) < (other.at, other.sequence)
+
+
+class StartScheduler:
+    """Timer auto-start schedules in a heap."""
+
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        Initialize start scheduler.
+
+        Args:
+            clock: Time source (default: the application clock)
+        """
+        self.clock = clock if clock is not None else get_clock()
+        self._entries: Dict[UUID, _Entry] = {}
+        self._heap: List[_Entry] = []
+        self._cancelled = 0
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of active schedules."""
+        return len(self._entries)
+
+    def get(self, timer_id: str | UUID) -> Optional[TimerSchedule]:
+        """
+        Get a timer's schedule.
+
+        Args:
+            timer_id: UUID (or UUID string) of timer
+
+        Returns:
+            TimerSchedule or None
+        """
+        entry = self._entries.get(parse_uuid(timer_id))
+        return entry.schedule if entry is not None else None
+
+    def add(self, schedule: TimerSchedule):
+        """
+        Schedule a timer's starts, replacing its previous schedule.
+
+        Args:
+            schedule: Schedule (next_at may already be past: due on the next poll)
+        """
+        self._cancel(schedule.timer_id)
+        self._push(schedule)
+
+    def set_schedules(self, schedules: Iterable[TimerSchedule]):
+        """
+        Replace all schedules (e.g. loaded from the database).
+
+        Args:
+            schedules: Schedules, one per timer
+        """
+        self._entries.clear()
+        self._cancelled = 0
+        self._heap = []
+        for schedule in schedules:
+            entry = _Entry(schedule.next_micros, next(self._sequence), schedule)
+            self._entries[schedule.timer_id] = entry
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
+
+    def remove(self, timer_id: str | UUID):
+        """
+        Drop a timer's schedule.
+
+        Args:
+            timer_id: UUID (or UUID string) of timer
+        """
+        self._cancel(parse_uuid(timer_id))
+
+    def clear(self):
+        """Drop all schedules."""
+        self._entries.clear()
+        self._heap.clear()
+        self._cancelled = 0
+
+    def next_due(self) -> Optional[int]:
+        """
+        Get the earliest start time.
+
+        Returns:
+            int or None: Microseconds since EPOCH, None when nothing is scheduled
+        """
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0].at if heap else None
+
+    def seconds_until_next(self) -> Optional[float]:
+        """
+        Get the time until the next start.
+
+        Returns:
+            float or None: Seconds (>= 0), None when nothing is scheduled
+        """
+        at = self.next_due()
+        if at is None:
+            return None
+        return max(0.0, (at - to_micros(self.clock.now())) / 1_000_000)
+
+    def poll(self) -> Tuple[List[TimerSchedule], List[TimerSchedule]]:
+        """
+        Collect the schedules that are due and advance them.
+
+        Each due schedule is reported once, however many of its occurrences
+        passed; recurring schedules are moved to their next occurrence after
+        now and kept, the others are dropped.
+
+        Returns:
+            tuple: (due schedules in start order, those of them that finished)
+        """
+        now = to_micros(self.clock.now())
+        heap = self._heap
+        due = []
+        finished = []
+        while heap and heap[0].at <= now:
+            entry = heapq.heappop(heap)
+            if entry.cancelled:
+                self._cancelled -= 1
+                continue
+            schedule = entry.schedule
+            due.append(schedule)
+            del self._entries[schedule.timer_id]
+            if schedule.advance(now):
+                self._push(schedule)
+            else:
+                finished.append(schedule)
+        return due, finished
+
+    def _push(self, schedule: TimerSchedule):
+        """Add a heap entry at the schedule's next start."""
+        entry = _Entry(schedule.next_micros, next(self._sequence), schedule)
+        self._entries[schedule.timer_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _cancel(self, timer_id: UUID):
+        """Drop a timer's entry; the heap entry is skipped later."""
+        entry = self._entries.pop(timer_id, None)
+        if entry is None:
+            return
+        entry.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > COMPACT_MIN and self._cancelled > len(self._entries):
+            self._heap = [entry for entry in self._heap if not entry.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
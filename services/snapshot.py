@@ -0,0 +1,194 @@
+"""
+Startup snapshot of the last shown templates and timers.
+
+Version: 1.0.6
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+The snapshot is a small binary file written next to the database on exit.
+On the next launch it lets the window show rows before the database has
+been queried. It is discarded when the magic, format version or CRC32 do
+not match, or when the database file changed (mtime/size) after the
+snapshot was written.
+
+Layout (little endian):
+    header   magic "TFRS", version u16, reserved u16, crc32 u32,
+             payload length u32, db mtime ns i64, db size i64
+    payload  template block, then timer block (models/codec.py)
+
+Usage:
+    from services.snapshot import get_snapshot_path, read_snapshot, write_snapshot
+
+    path = get_snapshot_path(db.db_path)
+    write_snapshot(path, db.db_path, templates, timers_with_templates)
+    snapshot = read_snapshot(path, db.db_path)   # None if missing or stale
+"""
+import logging
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from models.codec import decode_templates, decode_timers, encode_templates, encode_timers
+from models.enums import TimerStatus
+from models.template import TimerTemplate
+from models.timer import TimerInstance
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = 'startup_snapshot.bin'
+MAGIC = b'TFRS'
+VERSION = 6  # 2: template alert frequency/pattern, 3: models.codec blocks, 4: template warnings,
+#             5: template chains, 6: timer chain start
+
+_HEADER = struct.Struct('<4sHHIIqq')
+
+
+class Snapshot(NamedTuple):
+    """Rows restored from a snapshot, in the shapes DatabaseService returns."""
+    templates: List[TimerTemplate]
+    timers: List[Tuple[TimerInstance, TimerTemplate]]
+
+
+def get_snapshot_path(db_path: Path) -> Path:
+    """
+    Get snapshot file path for a database.
+
+    Args:
+        db_path: Database file path
+
+    Returns:
+        Path: Snapshot file path (same directory as the database)
+    """
+    return Path(db_path).parent / SNAPSHOT_FILENAME
+
+
+def _db_signature(db_path: Path) -> Tuple[int, int]:
+    """Get (mtime ns, size) of the database file, or (0, 0) if it is missing."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
+
+
+def encode_snapshot(
+    templates: List[TimerTemplate],
+    timers: List[Tuple[TimerInstance, TimerTemplate]]
+) -> bytes:
+    """
+    Encode snapshot payload (without header).
+
+    Args:
+        templates: Templates in display order
+        timers: (timer, template) tuples in display order
+
+    Returns:
+        bytes: Payload
+    """
+    return encode_templates(templates) + encode_timers([timer for timer, _ in timers])
+
+
+def decode_snapshot(payload: bytes) -> Snapshot:
+    """
+    Decode snapshot payload.
+
+    Timers get their template's duration and STOPPED status, as when loaded
+    from the database.
+
+    Args:
+        payload: Payload produced by encode_snapshot()
+
+    Returns:
+        Snapshot: Restored rows
+
+    Raises:
+        ValueError: If the payload is malformed
+    """
+    templates, offset = decode_templates(payload)
+    timer_list, offset = decode_timers(payload, offset)
+    if offset != len(payload):
+        raise ValueError("Malformed snapshot payload: trailing bytes")
+
+    templates_by_id = {template.id: template for template in templates}
+    timers = []
+    for timer in timer_list:
+        template = templates_by_id.get(timer.template_id)
+        if template is None:
+            raise ValueError(f"Malformed snapshot payload: unknown template {timer.template_id}")
+        timer.remaining_seconds = template.duration_seconds
+        timer.status = TimerStatus.STOPPED
+        timers.append((timer, template))
+    return Snapshot(templates, timers)
+
+
+def write_snapshot(
+    path: Path,
+    db_path: Path,
+    templates: List[TimerTemplate],
+    timers: List[Tuple[TimerInstance, TimerTemplate]]
+) -> None:
+    """
+    Write snapshot atomically (temp file + rename).
+
+    Call after the last database write so the recorded database signature
+    matches the file the next launch will open.
+
+    Args:
+        path: Snapshot file path
+        db_path: Database file the rows came from
+        templates: Templates in display order
+        timers: (timer, template) tuples in display order
+    """
+    try:
+        payload = encode_snapshot(templates, timers)
+    except ValueError as e:
+        logger.error(f"Error encoding snapshot: {e}")
+        return
+    mtime_ns, size = _db_signature(db_path)
+    header = _HEADER.pack(MAGIC, VERSION, 0, zlib.crc32(payload), len(payload), mtime_ns, size)
+
+    temp_path = Path(path).with_suffix('.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.error(f"Error writing snapshot: {e}")
+
+
+def read_snapshot(path: Path, db_path: Path) -> Optional[Snapshot]:
+    """
+    Read snapshot if it is valid and the database has not changed since.
+
+    Args:
+        path: Snapshot file path
+        db_path: Database file the snapshot must match
+
+    Returns:
+        Snapshot or None (missing, corrupt, other version, or stale)
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, _, crc, length, mtime_ns, size = _HEADER.unpack_from(data, 0)
+    payload = data[_HEADER.size:]
+    if magic != MAGIC or version != VERSION or length != len(payload) or zlib.crc32(payload) != crc:
+        logger.info("Discarding invalid startup snapshot")
+        return None
+    if (mtime_ns, size) != _db_signature(db_path):
+        logger.info("Discarding stale startup snapshot (database changed)")
+        return None
+
+    try:
+        return decode_snapshot(payload)
+    except ValueError as e:
+        logger.error(f"Error reading snapshot: {e}")
+        return None
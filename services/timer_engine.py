@@ -0,0 +1,384 @@
+"""
+Countdown engine: deadlines of running timers on the application clock.
+
+Version: 1.0.4
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+A running timer is a deadline on the clock's monotonic reading, kept in a
+heap. Remaining time is derived from the deadline when read, so a late or
+skipped tick never loses time, and finding the expired timers costs
+O(k log n) for k expiries instead of a check per timer per second. The
+next wake-up is the first heap entry. Nothing here depends on Qt: the
+timer panel wakes the engine with a QTimer at that deadline, while a
+simulation advances a VirtualClock and calls poll() itself.
+
+Engine time is the monotonic reading plus the seconds passed to skip().
+When the machine slept (the monotonic clock stood still, see
+ClockJumpDetector; wall-clock changes are not sleep), catch_up() adds the
+sleep once and polls: every deadline moves by the same amount in a single
+O(1) step, and the timers that ran out during the sleep come back as one
+batch.
+
+Pre-expiry warnings are deadlines too, in a second heap: start() arms one
+entry per stage still ahead (e.g. 120 and 30 seconds before the end), and
+pause/stop/discard/expiry cancel them, so a resumed timer re-arms only the
+stages it has not reached. Nothing checks thresholds per tick; 10k timers
+with 3 stages are 30k heap entries, each popped once.
+
+Chained templates (greeting -> diagnosis -> wrap-up) advance inside poll():
+the next_stage hook is asked about each timer that ran out and, if it names
+a next stage, the timer keeps running with a new deadline counted from the
+old one rather than from the poll. A late wake-up or a sleep therefore
+loses no time, and stages that passed entirely during a sleep run out in
+the same pass. The hook switches the timer's template; the engine only
+knows the stage's length and warnings.
+
+Usage:
+    from services.timer_engine import TimerEngine
+
+    engine = TimerEngine()                   # Uses models.clock.get_clock()
+    engine.start(timer)                      # RUNNING, deadline = now + remaining
+    engine.start(timer, (120, 30))           # Also warn 2 min and 30 s before the end
+    delay = engine.seconds_until_next()      # None when nothing runs
+    for timer in engine.poll():              # Expired: STOPPED, remaining 0
+        ...
+    for timer, seconds_left in engine.poll_warnings():   # After poll(): stages reached
+        ...
+    missed = engine.catch_up(slept)          # After sleep: expired during the sleep
+
+    engine.next_stage = lambda timer: (600, (60,))   # Chain: continue for 10 min instead
+"""
+import heapq
+import itertools
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from models.base import parse_uuid
+from models.clock import Clock, get_clock
+from models.enums import TimerStatus
+from models.timer import TimerInstance
+
+# QTimer ticks can fire a little early; a second this close to its end counts as gone
+TICK_TOLERANCE = 0.05
+
+COMPACT_MIN = 64  # Cancelled heap entries tolerated before the heap is rebuilt
+
+# Chain hook: timer that ran out -> (next stage seconds, its warnings), or None to expire
+NextStage = Callable[[TimerInstance], Optional[Tuple[int, Iterable[int]]]]
+
+
+class _Deadline:
+    """Heap entry of a running timer (cancelled entries are skipped when popped)."""
+
+    __slots__ = ('at', 'sequence', 'timer', 'cancelled', 'stage')
+
+    def __init__(self, at: float, sequence: int, timer: TimerInstance, stage: int = 0):
+        self.at = at
+        self.sequence = sequence  # Equal deadlines expire in start order
+        self.timer = timer
+        self.cancelled = False
+        self.stage = stage  # Warning: seconds before the end (0: the expiry itself)
+
+    def __lt__(self, other: '_Deadline') -> bool:
+        return (self.at, self.sequence) < (other.at, other.sequence)
+
+
+class TimerEngine:
+    """Running timers as deadlines in a heap."""
+
+    def __init__(self, clock: Optional[Clock] = None, next_stage: Optional[NextStage] = None):
+        """
+        Initialize timer engine.
+
+        Args:
+            clock: Time source (default: the application clock)
+            next_stage: Chain hook called for each timer that runs out (None: no chains)
+        """
+        self.clock = clock if clock is not None else get_clock()
+        self.next_stage = next_stage
+        self._deadlines: Dict[UUID, _Deadline] = {}
+        self._heap: List[_Deadline] = []
+        self._cancelled = 0
+        self._warnings: Dict[UUID, List[_Deadline]] = {}
+        self._warning_heap: List[_Deadline] = []
+        self._warnings_cancelled = 0
+        self._sequence = itertools.count()
+        self._skipped = 0.0  # Seconds of sleep the monotonic clock did not count
+
+    def __len__(self) -> int:
+        """Number of running timers."""
+        return len(self._deadlines)
+
+    def now(self) -> float:
+        """
+        Get engine time (deadlines are on this scale).
+
+        Returns:
+            float: Monotonic seconds plus skipped seconds
+        """
+        return self.clock.monotonic() + self._skipped
+
+    def skip(self, seconds: float):
+        """
+        Count time the monotonic clock missed as elapsed for all running timers.
+
+        Args:
+            seconds: Seconds to add (> 0)
+        """
+        if seconds > 0:
+            self._skipped += seconds
+
+    def catch_up(self, seconds: float) -> List[TimerInstance]:
+        """
+        Reconcile after the machine slept: skip the gap and collect expiries.
+
+        Args:
+            seconds: Sleep length (ClockJump.slept from ClockJumpDetector)
+
+        Returns:
+            list: Timers that expired during the gap, see poll()
+        """
+        self.skip(seconds)
+        return self.poll()
+
+    def is_running(self, timer_id: str | UUID) -> bool:
+        """
+        Check whether a timer is counting down.
+
+        Args:
+            timer_id: UUID (or UUID string) of timer
+
+        Returns:
+            bool: True if the timer has a deadline
+        """
+        return parse_uuid(timer_id) in self._deadlines
+
+    def start(self, timer: TimerInstance, warnings: Iterable[int] = ()):
+        """
+        Start or resume a timer from its remaining seconds.
+
+        Args:
+            timer: Timer to start (status becomes RUNNING)
+            warnings: Seconds before the end to warn at (template
+                warning_seconds); stages not ahead of the remaining time
+                are skipped
+        """
+        self._cancel(timer.id)
+        self._arm(timer, self.now() + timer.remaining_seconds, warnings)
+        timer.status = TimerStatus.RUNNING
+
+    def pause(self, timer: TimerInstance):
+        """
+        Pause a timer, keeping its remaining seconds.
+
+        Args:
+            timer: Timer to pause (status becomes PAUSED)
+        """
+        self.refresh(timer)
+        self._cancel(timer.id)
+        timer.status = TimerStatus.PAUSED
+
+    def stop(self, timer: TimerInstance, duration_seconds: int):
+        """
+        Stop a timer and reset it.
+
+        Args:
+            timer: Timer to stop (status becomes STOPPED)
+            duration_seconds: Remaining seconds to reset to (template duration)
+        """
+        self._cancel(timer.id)
+        timer.status = TimerStatus.STOPPED
+        timer.remaining_seconds = duration_seconds
+
+    def discard(self, timer_id: str | UUID):
+        """
+        Forget a timer (deleted or removed from the list) without touching it.
+
+        Args:
+            timer_id: UUID (or UUID string) of timer
+        """
+        self._cancel(parse_uuid(timer_id))
+
+    def clear(self):
+        """Forget all running timers."""
+        self._deadlines.clear()
+        self._heap.clear()
+        self._cancelled = 0
+        self._warnings.clear()
+        self._warning_heap.clear()
+        self._warnings_cancelled = 0
+
+    def pending_warnings(self) -> int:
+        """
+        Count armed warning stages.
+
+        Returns:
+            int: Warnings not yet reached, over all running timers
+        """
+        return sum(len(stages) for stages in self._warnings.values())
+
+    def refresh(self, timer: TimerInstance) -> int:
+        """
+        Update a timer's remaining seconds from its deadline.
+
+        Args:
+            timer: Timer to update (left as is unless running)
+
+        Returns:
+            int: Remaining seconds (whole seconds, rounded up)
+        """
+        deadline = self._deadlines.get(timer.id)
+        if deadline is not None:
+            left = deadline.at - self.now() - TICK_TOLERANCE
+            timer.remaining_seconds = max(0, math.ceil(left))
+        return timer.remaining_seconds
+
+    def refresh_all(self) -> List[TimerInstance]:
+        """
+        Update the remaining seconds of all running timers.
+
+        Returns:
+            list: Running timers
+        """
+        now = self.now() + TICK_TOLERANCE
+        timers = []
+        for deadline in self._deadlines.values():
+            timer = deadline.timer
+            timer.remaining_seconds = max(0, math.ceil(deadline.at - now))
+            timers.append(timer)
+        return timers
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the earliest deadline (expiry or warning).
+
+        Returns:
+            float or None: Engine time of the next event, None when nothing runs
+        """
+        heap = self._heap
+        while heap and heap[0].cancelled:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        warning_heap = self._warning_heap
+        while warning_heap and warning_heap[0].cancelled:
+            heapq.heappop(warning_heap)
+            self._warnings_cancelled -= 1
+        if warning_heap and heap and warning_heap[0].at < heap[0].at:
+            return warning_heap[0].at
+        return heap[0].at if heap else None
+
+    def seconds_until_next(self) -> Optional[float]:
+        """
+        Get the time until the next expiry or warning.
+
+        Returns:
+            float or None: Seconds (>= 0), None when nothing runs
+        """
+        at = self.next_deadline()
+        return None if at is None else max(0.0, at - self.now())
+
+    def poll(self) -> List[TimerInstance]:
+        """
+        Collect the timers whose deadline has passed.
+
+        Expired timers are removed from the engine with status STOPPED and
+        0 remaining seconds; resetting them to their duration is up to the
+        caller. Timers the next_stage hook continues keep running into their
+        next stage and are not returned.
+
+        Returns:
+            list: Expired timers in deadline order
+        """
+        now = self.now()
+        heap = self._heap
+        expired = []
+        while heap and heap[0].at <= now:
+            deadline = heapq.heappop(heap)
+            if deadline.cancelled:
+                self._cancelled -= 1
+                continue
+            timer = deadline.timer
+            del self._deadlines[timer.id]
+            self._cancel_warnings(timer.id)  # Stages skipped by a late poll are moot now
+            stage = self.next_stage(timer) if self.next_stage is not None else None
+            if stage is not None:
+                seconds, warnings = stage
+                timer.remaining_seconds = seconds
+                self._arm(timer, deadline.at + seconds, warnings)  # Popped again below if already passed
+                continue
+            timer.status = TimerStatus.STOPPED
+            timer.remaining_seconds = 0
+            expired.append(timer)
+        return expired
+
+    def poll_warnings(self) -> List[Tuple[TimerInstance, int]]:
+        """
+        Collect the warning stages reached.
+
+        Call after poll(), so timers that already expired are not warned.
+        When several stages of a timer were passed at once (a late wake-up
+        or sleep), only the last one is reported.
+
+        Returns:
+            list: (timer, stage seconds before the end) in deadline order
+        """
+        now = self.now()
+        heap = self._warning_heap
+        reached: Dict[UUID, Tuple[TimerInstance, int]] = {}
+        while heap and heap[0].at <= now:
+            entry = heapq.heappop(heap)
+            if entry.cancelled:
+                self._warnings_cancelled -= 1
+                continue
+            timer = entry.timer
+            stages = self._warnings[timer.id]
+            stages.remove(entry)
+            if not stages:
+                del self._warnings[timer.id]
+            reached.pop(timer.id, None)  # Keep deadline order for the last stage
+            reached[timer.id] = (timer, entry.stage)
+        return list(reached.values())
+
+    def _arm(self, timer: TimerInstance, end: float, warnings: Iterable[int]):
+        """Push a timer's deadline and the warning stages ahead of it (remaining_seconds left)."""
+        sequence = next(self._sequence)
+        deadline = _Deadline(end, sequence, timer)
+        self._deadlines[timer.id] = deadline
+        heapq.heappush(self._heap, deadline)
+
+        stages = [_Deadline(end - stage, sequence, timer, stage)
+                  for stage in warnings if 0 < stage < timer.remaining_seconds]
+        if stages:
+            self._warnings[timer.id] = stages
+            for entry in stages:
+                heapq.heappush(self._warning_heap, entry)
+
+    def _cancel(self, timer_id: UUID):
+        """Drop a timer's deadline and warnings; the heap entries are skipped later."""
+        self._cancel_warnings(timer_id)
+        deadline = self._deadlines.pop(timer_id, None)
+        if deadline is None:
+            return
+        deadline.cancelled = True
+        self._cancelled += 1
+        if self._cancelled > COMPACT_MIN and self._cancelled > len(self._deadlines):
+            # Pause/resume churn: rebuild rather than let dead entries pile up
+            self._heap = [entry for entry in self._heap if not entry.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _cancel_warnings(self, timer_id: UUID):
+        """Drop a timer's remaining warning stages."""
+        stages = self._warnings.pop(timer_id, None)
+        if not stages:
+            return
+        for entry in stages:
+            entry.cancelled = True
+        self._warnings_cancelled += len(stages)
+        if self._warnings_cancelled > COMPACT_MIN and self._warnings_cancelled > len(self._warning_heap) // 2:
+            self._warning_heap = [entry for entry in self._warning_heap if not entry.cancelled]
+            heapq.heapify(self._warning_heap)
+            self._warnings_cancelled = 0
@@ -0,0 +1,155 @@
+"""
+Build trimmed Pretendard fonts from a glyph-usage manifest.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Reads assets/fonts/subset_manifest.txt, keeps only the listed characters
+(plus the OpenType layout features that use them) and writes
+assets/fonts/PretendardUI-<Style>.otf under the family name "Pretendard UI".
+load_fonts() registers these at startup and loads the full Pretendard fonts
+only when text needs a glyph outside the subset. Output is byte-identical
+for the same manifest, fonts and UI sources. Re-run after changing any of
+them, then rebuild the resource bundle (build_resources.py).
+
+Usage:
+    uv pip install fonttools
+    uv run python subset_fonts.py
+"""
+import sys
+from pathlib import Path
+from typing import Set
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+PROJECT_DIR = Path(__file__).parent
+FONTS_DIR = PROJECT_DIR / "assets" / "fonts"
+MANIFEST_FILE = FONTS_DIR / "subset_manifest.txt"
+
+SUBSET_FAMILY = "Pretendard UI"
+STYLES = ["Regular", "Bold"]
+
+# Hangul syllable rows of the KS X 1001 double-byte table (as encoded in EUC-KR)
+KS_X_1001_HANGUL_ROWS = range(0xB0, 0xC9)
+KS_X_1001_CELLS = range(0xA1, 0xFF)
+
+
+def _parse_code_points(spec: str) -> range:
+    """Parse "U+XXXX" or "U+XXXX-YYYY" into a code point range."""
+    first, _, last = spec[2:].partition('-')
+    return range(int(first, 16), int(last or first, 16) + 1)
+
+
+def _ks_x_1001_hangul() -> Set[int]:
+    """Get the 2,350 precomposed Hangul syllables of KS X 1001."""
+    code_points = set()
+    for row in KS_X_1001_HANGUL_ROWS:
+        for cell in KS_X_1001_CELLS:
+            code_points.add(ord(bytes([row, cell]).decode('euc-kr')))
+    return code_points
+
+
+def _scan_sources(directory: Path) -> Set[int]:
+    """Get the non-ASCII characters used in Python sources below a directory."""
+    code_points = set()
+    for source in sorted(directory.rglob("*.py")):
+        code_points.update(ord(char) for char in source.read_text(encoding='utf-8') if ord(char) > 0x7F)
+    return code_points
+
+
+def read_manifest(path: Path = MANIFEST_FILE) -> Set[int]:
+    """
+    Read the glyph-usage manifest.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Set[int]: Code points to keep
+
+    Raises:
+        ValueError: If a line cannot be parsed
+    """
+    code_points = set()
+    for line_number, line in enumerate(path.read_text(encoding='utf-8').splitlines(), start=1):
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.upper().startswith("U+"):
+            code_points.update(_parse_code_points(line.upper()))
+        elif line == "charset ks-x-1001":
+            code_points.update(_ks_x_1001_hangul())
+        elif line.startswith("scan "):
+            code_points.update(_scan_sources(PROJECT_DIR / line.split(None, 1)[1]))
+        else:
+            raise ValueError(f"{path.name}:{line_number}: cannot parse '{line}'")
+    return code_points
+
+
+def _rename_family(font: TTFont, style: str):
+    """Give the subset its own family name so it can sit next to the full font."""
+    postscript_name = f"{SUBSET_FAMILY.replace(' ', '')}-{style}"
+    names = {
+        1: SUBSET_FAMILY,
+        3: postscript_name,
+        4: f"{SUBSET_FAMILY} {style}",
+        6: postscript_name,
+        16: SUBSET_FAMILY,
+    }
+    for record in font['name'].names:
+        if record.nameID in names:
+            record.string = names[record.nameID]
+    font['CFF '].cff.fontNames = [postscript_name]
+
+
+def subset_font(source: Path, output: Path, code_points: Set[int], style: str):
+    """
+    Write a subset of one font.
+
+    Args:
+        source: Full font file
+        output: Subset font file to write
+        code_points: Code points to keep
+        style: Style name (e.g. "Regular")
+    """
+    options = subset.Options()
+    options.layout_features = ['*']  # Keep kerning and Hangul composition features
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+
+    font = TTFont(source, recalcTimestamp=False)  # Keep head.modified for reproducible output
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=code_points)
+    subsetter.subset(font)
+    _rename_family(font, style)
+    font.save(output)
+
+
+def subset_fonts() -> bool:
+    """
+    Subset every Pretendard style listed in STYLES.
+
+    Returns:
+        bool: True if all subset fonts were written
+    """
+    try:
+        code_points = read_manifest()
+    except (OSError, ValueError) as e:
+        print(f"Error reading manifest: {e}")
+        return False
+    print(f"Manifest: {len(code_points):,} code points")
+
+    for style in STYLES:
+        source = FONTS_DIR / f"Pretendard-{style}.otf"
+        output = FONTS_DIR / f"{SUBSET_FAMILY.replace(' ', '')}-{style}.otf"
+        subset_font(source, output, code_points, style)
+        print(f"✅ {output.name}: {source.stat().st_size:,} → {output.stat().st_size:,} bytes")
+    return True
+
+
+if __name__ == "__main__":
+    success = subset_fonts()
+    sys.exit(0 if success else 1)
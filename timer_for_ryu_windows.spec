@@ -7,11 +7,9 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
-        ('assets/alert.wav', 'assets'),
-        # Include entire fonts directory to ensure all font files are bundled
-        ('assets/fonts', 'assets/fonts'),
-        # Include SVG icons for control buttons
-        ('assets/icons', 'assets/icons'),
+        # Fonts, SVG icons and alert sound in one compiled resource bundle
+        # (build with: uv run python build_resources.py)
+        ('assets/assets.rcc', 'assets'),
     ],
     hiddenimports=[
         'PySide6.QtCore',
@@ -1,8 +1,22 @@
 """
 UI components for Timer For Ryu application.
+
+Exports are imported on first attribute access (PEP 562), so importing a
+submodule such as ui.theme does not pull in the main window, panels and
+dialogs.
 """
-from ui.font_loader import load_fonts
-from ui.theme import Theme
-from ui.main_window import MainWindow
+import importlib
+
+_EXPORTS = {
+    'load_fonts': 'ui.font_loader',
+    'Theme': 'ui.theme',
+    'MainWindow': 'ui.main_window',
+}
 
 __all__ = ['load_fonts', 'Theme', 'MainWindow']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
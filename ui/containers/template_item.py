@@ -1,10 +1,10 @@
 """
 Template item component - manages template business logic and UI delegation.
 
-Version: 1.0.0
+Version: 1.0.1
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QVBoxLayout, QWidget
@@ -71,6 +71,19 @@ class TemplateItem(QWidget):
         seconds = total_seconds % 60
         self.list_item.update_duration(minutes, seconds)
 
+    def reset(self):
+        """Nothing to stop; template rows hold no timers."""
+
+    def rebind(self, template: TimerTemplate):
+        """
+        Bind a pooled widget to another template.
+
+        Args:
+            template: TimerTemplate to display
+        """
+        self.template = template
+        self.list_item.rebind(template)
+
     def set_buttons_enabled(self, enabled: bool):
         """
         Enable or disable edit/delete buttons.
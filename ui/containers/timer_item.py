@@ -1,19 +1,24 @@
 """
 Timer item component - manages timer business logic and UI delegation.
 
-Version: 1.0.4
+Version: 1.0.15
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
-"""
-from datetime import timedelta
+Last Modified: 2026-10-19
 
-from PySide6.QtCore import QTimer, Signal
+Countdowns run in the panel's TimerEngine: start/pause/stop go through the
+engine, and the panel's shared ticker calls refresh() to redraw the
+remaining time and complete() when the deadline passes. The item itself
+has no countdown or blink timer: completion notifications and blinking
+are handled by the panel for a whole batch of completions at once.
+"""
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
 from models.enums import TimerStatus
 from models.template import TimerTemplate
 from models.timer import TimerInstance
+from services.timer_engine import TimerEngine
 from ui.widgets.timer_list_item import TimerListItem
 
 
@@ -22,30 +27,23 @@ class TimerItem(QWidget):
 
     edit_clicked = Signal(TimerInstance)
     delete_clicked = Signal(TimerInstance)
-    timer_completed = Signal(TimerInstance)
-    timer_status_changed = Signal(str, bool)  # (template_id, is_running_or_paused)
+    timer_status_changed = Signal(TimerInstance)  # (timer) - after its status changed
     timer_clicked = Signal(str)  # (timer_id) - for stopping alert sound
 
-    def __init__(self, timer: TimerInstance, template: TimerTemplate, parent=None):
+    def __init__(self, timer: TimerInstance, template: TimerTemplate, engine: TimerEngine, parent=None):
         """
         Initialize timer item.
 
         Args:
             timer: TimerInstance to display
             template: Associated TimerTemplate
+            engine: Engine running the countdown (shared by the panel)
             parent: Parent widget
         """
         super().__init__(parent)
         self.timer = timer
         self.template = template
-
-        self.countdown_timer = QTimer()
-        self.countdown_timer.timeout.connect(self._on_countdown_tick)
-
-        # Completion blink timer
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self._toggle_blink)
-        self.blink_state = False
+        self.engine = engine
 
         self._init_ui()
         self._connect_signals()
@@ -73,49 +71,47 @@ class TimerItem(QWidget):
 
     def _update_display(self):
         """Update timer display and button states."""
-        total_seconds = int(self.timer.remaining_time.total_seconds())
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
+        minutes, seconds = divmod(self.timer.remaining_seconds, 60)
         self.list_item.update_display(minutes, seconds)
         self.list_item.update_button_states(self.timer.status)
 
+    def start(self):
+        """Start or resume the countdown (start button or auto-start schedule)."""
+        self.engine.start(self.timer, self.template.warning_seconds)
+        self._update_display()
+        self.timer_status_changed.emit(self.timer)
+
     def _on_start(self):
         """Handle start/resume button click."""
-        self.timer.status = TimerStatus.RUNNING
-        self.countdown_timer.start(1000)
-        self._update_display()
-        self.timer_status_changed.emit(str(self.timer.template_id), True)
+        self.start()
 
     def _on_pause(self):
         """Handle pause button click."""
-        self.timer.status = TimerStatus.PAUSED
-        self.countdown_timer.stop()
+        self.engine.pause(self.timer)
         self._update_display()
-        self.timer_status_changed.emit(str(self.timer.template_id), True)
+        self.timer_status_changed.emit(self.timer)
 
     def _on_stop(self):
         """Handle stop button click (reset to template duration)."""
+        self.engine.stop(self.timer, self.template.duration_seconds)
+        self._update_display()
+        self.timer_status_changed.emit(self.timer)
+
+    def refresh(self):
+        """Redraw the remaining time (already updated by TimerEngine.refresh_all())."""
+        minutes, seconds = divmod(self.timer.remaining_seconds, 60)
+        self.list_item.update_display(minutes, seconds)
+
+    def complete(self):
+        """
+        Reset the row after the engine reported the deadline passed.
+
+        Emits nothing: the panel completing the batch updates its counts
+        and notifies once for all rows.
+        """
         self.timer.status = TimerStatus.STOPPED
-        self.timer.remaining_time = self.template.duration
-        self.countdown_timer.stop()
+        self.timer.remaining_seconds = self.template.duration_seconds
         self._update_display()
-        self.timer_status_changed.emit(str(self.timer.template_id), False)
-
-    def _on_countdown_tick(self):
-        """Handle countdown timer tick (every 1 second)."""
-        if self.timer.status == TimerStatus.RUNNING:
-            total_seconds = int(self.timer.remaining_time.total_seconds())
-
-            if total_seconds > 0:
-                self.timer.remaining_time = timedelta(seconds=total_seconds - 1)
-                self._update_display()
-            else:
-                self.countdown_timer.stop()
-                self.timer.status = TimerStatus.STOPPED
-                self.timer.remaining_time = self.template.duration
-                self._update_display()
-                self.timer_status_changed.emit(str(self.timer.template_id), False)
-                self.timer_completed.emit(self.timer)
 
     def update_timer(self, timer: TimerInstance):
         """
@@ -136,12 +132,29 @@ class TimerItem(QWidget):
             template: Updated template instance
         """
         self.template = template
-        self.list_item.update_template_name(template.name)
+        self.list_item.set_template(template)
         # If timer is stopped, update remaining time to new template duration
         if self.timer.status == TimerStatus.STOPPED:
-            self.timer.remaining_time = template.duration
+            self.timer.remaining_seconds = template.duration_seconds
             self._update_display()
 
+    def reset(self):
+        """Clear the blink border before the widget is pooled for reuse."""
+        self.list_item.set_blink_border(False)
+
+    def rebind(self, timer: TimerInstance, template: TimerTemplate):
+        """
+        Bind a pooled widget to another timer.
+
+        Args:
+            timer: TimerInstance to display
+            template: Associated TimerTemplate
+        """
+        self.timer = timer
+        self.template = template
+        self.list_item.rebind(timer, template)
+        self._update_display()
+
     def set_highlight(self, highlight: bool):
         """
         Set highlight state for timer completion animation.
@@ -151,27 +164,15 @@ class TimerItem(QWidget):
         """
         self.list_item.set_highlight(highlight)
 
-    def start_completion_blink(self):
-        """Start border blinking animation for timer completion."""
-        print(f"[DEBUG] start_completion_blink called for timer {self.timer.id}")
-        self.blink_state = False
-        self.blink_timer.start(500)  # Blink every 0.5s
-        self._toggle_blink()
-        print(f"[DEBUG] Blink timer started, initial state: {self.blink_state}")
-
-    def stop_completion_blink(self):
-        """Stop border blinking animation."""
-        self.blink_timer.stop()
-        self.list_item.set_blink_border(False)
+    def set_blink_border(self, on: bool):
+        """
+        Show or hide the completion border (toggled by the panel's BlinkGroup).
 
-    def _toggle_blink(self):
-        """Toggle blink state."""
-        self.blink_state = not self.blink_state
-        print(f"[DEBUG] _toggle_blink: blink_state = {self.blink_state}")
-        self.list_item.set_blink_border(self.blink_state)
+        Args:
+            on: Whether the border is shown
+        """
+        self.list_item.set_blink_border(on)
 
     def _on_timer_clicked(self):
-        """Handle timer item click - stop blinking and sound."""
-        self.stop_completion_blink()
-        # Notify parent panel to stop alert sound
+        """Handle timer item click - the panel stops blinking and sound."""
         self.timer_clicked.emit(str(self.timer.id))
@@ -1,16 +1,32 @@
 """
 Dialog windows for Timer For Ryu application.
+
+Dialogs are imported on first attribute access (PEP 562); they are not
+needed until the startup rows are loaded (DialogManager.prewarm()) or the
+user opens one.
 """
-from ui.dialogs.base_dialog import BaseDialog
-from ui.dialogs.template_dialog import TemplateDialog
-from ui.dialogs.create_timer_dialog import CreateTimerDialog
-from ui.dialogs.edit_timer_dialog import EditTimerDialog
-from ui.dialogs.delete_template_dialog import DeleteTemplateDialog
+import importlib
+
+_EXPORTS = {
+    'BaseDialog': 'ui.dialogs.base_dialog',
+    'TemplateDialog': 'ui.dialogs.template_dialog',
+    'CreateTimerDialog': 'ui.dialogs.create_timer_dialog',
+    'EditTimerDialog': 'ui.dialogs.edit_timer_dialog',
+    'DeleteTemplateDialog': 'ui.dialogs.delete_template_dialog',
+    'DialogManager': 'ui.dialogs.manager',
+}
 
 __all__ = [
     'BaseDialog',
     'TemplateDialog',
     'CreateTimerDialog',
     'EditTimerDialog',
-    'DeleteTemplateDialog'
+    'DeleteTemplateDialog',
+    'DialogManager'
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
@@ -1,10 +1,10 @@
 """
 Base dialog class with common functionality.
 
-Version: 1.0.0
+Version: 1.0.1
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from PySide6.QtWidgets import QDialog, QGridLayout, QHBoxLayout, QMessageBox, QPushButton
 
@@ -35,7 +35,6 @@ class BaseDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
-        self.setStyleSheet(Theme.Styles.dialog())
 
     def _create_form_layout(self) -> QGridLayout:
         """
@@ -96,17 +95,7 @@ class BaseDialog(QDialog):
         btn = QPushButton(text)
         btn.setFixedSize(self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
         btn.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #95a5a6;
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-        """)
+        btn.setObjectName("cancelButton")
         return btn
 
     def _create_primary_button(self, text: str) -> QPushButton:
@@ -122,17 +111,7 @@ class BaseDialog(QDialog):
         btn = QPushButton(text)
         btn.setFixedSize(self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
         btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.PRIMARY};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.PRIMARY_HOVER};
-            }}
-        """)
+        btn.setObjectName("primaryButton")
         return btn
 
     def _create_danger_button(self, text: str) -> QPushButton:
@@ -148,17 +127,7 @@ class BaseDialog(QDialog):
         btn = QPushButton(text)
         btn.setFixedSize(self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
         btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.DANGER};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.DANGER_HOVER};
-            }}
-        """)
+        btn.setObjectName("dangerButton")
         return btn
 
     def _show_warning(self, title: str, message: str):
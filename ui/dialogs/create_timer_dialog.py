@@ -1,39 +1,63 @@
 """
 Create timer from template dialog.
 
-Version: 1.0.0
+Version: 1.0.3
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
+from typing import Optional
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
 
 from models.template import TimerTemplate
+from ui.font_loader import ensure_glyphs
 from ui.theme import Theme
 
 
 class CreateTimerDialog(QDialog):
     """Dialog for creating a timer from a template."""
 
-    def __init__(self, template: TimerTemplate, parent=None):
+    def __init__(self, template: Optional[TimerTemplate] = None, parent=None):
         """
         Initialize create timer dialog.
 
         Args:
-            template: Template to create timer from
+            template: Template to create timer from (None to bind later via rebind())
             parent: Parent widget
         """
         super().__init__(parent)
         self.template = template
         self._init_ui()
+        if template is not None:
+            self.rebind(template)
+
+    def rebind(self, template: TimerTemplate):
+        """
+        Reset the dialog for a new timer from a template (reused dialogs).
+
+        Args:
+            template: Template to create timer from
+        """
+        self.template = template
+        self.validated_customer_name = None
+
+        total_seconds = int(template.duration.total_seconds())
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        ensure_glyphs(template.name)
+        self.template_value.setText(template.name)
+        self.duration_value.setText(f"{minutes:02d} : {seconds:02d}")
+
+        self.name_input.clear()
+        self.name_input.setFocus()
 
     def _init_ui(self):
         """Initialize UI components."""
         self.setWindowTitle("타이머 생성")
         self.setModal(True)
         self.setFixedSize(450, 200)
-        self.setStyleSheet(Theme.Styles.dialog())
 
         layout = QVBoxLayout()
         layout.setSpacing(Theme.Spacing.PADDING_XLARGE + 4)  # 20px
@@ -47,41 +71,36 @@ class CreateTimerDialog(QDialog):
         # Template Name Row (read-only)
         template_label = QLabel("템플릿")
         template_label.setFont(Theme.Fonts.label())
-        template_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        template_label.setProperty("role", "primary")
         form_layout.addWidget(template_label, 0, 0, Qt.AlignmentFlag.AlignRight)
 
-        template_value = QLabel(self.template.name)
-        template_value.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        template_value.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
-        form_layout.addWidget(template_value, 0, 1)
+        self.template_value = QLabel()
+        self.template_value.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
+        self.template_value.setProperty("role", "primary")
+        form_layout.addWidget(self.template_value, 0, 1)
 
         # Duration Row (read-only)
-        total_seconds = int(self.template.duration.total_seconds())
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-
         duration_label = QLabel("타이머 시간")
         duration_label.setFont(Theme.Fonts.label())
-        duration_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        duration_label.setProperty("role", "primary")
         form_layout.addWidget(duration_label, 1, 0, Qt.AlignmentFlag.AlignRight)
 
-        duration_value = QLabel(f"{minutes:02d} : {seconds:02d}")
-        duration_value.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        duration_value.setStyleSheet(f"color: {Theme.Colors.TEXT_SECONDARY};")
-        form_layout.addWidget(duration_value, 1, 1)
+        self.duration_value = QLabel()
+        self.duration_value.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
+        self.duration_value.setProperty("role", "secondary")
+        form_layout.addWidget(self.duration_value, 1, 1)
 
         # Customer Name Row
         name_label = QLabel("고객명")
         name_label.setFont(Theme.Fonts.label())
-        name_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        name_label.setProperty("role", "primary")
         form_layout.addWidget(name_label, 2, 0, Qt.AlignmentFlag.AlignRight)
 
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("고객명 입력")
         self.name_input.setFont(Theme.Fonts.input())
-        self.name_input.setStyleSheet(Theme.Styles.input_field())
         self.name_input.returnPressed.connect(self._on_create)  # Enter key triggers create
-        self.name_input.setFocus()
+        self.name_input.textChanged.connect(ensure_glyphs)  # Load full fonts for rare characters
         form_layout.addWidget(self.name_input, 2, 1)
 
         layout.addLayout(form_layout)
@@ -94,34 +113,14 @@ class CreateTimerDialog(QDialog):
         cancel_btn = QPushButton("취소")
         cancel_btn.setFixedSize(100, 35)
         cancel_btn.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #95a5a6;
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         create_btn = QPushButton("생성")
         create_btn.setFixedSize(100, 35)
         create_btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        create_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.PRIMARY};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.PRIMARY_HOVER};
-            }}
-        """)
+        create_btn.setObjectName("primaryButton")
         create_btn.clicked.connect(self._on_create)
         button_layout.addWidget(create_btn)
 
@@ -1,10 +1,10 @@
 """
 Delete template confirmation dialog.
 
-Version: 1.0.1
+Version: 1.0.2
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from typing import List
 
@@ -43,7 +43,6 @@ class DeleteTemplateDialog(QDialog):
         self.setWindowTitle("템플릿 삭제")
         self.setModal(True)
         self.setFixedWidth(450)
-        self.setStyleSheet(Theme.Styles.dialog())
 
         layout = QVBoxLayout()
         layout.setSpacing(Theme.Spacing.PADDING_XLARGE)
@@ -53,11 +52,11 @@ class DeleteTemplateDialog(QDialog):
         if self.associated_timers:
             title = QLabel("⚠️ 템플릿 삭제 경고")
             title.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_LARGE + 1))
-            title.setStyleSheet(f"color: {Theme.Colors.DANGER};")
+            title.setProperty("role", "danger")
         else:
             title = QLabel("템플릿 삭제")
             title.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_LARGE + 1))
-            title.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+            title.setProperty("role", "primary")
 
         layout.addWidget(title)
 
@@ -74,7 +73,8 @@ class DeleteTemplateDialog(QDialog):
             )
 
         message.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_NORMAL))
-        message.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY}; padding: 10px 0;")
+        message.setObjectName("deleteMessage")
+        message.setProperty("role", "primary")
         message.setWordWrap(True)
         layout.addWidget(message)
 
@@ -94,28 +94,26 @@ class DeleteTemplateDialog(QDialog):
 
                 timer_label = QLabel(f"• {timer.customer_name} ({time_str})")
                 timer_label.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_NORMAL - 1))
-                timer_label.setStyleSheet(f"color: {Theme.Colors.TEXT_SECONDARY}; padding: 2px;")
+                timer_label.setObjectName("timerListEntry")
+                timer_label.setProperty("role", "secondary")
                 timer_list_layout.addWidget(timer_label)
 
             timer_list_widget.setLayout(timer_list_layout)
-            timer_list_widget.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {Theme.Colors.BACKGROUND};
-                    border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-                }}
-            """)
+            timer_list_widget.setObjectName("timerListBox")
             layout.addWidget(timer_list_widget)
 
             # Total count
             total_label = QLabel(f"총 {len(self.associated_timers)}개의 타이머가 삭제됩니다")
             total_label.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_NORMAL - 1))
-            total_label.setStyleSheet(f"color: {Theme.Colors.DANGER}; padding: 5px 0;")
+            total_label.setObjectName("deleteTotal")
+            total_label.setProperty("role", "danger")
             layout.addWidget(total_label)
 
         # Warning message
         warning = QLabel("이 작업은 되돌릴 수 없습니다.")
         warning.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_NORMAL - 2))
-        warning.setStyleSheet(f"color: {Theme.Colors.TEXT_TERTIARY}; font-style: italic;")
+        warning.setObjectName("deleteWarning")
+        warning.setProperty("role", "tertiary")
         layout.addWidget(warning)
 
         # Buttons
@@ -125,34 +123,14 @@ class DeleteTemplateDialog(QDialog):
         cancel_btn = QPushButton("취소")
         cancel_btn.setFixedSize(100, 35)
         cancel_btn.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #95a5a6;
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         delete_btn = QPushButton("모두 삭제" if self.associated_timers else "삭제")
         delete_btn.setFixedSize(100, 35)
         delete_btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.DANGER};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.DANGER_HOVER};
-            }}
-        """)
+        delete_btn.setObjectName("dangerButton")
         delete_btn.clicked.connect(self.accept)
         button_layout.addWidget(delete_btn)
 
@@ -1,39 +1,128 @@
 """
 Edit timer dialog.
 
-Version: 1.0.0
+Version: 1.0.4
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+Besides the customer name, sets the timer's auto-start schedule: a start
+time ("09:30", the next time the clock shows it) and optionally a repeat
+interval with an end time. Leaving the start time empty removes it.
 """
+from datetime import datetime, time, timedelta
+from typing import Optional
+
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+from PySide6.QtWidgets import (
+    QComboBox, QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+)
 
+from models.base import get_current_time
+from models.schedule import TimerSchedule
 from models.timer import TimerInstance
+from ui.font_loader import ensure_glyphs
 from ui.theme import Theme
 
+# Repeat choices: (label, seconds between starts); the first one is the default
+REPEAT_PRESETS = [
+    ("반복 안 함", 0),
+    ("15분마다", 15 * 60),
+    ("30분마다", 30 * 60),
+    ("1시간마다", 60 * 60),
+]
+
+
+def parse_clock_time(text: str) -> time:
+    """
+    Parse a wall-clock time typed as "HH:MM".
+
+    Args:
+        text: Input text
+
+    Returns:
+        time: Parsed time
+
+    Raises:
+        ValueError: With a message for the user if the text is malformed
+    """
+    hours, _, minutes = text.strip().partition(":")
+    if not hours.isdigit() or not minutes.isdigit() or int(hours) > 23 or int(minutes) > 59:
+        raise ValueError("시각은 09:30 형식으로 입력해주세요")
+    return time(int(hours), int(minutes))
+
+
+def next_occurrence(at: time, after: datetime) -> datetime:
+    """
+    Get the first time the clock shows a time of day at or after a moment.
+
+    Args:
+        at: Time of day
+        after: Earliest result
+
+    Returns:
+        datetime: Today at that time, or tomorrow if it has passed
+    """
+    result = datetime.combine(after.date(), at)
+    return result if result >= after else result + timedelta(days=1)
+
 
 class EditTimerDialog(QDialog):
     """Dialog for editing timer (only when STOPPED)."""
 
-    def __init__(self, timer: TimerInstance, parent=None):
+    def __init__(self, timer: Optional[TimerInstance] = None, parent=None):
         """
         Initialize edit timer dialog.
 
         Args:
-            timer: Timer instance to edit
+            timer: Timer instance to edit (None to bind later via rebind())
             parent: Parent widget
         """
         super().__init__(parent)
         self.timer = timer
         self._init_ui()
+        if timer is not None:
+            self.rebind(timer)
+
+    def rebind(self, timer: TimerInstance, schedule: Optional[TimerSchedule] = None):
+        """
+        Reset the dialog for another timer (reused dialogs).
+
+        Args:
+            timer: Timer instance to edit
+            schedule: The timer's current auto-start schedule, if any
+        """
+        self.timer = timer
+        self.validated_name = None
+        self.validated_schedule = None
+        self.name_input.setText(timer.customer_name)
+        self.name_input.setFocus()
+
+        # Drop a custom repeat entry left from the previous timer
+        while self.repeat_input.count() > len(REPEAT_PRESETS):
+            self.repeat_input.removeItem(self.repeat_input.count() - 1)
+
+        if schedule is not None:
+            self.start_input.setText(schedule.next_at.strftime("%H:%M"))
+            index = self.repeat_input.findData(schedule.interval_seconds)
+            if index < 0:
+                # Keep an interval set outside the presets
+                self.repeat_input.addItem(f"{schedule.interval_seconds // 60}분마다", schedule.interval_seconds)
+                index = self.repeat_input.count() - 1
+            self.repeat_input.setCurrentIndex(index)
+            until_at = schedule.until_at
+            self.until_input.setText(until_at.strftime("%H:%M") if until_at else "")
+        else:
+            self.start_input.clear()
+            self.repeat_input.setCurrentIndex(0)
+            self.until_input.clear()
+        self._on_repeat_changed()
 
     def _init_ui(self):
         """Initialize UI components."""
         self.setWindowTitle("타이머 수정")
         self.setModal(True)
-        self.setFixedSize(450, 150)
-        self.setStyleSheet(Theme.Styles.dialog())
+        self.setFixedSize(450, 240)
 
         layout = QVBoxLayout()
         layout.setSpacing(Theme.Spacing.PADDING_XLARGE + 4)  # 20px
@@ -47,18 +136,65 @@ class EditTimerDialog(QDialog):
         # Customer Name Row
         name_label = QLabel("고객명")
         name_label.setFont(Theme.Fonts.label())
-        name_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        name_label.setProperty("role", "primary")
         form_layout.addWidget(name_label, 0, 0, Qt.AlignmentFlag.AlignRight)
 
         self.name_input = QLineEdit()
-        self.name_input.setText(self.timer.customer_name)
         self.name_input.setPlaceholderText("고객명 입력")
         self.name_input.setFont(Theme.Fonts.input())
-        self.name_input.setStyleSheet(Theme.Styles.input_field())
         self.name_input.returnPressed.connect(self._on_save)  # Enter key triggers save
-        self.name_input.setFocus()
+        self.name_input.textChanged.connect(ensure_glyphs)  # Load full fonts for rare characters
         form_layout.addWidget(self.name_input, 0, 1)
 
+        # Auto-start Row
+        start_label = QLabel("자동 시작")
+        start_label.setFont(Theme.Fonts.label())
+        start_label.setProperty("role", "primary")
+        form_layout.addWidget(start_label, 1, 0, Qt.AlignmentFlag.AlignRight)
+
+        start_layout = QHBoxLayout()
+        start_layout.setSpacing(Theme.Spacing.MARGIN_MEDIUM)
+        self.start_input = QLineEdit()
+        self.start_input.setPlaceholderText("HH:MM")
+        self.start_input.setMaxLength(5)
+        self.start_input.setFixedWidth(Theme.Spacing.INPUT_WIDTH_SMALL + 20)
+        self.start_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.start_input.setFont(Theme.Fonts.input())
+        self.start_input.returnPressed.connect(self._on_save)  # Enter key triggers save
+        start_layout.addWidget(self.start_input)
+        start_layout.addStretch()
+        form_layout.addLayout(start_layout, 1, 1)
+
+        # Repeat Row
+        repeat_label = QLabel("반복")
+        repeat_label.setFont(Theme.Fonts.label())
+        repeat_label.setProperty("role", "primary")
+        form_layout.addWidget(repeat_label, 2, 0, Qt.AlignmentFlag.AlignRight)
+
+        repeat_layout = QHBoxLayout()
+        repeat_layout.setSpacing(Theme.Spacing.MARGIN_MEDIUM)
+        self.repeat_input = QComboBox()
+        self.repeat_input.setFont(Theme.Fonts.input())
+        for label, seconds in REPEAT_PRESETS:
+            self.repeat_input.addItem(label, seconds)
+        self.repeat_input.currentIndexChanged.connect(self._on_repeat_changed)
+        repeat_layout.addWidget(self.repeat_input)
+
+        self.until_input = QLineEdit()
+        self.until_input.setPlaceholderText("HH:MM")
+        self.until_input.setMaxLength(5)
+        self.until_input.setFixedWidth(Theme.Spacing.INPUT_WIDTH_SMALL + 20)
+        self.until_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.until_input.setFont(Theme.Fonts.input())
+        self.until_input.returnPressed.connect(self._on_save)  # Enter key triggers save
+        repeat_layout.addWidget(self.until_input)
+
+        until_label = QLabel("까지")
+        until_label.setFont(Theme.Fonts.label())
+        until_label.setProperty("role", "primary")
+        repeat_layout.addWidget(until_label)
+        form_layout.addLayout(repeat_layout, 2, 1)
+
         layout.addLayout(form_layout)
         layout.addStretch()
 
@@ -69,34 +205,14 @@ class EditTimerDialog(QDialog):
         cancel_btn = QPushButton("취소")
         cancel_btn.setFixedSize(100, 35)
         cancel_btn.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #95a5a6;
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("저장")
         save_btn.setFixedSize(100, 35)
         save_btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.PRIMARY};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.PRIMARY_HOVER};
-            }}
-        """)
+        save_btn.setObjectName("primaryButton")
         save_btn.clicked.connect(self._on_save)
         button_layout.addWidget(save_btn)
 
@@ -111,11 +227,48 @@ class EditTimerDialog(QDialog):
             QMessageBox.warning(self, "입력 오류", "고객명을 입력해주세요.")
             return
 
+        # Validate auto-start schedule
+        try:
+            schedule = self._read_schedule()
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
+
         # Store validated data
         self.validated_name = name
+        self.validated_schedule = schedule
 
         self.accept()
 
+    def _on_repeat_changed(self):
+        """Only repeating schedules have an end time."""
+        self.until_input.setEnabled(bool(self.repeat_input.currentData()))
+
+    def _read_schedule(self) -> Optional[TimerSchedule]:
+        """
+        Build the schedule from the inputs.
+
+        Returns:
+            TimerSchedule or None if no start time is set
+
+        Raises:
+            ValueError: With a message for the user if an input is invalid
+        """
+        start_text = self.start_input.text().strip()
+        if not start_text:
+            return None
+        start_at = next_occurrence(parse_clock_time(start_text), get_current_time())
+
+        interval_seconds = self.repeat_input.currentData()
+        until = None
+        until_text = self.until_input.text().strip()
+        if interval_seconds and until_text:
+            until = next_occurrence(parse_clock_time(until_text), start_at)
+        return TimerSchedule.create(
+            self.timer.id, start_at,
+            timedelta(seconds=interval_seconds) if interval_seconds else None, until
+        )
+
     def get_customer_name(self) -> str:
         """
         Get validated customer name.
@@ -124,3 +277,12 @@ class EditTimerDialog(QDialog):
             str: Customer name
         """
         return self.validated_name
+
+    def get_schedule(self) -> Optional[TimerSchedule]:
+        """
+        Get the validated auto-start schedule.
+
+        Returns:
+            TimerSchedule or None to remove the timer's schedule
+        """
+        return self.validated_schedule
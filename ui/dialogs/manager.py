@@ -0,0 +1,120 @@
+"""
+Reusable dialogs: one instance per dialog class, rebound per use.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Building a dialog (layouts, fonts, style polish, native window) costs more
+than showing it. DialogManager keeps each dialog after its first use and
+hands it out again reset for the next model, and prewarm() builds dialogs
+ahead of time, one per event loop pass, so even the first click only shows
+a ready window.
+
+Reusable dialogs implement:
+    rebind(model)        - Reset inputs and show a new model
+
+Usage:
+    from ui.dialogs.create_timer_dialog import CreateTimerDialog
+    from ui.dialogs.manager import DialogManager
+
+    dialogs = DialogManager(window)
+    dialogs.prewarm([CreateTimerDialog])          # After startup
+    dialog = dialogs.get(CreateTimerDialog, template)
+    if dialog.exec():
+        ...
+"""
+from typing import Dict, Iterable, NamedTuple, Type, TypeVar
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QDialog, QWidget
+
+from ui.utils.startup import ChunkedLoader
+
+D = TypeVar('D', bound=QDialog)
+
+PREWARM_BUDGET_MS = 1.0  # Yield after every dialog (each takes a few ms to build)
+
+
+class DialogStats(NamedTuple):
+    """Dialog reuse counters."""
+    built: int  # Dialogs constructed
+    prewarmed: int  # Of those, built by prewarm()
+    hits: int  # get() calls served by an existing dialog
+    misses: int  # get() calls that had to build the dialog
+
+
+class DialogManager(QObject):
+    """Build each dialog class once and rebind it for every use."""
+
+    def __init__(self, parent: QWidget):
+        """
+        Initialize dialog manager.
+
+        Args:
+            parent: Parent widget of the managed dialogs
+        """
+        super().__init__(parent)
+        self._parent = parent
+        self._dialogs: Dict[type, QDialog] = {}
+        self._loader = None
+        self._prewarmed = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, dialog_class: Type[D], *model) -> D:
+        """
+        Get the dialog of a class, rebound to a model.
+
+        Args:
+            dialog_class: Dialog class (constructor takes parent=..., model optional)
+            *model: Arguments for the dialog's rebind()
+
+        Returns:
+            Dialog ready for exec()
+        """
+        dialog = self._dialogs.get(dialog_class)
+        if dialog is None:
+            self._misses += 1
+            dialog = self._build(dialog_class)
+        else:
+            self._hits += 1
+        dialog.rebind(*model)
+        return dialog
+
+    def prewarm(self, dialog_classes: Iterable[Type[QDialog]]):
+        """
+        Build dialogs in the background, one per event loop pass.
+
+        Args:
+            dialog_classes: Dialog classes to build (already built ones are skipped)
+        """
+        self._loader = ChunkedLoader(dialog_classes, self._prewarm_one, PREWARM_BUDGET_MS, parent=self)
+        self._loader.start()
+
+    def stats(self) -> DialogStats:
+        """
+        Get reuse counters.
+
+        Returns:
+            DialogStats: Current counters
+        """
+        return DialogStats(len(self._dialogs), self._prewarmed, self._hits, self._misses)
+
+    def _prewarm_one(self, dialog_class: Type[QDialog]):
+        """Build one dialog unless it already exists."""
+        if dialog_class not in self._dialogs:
+            self._build(dialog_class)
+            self._prewarmed += 1
+
+    def _build(self, dialog_class: Type[D]) -> D:
+        """Construct a dialog and do its one-time setup before it is shown."""
+        dialog = dialog_class(parent=self._parent)
+        dialog.ensurePolished()
+        for child in dialog.findChildren(QWidget):
+            child.ensurePolished()  # Resolve style sheet rules and fonts
+        dialog.layout().activate()
+        dialog.winId()  # Create the native window now rather than on first show
+        self._dialogs[dialog_class] = dialog
+        return dialog
@@ -1,19 +1,87 @@
 """
 Add/Edit template dialog.
 
-Version: 1.0.1
+Version: 1.0.8
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from datetime import timedelta
-from typing import Optional
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+from PySide6.QtWidgets import (
+    QComboBox, QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit, QMessageBox, QPushButton, QVBoxLayout
+)
 
-from models.template import TimerTemplate
+from models.enums import AlertPattern
+from models.template import MAX_WARNING_STAGES, TimerTemplate, chain_loops, normalize_warnings
+from ui.font_loader import ensure_glyphs
 from ui.theme import Theme
+from ui.utils.tones import Tone
+
+# Alert tone choices: (label, tone); the first one is the default
+ALERT_TONE_PRESETS = [
+    ("기본", Tone(800, AlertPattern.SINGLE)),
+    ("높은 음", Tone(1200, AlertPattern.SINGLE)),
+    ("낮은 음", Tone(500, AlertPattern.SINGLE)),
+    ("두 번 울림", Tone(800, AlertPattern.DOUBLE)),
+    ("세 번 울림", Tone(1000, AlertPattern.TRIPLE)),
+]
+PATTERN_LABELS = {AlertPattern.SINGLE: "한 번", AlertPattern.DOUBLE: "두 번", AlertPattern.TRIPLE: "세 번"}
+
+
+def format_warning_input(stages: Tuple[int, ...]) -> str:
+    """Warning stages as typed in the dialog ("2:00, 0:30")."""
+    return ", ".join(f"{stage // 60}:{stage % 60:02d}" for stage in stages)
+
+
+def find_item_data(combo: QComboBox, value) -> int:
+    """
+    Find a combo box item whose data equals value.
+
+    QComboBox.findData() compares Python objects by identity, so an equal
+    Tone or UUID built elsewhere would not match.
+
+    Args:
+        combo: Combo box to search
+        value: Item data to look for
+
+    Returns:
+        int: Index of the first matching item, or -1
+    """
+    return next((i for i in range(combo.count()) if combo.itemData(i) == value), -1)
+
+
+def parse_warning_input(text: str) -> Tuple[int, ...]:
+    """
+    Parse warning times typed as "M:SS" separated by commas.
+
+    Args:
+        text: Input text ("" for none)
+
+    Returns:
+        tuple: Seconds before the end, largest first
+
+    Raises:
+        ValueError: With a message for the user if the text is malformed
+    """
+    stages = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        minutes, _, seconds = part.rpartition(":")
+        if not seconds.isdigit() or (minutes and not minutes.isdigit()) or int(seconds) > 59:
+            raise ValueError("사전 알림은 2:00, 0:30 형식으로 입력해주세요")
+        stages.append(int(minutes or 0) * 60 + int(seconds))
+    if len(set(stages)) > MAX_WARNING_STAGES:
+        raise ValueError(f"사전 알림은 {MAX_WARNING_STAGES}개까지 설정할 수 있습니다")
+    try:
+        return normalize_warnings(stages)
+    except ValueError:
+        raise ValueError("사전 알림 시간은 0보다 커야 합니다") from None
 
 
 class TemplateDialog(QDialog):
@@ -28,16 +96,66 @@ class TemplateDialog(QDialog):
             parent: Parent widget
         """
         super().__init__(parent)
+        self._init_ui()
+        self.rebind(template)
+
+    def rebind(self, template: Optional[TimerTemplate] = None, templates: Iterable[TimerTemplate] = ()):
+        """
+        Reset the dialog for adding or editing a template (reused dialogs).
+
+        Args:
+            template: Existing template to edit (None for new template)
+            templates: All templates, offered as the next chain stage
+        """
         self.template = template
         self.is_edit_mode = template is not None
-        self._init_ui()
+        self.templates = {other.id: other for other in templates}
+        self.validated_name = None
+        self.validated_duration = None
+        self.validated_tone = None
+        self.validated_warnings = ()
+        self.validated_next_template_id = None
+        self.setWindowTitle("템플릿 수정" if self.is_edit_mode else "새 템플릿 추가")
+
+        # Next stage choices: none, then every other template
+        self.next_input.clear()
+        self.next_input.addItem("없음 (완료)", None)
+        for other in self.templates.values():
+            if template is None or other.id != template.id:
+                self.next_input.addItem(other.name, other.id)
+
+        # Drop a custom tone entry left from the previous template
+        while self.tone_input.count() > len(ALERT_TONE_PRESETS):
+            self.tone_input.removeItem(self.tone_input.count() - 1)
+
+        if template:
+            total_seconds = int(template.duration.total_seconds())
+            self.name_input.setText(template.name)
+            self.minutes_input.setText(f"{total_seconds // 60:02d}")
+            self.seconds_input.setText(f"{total_seconds % 60:02d}")
+
+            tone = Tone.for_template(template)
+            index = find_item_data(self.tone_input, tone)
+            if index < 0:
+                # Keep a tone set outside the presets
+                self.tone_input.addItem(f"사용자 지정 ({tone.frequency}Hz, {PATTERN_LABELS[tone.pattern]})", tone)
+                index = self.tone_input.count() - 1
+            self.tone_input.setCurrentIndex(index)
+            self.warning_input.setText(format_warning_input(template.warning_seconds))
+            self.next_input.setCurrentIndex(max(0, find_item_data(self.next_input, template.next_template_id)))
+        else:
+            # Default: 5 minutes 00 seconds
+            self.name_input.clear()
+            self.minutes_input.setText("05")
+            self.seconds_input.setText("00")
+            self.tone_input.setCurrentIndex(0)
+            self.warning_input.clear()
+            self.next_input.setCurrentIndex(0)
 
     def _init_ui(self):
         """Initialize UI components."""
-        self.setWindowTitle("템플릿 수정" if self.is_edit_mode else "새 템플릿 추가")
         self.setModal(True)
-        self.setFixedSize(450, 180)
-        self.setStyleSheet(Theme.Styles.dialog())
+        self.setFixedSize(450, 320)
 
         layout = QVBoxLayout()
         layout.setSpacing(Theme.Spacing.PADDING_XLARGE + 4)  # 20px
@@ -51,32 +169,20 @@ class TemplateDialog(QDialog):
         # Template Name Row
         name_label = QLabel("템플릿 이름")
         name_label.setFont(Theme.Fonts.label())
-        name_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Theme.Colors.TEXT_PRIMARY};
-                background-color: transparent;
-            }}
-        """)
+        name_label.setProperty("role", "primary")
         form_layout.addWidget(name_label, 0, 0, Qt.AlignmentFlag.AlignRight)
 
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("템플릿 이름 입력")
         self.name_input.setFont(Theme.Fonts.input())
-        self.name_input.setStyleSheet(Theme.Styles.input_field())
         self.name_input.returnPressed.connect(self._on_save)  # Enter key triggers save
-        if self.template:
-            self.name_input.setText(self.template.name)
+        self.name_input.textChanged.connect(ensure_glyphs)  # Load full fonts for rare characters
         form_layout.addWidget(self.name_input, 0, 1)
 
         # Duration Row
         duration_label = QLabel("타이머 시간")
         duration_label.setFont(Theme.Fonts.label())
-        duration_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Theme.Colors.TEXT_PRIMARY};
-                background-color: transparent;
-            }}
-        """)
+        duration_label.setProperty("role", "primary")
         form_layout.addWidget(duration_label, 1, 0, Qt.AlignmentFlag.AlignRight)
 
         # Duration input layout
@@ -89,17 +195,11 @@ class TemplateDialog(QDialog):
         self.minutes_input.setFixedWidth(Theme.Spacing.INPUT_WIDTH_SMALL)
         self.minutes_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.minutes_input.setFont(Theme.Fonts.input())
-        self.minutes_input.setStyleSheet(Theme.Styles.input_field())
         self.minutes_input.returnPressed.connect(self._on_save)  # Enter key triggers save
 
         colon_label = QLabel(":")
         colon_label.setFont(Theme.Fonts.bold(16))
-        colon_label.setStyleSheet(f"""
-            QLabel {{
-                color: {Theme.Colors.TEXT_PRIMARY};
-                background-color: transparent;
-            }}
-        """)
+        colon_label.setProperty("role", "primary")
 
         self.seconds_input = QLineEdit()
         self.seconds_input.setPlaceholderText("SS")
@@ -107,20 +207,8 @@ class TemplateDialog(QDialog):
         self.seconds_input.setFixedWidth(Theme.Spacing.INPUT_WIDTH_SMALL)
         self.seconds_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.seconds_input.setFont(Theme.Fonts.input())
-        self.seconds_input.setStyleSheet(Theme.Styles.input_field())
         self.seconds_input.returnPressed.connect(self._on_save)  # Enter key triggers save
 
-        if self.template:
-            total_seconds = int(self.template.duration.total_seconds())
-            minutes = total_seconds // 60
-            seconds = total_seconds % 60
-            self.minutes_input.setText(f"{minutes:02d}")
-            self.seconds_input.setText(f"{seconds:02d}")
-        else:
-            # Default: 5 minutes 00 seconds
-            self.minutes_input.setText("05")
-            self.seconds_input.setText("00")
-
         duration_layout.addWidget(self.minutes_input)
         duration_layout.addWidget(colon_label)
         duration_layout.addWidget(self.seconds_input)
@@ -128,6 +216,40 @@ class TemplateDialog(QDialog):
 
         form_layout.addLayout(duration_layout, 1, 1)
 
+        # Alert Tone Row
+        tone_label = QLabel("알림음")
+        tone_label.setFont(Theme.Fonts.label())
+        tone_label.setProperty("role", "primary")
+        form_layout.addWidget(tone_label, 2, 0, Qt.AlignmentFlag.AlignRight)
+
+        self.tone_input = QComboBox()
+        self.tone_input.setFont(Theme.Fonts.input())
+        for label, tone in ALERT_TONE_PRESETS:
+            self.tone_input.addItem(f"{label} ({tone.frequency}Hz)", tone)
+        form_layout.addWidget(self.tone_input, 2, 1)
+
+        # Pre-expiry Warning Row
+        warning_label = QLabel("사전 알림")
+        warning_label.setFont(Theme.Fonts.label())
+        warning_label.setProperty("role", "primary")
+        form_layout.addWidget(warning_label, 3, 0, Qt.AlignmentFlag.AlignRight)
+
+        self.warning_input = QLineEdit()
+        self.warning_input.setPlaceholderText("예: 2:00, 0:30 (남은 시간)")
+        self.warning_input.setFont(Theme.Fonts.input())
+        self.warning_input.returnPressed.connect(self._on_save)  # Enter key triggers save
+        form_layout.addWidget(self.warning_input, 3, 1)
+
+        # Chain Row: template started when this one runs out
+        next_label = QLabel("다음 단계")
+        next_label.setFont(Theme.Fonts.label())
+        next_label.setProperty("role", "primary")
+        form_layout.addWidget(next_label, 4, 0, Qt.AlignmentFlag.AlignRight)
+
+        self.next_input = QComboBox()
+        self.next_input.setFont(Theme.Fonts.input())
+        form_layout.addWidget(self.next_input, 4, 1)
+
         layout.addLayout(form_layout)
         layout.addStretch()
 
@@ -138,42 +260,14 @@ class TemplateDialog(QDialog):
         cancel_btn = QPushButton("취소")
         cancel_btn.setFixedSize(100, 35)
         cancel_btn.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #95a5a6;
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-                font-family: {Theme.Fonts.FAMILY_FALLBACK};
-            }}
-            QPushButton:hover {{
-                background-color: #7f8c8d;
-            }}
-            QPushButton:focus {{
-                outline: none;
-            }}
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("저장")
         save_btn.setFixedSize(100, 35)
         save_btn.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_MEDIUM))
-        save_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.PRIMARY};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-                font-family: {Theme.Fonts.FAMILY_FALLBACK};
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.PRIMARY_HOVER};
-            }}
-            QPushButton:focus {{
-                outline: none;
-            }}
-        """)
+        save_btn.setObjectName("primaryButton")
         save_btn.clicked.connect(self._on_save)
         button_layout.addWidget(save_btn)
 
@@ -214,17 +308,39 @@ class TemplateDialog(QDialog):
             QMessageBox.warning(self, "입력 오류", str(e))
             return
 
+        # Validate pre-expiry warnings
+        try:
+            warnings = parse_warning_input(self.warning_input.text())
+            if warnings and warnings[0] >= duration.total_seconds():
+                raise ValueError("사전 알림 시간은 타이머 시간보다 짧아야 합니다")
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+            return
+
+        # Validate chain (a loop would never complete)
+        next_template_id = self.next_input.currentData()
+        if self.is_edit_mode and chain_loops(self.template.id, next_template_id, self.templates):
+            QMessageBox.warning(self, "입력 오류", "다음 단계가 이 템플릿으로 다시 돌아옵니다.")
+            return
+
         # Store validated data
         self.validated_name = name
         self.validated_duration = duration
+        self.validated_tone = self.tone_input.currentData()
+        self.validated_warnings = warnings
+        self.validated_next_template_id = next_template_id
 
         self.accept()
 
-    def get_template_data(self) -> tuple[str, timedelta]:
+    def get_template_data(self) -> tuple[str, timedelta, Tone, Tuple[int, ...], Optional[UUID]]:
         """
         Get validated template data.
 
         Returns:
-            tuple: (name, duration)
+            tuple: (name, duration, alert tone, warning seconds before the end,
+                next chain stage template ID or None)
         """
-        return self.validated_name, self.validated_duration
+        return (
+            self.validated_name, self.validated_duration, self.validated_tone, self.validated_warnings,
+            self.validated_next_template_id
+        )
@@ -1,61 +1,49 @@
 """
 Font loader utility for loading custom fonts.
 
-Version: 1.0.2
+Version: 1.0.4
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-20
+Last Modified: 2026-10-19
+
+Startup registers the trimmed "Pretendard UI" fonts built by
+subset_fonts.py. The full Pretendard fonts are registered on first use,
+when ensure_glyphs() sees text with a character outside the subset; Qt then
+draws those characters from "Pretendard" (the next family in the theme's
+font stack). Without subset fonts the full fonts are loaded at startup.
 
 Usage:
-    from ui.font_loader import load_fonts
+    from ui.font_loader import ensure_glyphs, load_fonts
 
     # Load fonts before creating QApplication
     loaded_fonts = load_fonts()
     print(f"Loaded fonts: {loaded_fonts}")
+
+    ensure_glyphs(timer.customer_name)   # Before showing user-entered text
 """
-import sys
-from pathlib import Path
-from PySide6.QtGui import QFontDatabase
+from typing import List, Optional
 
+from PySide6.QtGui import QFont, QFontDatabase, QRawFont
+from ui.utils.assets import asset_exists, asset_path
 
-def load_fonts():
-    """
-    Load custom fonts into the application.
+SUBSET_FAMILY = "Pretendard UI"
+SUBSET_FONTS = ["PretendardUI-Regular.otf", "PretendardUI-Bold.otf"]
+FULL_FONTS = ["Pretendard-Regular.otf", "Pretendard-Bold.otf"]
 
-    This function loads Pretendard fonts from the assets/fonts directory.
-    Call this function once during application initialization.
+# Subset font used to test coverage; None once the full fonts are registered
+_subset_font: Optional[QRawFont] = None
 
-    Returns:
-        list: List of loaded font family names
-    """
-    # PyInstaller creates a temp folder and stores path in _MEIPASS
-    if getattr(sys, 'frozen', False):
-        # Running in a PyInstaller bundle
-        base_path = Path(sys._MEIPASS)
-        print(f"[FONT] Running in PyInstaller bundle, base_path: {base_path}")
-    else:
-        # Running in normal Python environment
-        base_path = Path(__file__).parent.parent
-        print(f"[FONT] Running in development mode, base_path: {base_path}")
-
-    font_dir = base_path / "assets" / "fonts"
-    print(f"[FONT] Font directory: {font_dir}")
-    print(f"[FONT] Font directory exists: {font_dir.exists()}")
-
-    fonts_to_load = [
-        "Pretendard-Regular.otf",
-        "Pretendard-Bold.otf"
-    ]
 
+def _add_fonts(font_files: List[str]) -> List[str]:
+    """Register font files from assets/fonts and return their family names."""
     loaded_fonts = []
 
-    for font_file in fonts_to_load:
-        font_path = font_dir / font_file
+    for font_file in font_files:
+        font_path = asset_path(f"fonts/{font_file}")
         print(f"[FONT] Attempting to load: {font_path}")
-        print(f"[FONT] File exists: {font_path.exists()}")
 
-        if font_path.exists():
-            font_id = QFontDatabase.addApplicationFont(str(font_path))
+        if asset_exists(f"fonts/{font_file}"):
+            font_id = QFontDatabase.addApplicationFont(font_path)
             if font_id != -1:
                 font_families = QFontDatabase.applicationFontFamilies(font_id)
                 loaded_fonts.extend(font_families)
@@ -65,5 +53,54 @@ def load_fonts():
         else:
             print(f"[FONT] ⚠️  Font file not found: {font_path}")
 
+    return loaded_fonts
+
+
+def load_fonts(use_subset: bool = True):
+    """
+    Load custom fonts into the application.
+
+    This function loads Pretendard fonts from assets/fonts (resource bundle or files).
+    Call this function once during application initialization.
+
+    Args:
+        use_subset: Register the subset fonts and defer the full fonts
+            (default). False registers the full fonts right away.
+
+    Returns:
+        list: List of loaded font family names
+    """
+    global _subset_font
+
+    loaded_fonts = _add_fonts(SUBSET_FONTS) if use_subset else []
+    if SUBSET_FAMILY in loaded_fonts:
+        _subset_font = QRawFont.fromFont(QFont(SUBSET_FAMILY))
+        print("[FONT] Full fonts deferred until text needs glyphs outside the subset")
+    else:
+        loaded_fonts.extend(_add_fonts(FULL_FONTS))
+
     print(f"[FONT] Total loaded fonts: {loaded_fonts}")
     return loaded_fonts
+
+
+def ensure_glyphs(text: str):
+    """
+    Register the full fonts if text has characters missing from the subset.
+
+    Call before showing text that did not come from the UI sources (customer
+    and template names, input fields). A no-op once the full fonts are loaded.
+
+    Args:
+        text: Text about to be shown
+    """
+    global _subset_font
+
+    if _subset_font is None:
+        return
+    supports = _subset_font.supportsCharacter
+    if all(supports(ord(char)) for char in text if char >= ' '):
+        return
+
+    _subset_font = None
+    print("[FONT] Text needs glyphs outside the subset, loading full fonts")
+    _add_fonts(FULL_FONTS)
@@ -1,35 +1,54 @@
 """
 Main application window.
 
-Version: 1.0.2
+Version: 1.0.18
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 import logging
+import math
+from functools import partial
+from typing import Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QSplitter, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 from services.database import DatabaseService
+from services.scheduler import StartScheduler
+from services.snapshot import get_snapshot_path, read_snapshot, write_snapshot
 from models.base import get_current_time
 from models.template import TimerTemplate
 from models.timer import TimerInstance
-from models.enums import TimerStatus
+from ui.dialogs.manager import DialogManager
+from ui.panels.indexing import ORDER_GAP, RowMove
 from ui.panels.template_panel import TemplatePanel
 from ui.panels.timer_panel import TimerPanel
-from ui.dialogs.template_dialog import TemplateDialog
-from ui.dialogs.delete_template_dialog import DeleteTemplateDialog
-from ui.dialogs.create_timer_dialog import CreateTimerDialog
-from ui.dialogs.edit_timer_dialog import EditTimerDialog
 from ui.theme import Theme
+from ui.utils.render_policy import RenderPolicy
+from ui.utils.startup import BackgroundCall, ChunkedLoader, StartupTimeline, after_first_paint
+from ui.utils.toast import show_toast
 
 logger = logging.getLogger(__name__)
 
+# Longest wait for the next auto-start; QTimer counts monotonic time, so a
+# wall-clock change or sleep is noticed within this many seconds
+SCHEDULE_CHECK_INTERVAL = 300
+
+
+def _persisted_rows(templates, timers_with_templates):
+    """Get the stored fields of rows, for comparing snapshot and database."""
+    return (
+        [template.to_dict() for template in templates],
+        [timer.to_dict() for timer, _ in timers_with_templates]
+    )
+
 
 class MainWindow(QMainWindow):
     """Main application window for Timer For Ryu."""
 
+    initial_data_loaded = Signal()  # Emitted when start_loading() has added every row
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -39,12 +58,28 @@ class MainWindow(QMainWindow):
         # Initialize database service
         self.db = DatabaseService()
 
-        # Initialize UI
+        # Initialize UI (data is loaded by start_loading() after the first paint)
         self._init_ui()
-
-        # Load data from database
-        self._load_templates()
-        self._load_timers()
+        self.snapshot_path = get_snapshot_path(self.db.db_path)
+        self._row_loader: Optional[ChunkedLoader] = None
+        self._database_query: Optional[BackgroundCall] = None
+        self._snapshot_rows = None
+        self._rows_confirmed = False  # Shown rows match the database
+        self._first_rows_shown = False
+        self._timeline: Optional[StartupTimeline] = None
+        self.dialogs = DialogManager(self)  # Dialogs are built once and reused
+
+        # Auto-start schedules; the timer fires only for the next due start
+        self.scheduler = StartScheduler()
+        self._schedule_timer = QTimer(self)
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._schedule_timer.timeout.connect(self._run_due_schedules)
+
+        # Timers are only redrawn while the window can be seen
+        self.render_policy = RenderPolicy(self)
+        self.render_policy.visibility_changed.connect(self.timer_panel.set_rendering)
+        self.timer_panel.set_rendering(self.render_policy.is_visible())
 
     def _init_ui(self):
         """Initialize UI components."""
@@ -70,7 +105,10 @@ class MainWindow(QMainWindow):
         self.timer_panel = TimerPanel()
         self.timer_panel.edit_timer_clicked.connect(self._on_edit_timer)
         self.timer_panel.delete_timer_clicked.connect(self._on_delete_timer)
-        self.timer_panel.timer_completed.connect(self._on_timer_completed)
+        self.timer_panel.timers_completed.connect(self._on_timers_completed)
+        self.timer_panel.timers_warned.connect(self._on_timers_warned)
+        self.timer_panel.stages_advanced.connect(self._on_stages_advanced)
+        self.timer_panel.timer_stages_changed.connect(self._on_timer_stages_changed)
         self.timer_panel.timers_reordered.connect(self._on_timers_reordered)
         self.timer_panel.template_button_update_needed.connect(self._on_template_button_update)
         splitter.addWidget(self.timer_panel)
@@ -82,44 +120,220 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(main_layout)
         self.setCentralWidget(central_widget)
 
-        # Apply global stylesheet
-        self.setStyleSheet(Theme.Styles.main_window())
+        # Window styling comes from Theme.Styles.application() (installed in main.py)
+
+    def start_loading(self, timeline: Optional[StartupTimeline] = None):
+        """
+        Load templates and timers in stages once the event loop is running.
+
+        Call after show(). With a valid startup snapshot its rows are shown
+        right away while the database is queried on a worker thread; if the
+        database turns out to differ, the rows are replaced. Without one, the
+        empty window paints first and the rows come from the database. Rows
+        are added a time slice per event loop pass (templates, then timers).
+
+        Args:
+            timeline: Optional startup timeline to record milestones on
+        """
+        self._timeline = timeline
+        snapshot = read_snapshot(self.snapshot_path, self.db.db_path)
+        if snapshot is None:
+            if self.isVisible():
+                after_first_paint(self, self._on_first_paint)
+            else:
+                QTimer.singleShot(0, self._load_initial_data)
+            return
+
+        self._mark_startup("snapshot")
+        self._snapshot_rows = _persisted_rows(snapshot.templates, snapshot.timers)
+        self._stream_rows(snapshot.templates, snapshot.timers)
+
+        self._database_query = BackgroundCall(self._query_all_rows, parent=self)
+        self._database_query.finished.connect(self._on_database_rows)
+        self._database_query.start()
+
+    def _on_first_paint(self):
+        """Start loading rows once the empty window is on screen."""
+        self._mark_startup("first paint")
+        self._load_initial_data()
+
+    def _load_initial_data(self):
+        """Query the database and stream rows into both panels."""
+        templates, timers_with_templates = self._query_all_rows()
+        self._mark_startup("database")
+        self._rows_confirmed = True
+        self._stream_rows(templates, timers_with_templates)
+
+    def _query_all_rows(self):
+        """Get all templates and timers (safe to call from a worker thread)."""
+        return self.db.get_all_templates(), self.db.get_all_timers()
+
+    def _on_database_rows(self, rows):
+        """
+        Reconcile snapshot rows with the database query result.
+
+        Args:
+            rows: (templates, timers_with_templates) from _query_all_rows()
+        """
+        if self._database_query is None:
+            return  # Superseded by a full reload
+        self._database_query = None
+        self._mark_startup("database")
+        self._rows_confirmed = True
+
+        templates, timers_with_templates = rows
+        if _persisted_rows(templates, timers_with_templates) == self._snapshot_rows:
+            if not self._row_loader.is_active():
+                self._on_initial_data_loaded()
+            return
+
+        logger.info("Startup snapshot differs from database; reloading rows")
+        self._stream_rows(templates, timers_with_templates)
+
+    def _stream_rows(self, templates, timers_with_templates):
+        """Replace both panels' rows, adding them a time slice per event loop pass."""
+        if self._row_loader:
+            self._row_loader.cancel()
+        self.template_panel.clear_templates()
+        self.timer_panel.clear_timers()
+        self.timer_panel.set_templates(templates)
+
+        rows = [partial(self.template_panel.add_template_item, template, emit_signal=False)
+                for template in templates]
+        rows += [partial(self.timer_panel.add_timer_item, timer, template, emit_signal=False)
+                 for timer, template in timers_with_templates]
+        self._row_loader = ChunkedLoader(rows, lambda add_row: add_row(), parent=self)
+        self._row_loader.progressed.connect(self._on_rows_progressed)
+        self._row_loader.finished.connect(self._on_rows_streamed)
+        self._row_loader.start()
+
+    def _on_rows_progressed(self, count: int):
+        """Record when the first slice of rows is in place."""
+        if not self._first_rows_shown:
+            self._first_rows_shown = True
+            self._mark_startup("first rows")
+
+    def _on_rows_streamed(self):
+        """Finish startup once rows are in place and confirmed by the database."""
+        if self._rows_confirmed:
+            self._on_initial_data_loaded()
+
+    def _on_initial_data_loaded(self):
+        """Apply template button states once every row is in place."""
+        self._update_all_template_buttons()
+        self._mark_startup("data loaded")
+        self.initial_data_loaded.emit()
+        self._load_schedules()  # Starts missed while the app was closed run now, once
+        self._prewarm_dialogs()
+
+    def _prewarm_dialogs(self):
+        """Build the everyday dialogs while the app is idle, before the first click."""
+        from ui.dialogs.create_timer_dialog import CreateTimerDialog
+        from ui.dialogs.edit_timer_dialog import EditTimerDialog
+        from ui.dialogs.template_dialog import TemplateDialog
+
+        self.dialogs.prewarm([CreateTimerDialog, EditTimerDialog, TemplateDialog])
+
+    def _mark_startup(self, name: str):
+        """Record a startup milestone if a timeline is attached."""
+        if self._timeline:
+            self._timeline.mark(name)
+
+    def _finish_streaming(self):
+        """Complete a staged load that a full reload supersedes."""
+        # The reload reads the database itself; a pending snapshot check is moot
+        self._database_query = None
+        self._rows_confirmed = True
+        if self._row_loader:
+            self._row_loader.finish()
+
+    def save_snapshot(self):
+        """
+        Write the shown rows to the startup snapshot.
+
+        Call after the last database write (e.g. on QApplication.aboutToQuit).
+        Skipped while rows are still loading or not yet confirmed by the
+        database, so an unverified snapshot is never written back.
+        """
+        if not self._rows_confirmed or (self._row_loader and self._row_loader.is_active()):
+            return
+        templates = [item.template for item in self.template_panel.template_items]
+        timers_with_templates = [(item.timer, item.template) for item in self.timer_panel.timer_items]
+        write_snapshot(self.snapshot_path, self.db.db_path, templates, timers_with_templates)
 
     def _load_templates(self):
         """Load templates from database."""
+        self._finish_streaming()
         templates = self.db.get_all_templates()
         self.template_panel.set_templates(templates)
+        self.timer_panel.set_templates(templates)
+
+        # Rebuilt template items start enabled; re-apply running timer state
+        self._update_all_template_buttons()
 
     def _load_timers(self):
         """Load timers from database."""
+        self._finish_streaming()
         timers_with_templates = self.db.get_all_timers()
         self.timer_panel.set_timers(timers_with_templates)
 
         # Update template button states based on loaded timers
         self._update_all_template_buttons()
+        self._load_schedules()
+
+    def _load_schedules(self):
+        """Load auto-start schedules from database and run the ones already due."""
+        self.scheduler.set_schedules(self.db.get_all_schedules())
+        self._run_due_schedules()
+
+    def _run_due_schedules(self):
+        """Start the timers whose schedule is due (catching up in one pass) and wait for the next."""
+        due, finished = self.scheduler.poll()
+        if due:
+            finished_ids = {schedule.timer_id for schedule in finished}
+            advanced = [schedule for schedule in due if schedule.timer_id not in finished_ids]
+            self.db.update_schedules(advanced, finished)  # One write for the batch
+
+            started = self.timer_panel.start_timers([schedule.timer_id for schedule in due])
+            if started:
+                logger.info(f"{len(started)} timers auto-started")
+                if len(started) == 1:
+                    message = f"'{started[0].customer_name}' 타이머 자동 시작"
+                else:
+                    message = f"타이머 {len(started)}개 자동 시작"
+                show_toast(
+                    self, message,
+                    key="timer_autostart", group_message="타이머 {count}개 자동 시작", count=len(started)
+                )
+
+        delay = self.scheduler.seconds_until_next()
+        if delay is None:
+            self._schedule_timer.stop()
+        else:
+            self._schedule_timer.start(math.ceil(min(delay, SCHEDULE_CHECK_INTERVAL) * 1000))
 
     def _on_add_template(self):
         """Handle add template button click."""
-        dialog = TemplateDialog(parent=self)
+        from ui.dialogs.template_dialog import TemplateDialog
+
+        dialog = self.dialogs.get(TemplateDialog, None, self._all_templates())
         if dialog.exec():
-            name, duration = dialog.get_template_data()
+            name, duration, tone, warnings, next_template_id = dialog.get_template_data()
 
-            # Get current max display_order
-            templates = self.db.get_all_templates()
-            max_order = max([t.display_order for t in templates], default=-1)
+            # New template goes on top, one gap above the current first row
+            template_items = self.template_panel.template_items
+            top_order = template_items[0].template.display_order if template_items else ORDER_GAP
 
-            # Create new template (will be at top with order 0)
             template = TimerTemplate.create(
                 name=name,
                 duration=duration,
-                display_order=0
+                display_order=top_order - ORDER_GAP,
+                alert_frequency=tone.frequency,
+                alert_pattern=tone.pattern,
+                warning_seconds=warnings,
+                next_template_id=next_template_id
             )
 
-            # Increment all existing template orders
-            for existing_template in templates:
-                existing_template.display_order += 1
-                self.db.update_template(existing_template)
-
             # Save new template
             self.db.create_template(template)
 
@@ -133,20 +347,21 @@ class MainWindow(QMainWindow):
         Args:
             template: Selected template
         """
-        dialog = CreateTimerDialog(template=template, parent=self)
+        from ui.dialogs.create_timer_dialog import CreateTimerDialog
+
+        dialog = self.dialogs.get(CreateTimerDialog, template)
         if dialog.exec():
             customer_name = dialog.get_customer_name()
 
-            # Get current max display_order for timers
-            all_timers = self.db.get_all_timers()
-            max_order = max([t[0].display_order for t in all_timers], default=-1)
+            # New timer goes at the bottom, one gap below the current last row
+            timer_items = self.timer_panel.timer_items
+            bottom_order = timer_items[-1].timer.display_order if timer_items else -ORDER_GAP
 
-            # Create new timer instance (will be at bottom with max_order + 1)
             timer = TimerInstance.create(
                 customer_name=customer_name,
                 template_id=template.id,
                 initial_duration=template.duration,
-                display_order=max_order + 1
+                display_order=bottom_order + ORDER_GAP
             )
 
             # Save new timer (no need to update existing timers)
@@ -162,13 +377,19 @@ class MainWindow(QMainWindow):
         Args:
             template: Template to edit
         """
-        dialog = TemplateDialog(template=template, parent=self)
+        from ui.dialogs.template_dialog import TemplateDialog
+
+        dialog = self.dialogs.get(TemplateDialog, template, self._all_templates())
         if dialog.exec():
-            name, duration = dialog.get_template_data()
+            name, duration, tone, warnings, next_template_id = dialog.get_template_data()
 
             # Update template
             template.name = name
             template.duration = duration
+            template.alert_frequency = tone.frequency
+            template.alert_pattern = tone.pattern
+            template.warning_seconds = warnings
+            template.next_template_id = next_template_id
             template.updated_at = get_current_time()
 
             # Save to database
@@ -180,6 +401,10 @@ class MainWindow(QMainWindow):
             # Update all child timers with new template data
             self.timer_panel.update_timers_by_template(template)
 
+    def _all_templates(self) -> list:
+        """Get the shown templates (chain stage choices)."""
+        return [item.template for item in self.template_panel.template_items]
+
     def _on_delete_template(self, template: TimerTemplate):
         """
         Handle delete template button click.
@@ -190,6 +415,8 @@ class MainWindow(QMainWindow):
         # Get associated timers
         associated_timers = self.db.get_timers_by_template(str(template.id))
 
+        from ui.dialogs.delete_template_dialog import DeleteTemplateDialog
+
         # Show confirmation dialog
         dialog = DeleteTemplateDialog(
             template=template,
@@ -212,7 +439,9 @@ class MainWindow(QMainWindow):
         Args:
             timer: Timer to edit
         """
-        dialog = EditTimerDialog(timer=timer, parent=self)
+        from ui.dialogs.edit_timer_dialog import EditTimerDialog
+
+        dialog = self.dialogs.get(EditTimerDialog, timer, self.scheduler.get(timer.id))
         if dialog.exec():
             customer_name = dialog.get_customer_name()
 
@@ -222,6 +451,16 @@ class MainWindow(QMainWindow):
             # Save to database
             self.db.update_timer(timer)
 
+            # Save or remove the auto-start schedule
+            schedule = dialog.get_schedule()
+            if schedule is not None:
+                self.db.save_schedule(schedule)
+                self.scheduler.add(schedule)
+            elif self.scheduler.get(timer.id) is not None:
+                self.db.delete_schedule(str(timer.id))
+                self.scheduler.remove(timer.id)
+            self._run_due_schedules()
+
             # Update UI widget
             self.timer_panel.update_timer_item(timer)
 
@@ -259,38 +498,97 @@ class MainWindow(QMainWindow):
             # Reload UI
             self._load_timers()
 
-    def _on_timer_completed(self, timer: TimerInstance):
+    def _on_timers_completed(self, timers: list, missed: bool):
+        """
+        Handle a batch of timers that ran out together.
+
+        Args:
+            timers: Completed timer instances (one notification for all)
+            missed: Whether they completed while the computer was asleep
+        """
+        prefix = "절전 중 " if missed else ""
+        logger.info(f"{len(timers)} timers completed{' while asleep' if missed else ''}")
+
+        if len(timers) == 1:
+            message = f"{prefix}'{timers[0].customer_name}' 타이머 완료"
+        else:
+            message = f"{prefix}타이머 {len(timers)}개 완료"
+        # Batches close together share one toast ("타이머 N개 완료")
+        show_toast(
+            self, message,
+            key="timers_missed" if missed else "timer_completed",
+            group_message=prefix + "타이머 {count}개 완료", count=len(timers)
+        )
+
+    def _on_timers_warned(self, warnings: list):
+        """
+        Handle a batch of pre-expiry warnings.
+
+        Args:
+            warnings: (timer, seconds before the end) pairs (one notification for all)
+        """
+        logger.info(f"{len(warnings)} timer warnings")
+
+        if len(warnings) == 1:
+            timer, seconds_left = warnings[0]
+            minutes, seconds = divmod(seconds_left, 60)
+            left = " ".join(part for part in (f"{minutes}분" if minutes else "", f"{seconds}초" if seconds else "") if part)
+            message = f"'{timer.customer_name}' 타이머 {left} 남음"
+        else:
+            message = f"타이머 {len(warnings)}개 곧 종료"
+        show_toast(
+            self, message,
+            key="timer_warning", group_message="타이머 {count}개 곧 종료", count=len(warnings)
+        )
+
+    def _on_stages_advanced(self, timers: list):
         """
-        Handle timer completion.
+        Handle a batch of timers that moved to their next chain stage.
 
         Args:
-            timer: Completed timer instance
+            timers: Timer instances with their new template_id (one toast for all)
         """
-        logger.info(f"Timer completed: {timer.customer_name}")
+        logger.info(f"{len(timers)} timers moved to their next stage")
+
+        if len(timers) == 1:
+            item_widget = self.timer_panel.get_timer_item(timers[0].id)
+            stage = f" {item_widget.template.name}" if item_widget is not None else ""
+            message = f"'{timers[0].customer_name}' 다음 단계{stage} 시작"
+        else:
+            message = f"타이머 {len(timers)}개 다음 단계 시작"
+        show_toast(
+            self, message,
+            key="timer_stage", group_message="타이머 {count}개 다음 단계 시작", count=len(timers)
+        )
 
-    def _on_templates_reordered(self, templates: list):
+    def _on_timer_stages_changed(self, timers: list):
+        """
+        Save a batch of chain stage changes.
+
+        Args:
+            timers: Timers that advanced or returned to their chain's first template (one write for all)
+        """
+        self.db.update_timer_templates(timers)
+
+    def _on_templates_reordered(self, move: RowMove):
         """
         Handle template drag & drop reordering.
 
         Args:
-            templates: Reordered list of templates
+            move: Reorder delta from the template panel
         """
-        # Update display_order in database
-        for i, template in enumerate(templates):
-            template.display_order = i
-            self.db.update_template(template)
+        # Only the templates whose display_order changed are written
+        self.db.update_template_orders(move.changed)
 
-    def _on_timers_reordered(self, timers: list):
+    def _on_timers_reordered(self, move: RowMove):
         """
         Handle timer drag & drop reordering.
 
         Args:
-            timers: Reordered list of timers
+            move: Reorder delta from the timer panel
         """
-        # Update display_order in database
-        for i, timer in enumerate(timers):
-            timer.display_order = i
-            self.db.update_timer(timer)
+        # Only the timers whose display_order changed are written
+        self.db.update_timer_orders(move.changed)
 
     def _on_template_button_update(self, template_id: str, has_running_timers: bool):
         """
@@ -304,17 +602,8 @@ class MainWindow(QMainWindow):
 
     def _update_all_template_buttons(self):
         """Update all template buttons based on their child timer states."""
-        # Get all templates
-        templates = self.db.get_all_templates()
-
-        for template in templates:
-            # Check if any timer using this template is running or paused
-            has_running_timers = False
-            for item_widget in self.timer_panel.timer_items:
-                if item_widget.timer.template_id == template.id:
-                    if item_widget.timer.status in [TimerStatus.RUNNING, TimerStatus.PAUSED]:
-                        has_running_timers = True
-                        break
-
-            # Update template buttons
-            self.template_panel.update_template_buttons(str(template.id), has_running_timers)
+        for item_widget in self.template_panel.template_items:
+            template_id = item_widget.template.id
+            self.template_panel.update_template_buttons(
+                template_id, self.timer_panel.has_active_timers(template_id)
+            )
@@ -1,10 +1,10 @@
 """
 Base panel class with common functionality.
 
-Version: 1.0.0
+Version: 1.0.1
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from typing import Generic, List, TypeVar
 
@@ -38,7 +38,7 @@ class BaseListPanel(QWidget, Generic[T]):
         """
         header = QLabel(title)
         header.setFont(Theme.Fonts.header())
-        header.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        header.setProperty("role", "primary")
         return header
 
     def _create_list_widget(self) -> QListWidget:
@@ -52,7 +52,7 @@ class BaseListPanel(QWidget, Generic[T]):
         list_widget.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         list_widget.setSpacing(0)
-        list_widget.setStyleSheet(Theme.Styles.list_widget())
+        list_widget.setObjectName("itemList")
         list_widget.model().rowsMoved.connect(self._on_rows_moved)
         return list_widget
 
@@ -0,0 +1,107 @@
+"""
+Completion blinking for list rows, driven by one shared timer.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Rows join the group when their timer completes and leave it when clicked
+or removed. All members blink in phase from a single QTimer, so a batch
+of 1000 completions costs one wakeup per half second instead of one timer
+per row. Members only need set_blink_border(on).
+
+Usage:
+    from ui.panels.blink import BlinkGroup
+
+    blinker = BlinkGroup(panel)
+    blinker.add(item_widgets)         # Border on now, then toggles
+    blinker.discard(item_widget)      # Border off
+    blinker.set_suspended(True)       # Window hidden: stop toggling
+"""
+from typing import Iterable, Set
+
+from PySide6.QtCore import QObject, QTimer
+
+BLINK_INTERVAL = 500  # Milliseconds between border toggles
+
+
+class BlinkGroup(QObject):
+    """Rows whose border blinks until they are clicked."""
+
+    def __init__(self, parent=None):
+        """
+        Initialize blink group.
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._members: Set = set()
+        self._state = False  # Border shown in the current phase
+        self._suspended = False
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._toggle)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, widget) -> bool:
+        return widget in self._members
+
+    def add(self, widgets: Iterable):
+        """
+        Start blinking rows (in phase with the rows already blinking).
+
+        Args:
+            widgets: Row widgets with set_blink_border(on)
+        """
+        if not self._members:
+            self._state = True  # A new blink starts with the border shown
+        for widget in widgets:
+            self._members.add(widget)
+            widget.set_blink_border(self._state)
+        self._update_timer()
+
+    def discard(self, widget):
+        """
+        Stop blinking a row and hide its border.
+
+        Args:
+            widget: Row widget (ignored if not blinking)
+        """
+        if widget in self._members:
+            self._members.discard(widget)
+            widget.set_blink_border(False)
+            self._update_timer()
+
+    def clear(self):
+        """Stop blinking all rows."""
+        for widget in self._members:
+            widget.set_blink_border(False)
+        self._members.clear()
+        self._update_timer()
+
+    def set_suspended(self, suspended: bool):
+        """
+        Pause or resume toggling (e.g. while the window is hidden).
+
+        Args:
+            suspended: True to pause (borders keep their state)
+        """
+        self._suspended = suspended
+        self._update_timer()
+
+    def _update_timer(self):
+        """Run the timer only while there is something visible to toggle."""
+        if self._members and not self._suspended:
+            if not self._timer.isActive():
+                self._timer.start(BLINK_INTERVAL)
+        else:
+            self._timer.stop()
+
+    def _toggle(self):
+        """Flip the border of all members."""
+        self._state = not self._state
+        for widget in self._members:
+            widget.set_blink_border(self._state)
@@ -0,0 +1,331 @@
+"""
+Row bookkeeping helpers for list panels.
+
+Version: 1.0.3
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    from ui.panels.indexing import ActiveTimerCounter, RowIndex
+
+    index = RowIndex(lambda widget: widget.timer)
+    index.append(widget)
+    widget = index.get(timer_id)   # O(1), accepts UUID or str
+    row = index.row(timer_id)      # O(1)
+
+    first = index.move(start, end, row)    # From QAbstractItemModel.rowsMoved
+    move = index.delta(first, end - start + 1)
+
+    counter = ActiveTimerCounter()
+    if counter.set_active(timer.id, timer.template_id, True):
+        ...                        # Template gained its first active timer
+"""
+from collections import Counter
+from typing import Any, Callable, Dict, Generic, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from models.base import ORDER_GAP, parse_uuid
+
+W = TypeVar('W')  # Row widget type (TimerItem or TemplateItem)
+
+
+class RowMove(NamedTuple):
+    """Drag & drop reorder delta emitted by the list panels."""
+    moved_ids: Tuple[UUID, ...]  # Moved rows, top to bottom
+    before_id: Optional[UUID]  # Row now directly above the moved rows
+    after_id: Optional[UUID]  # Row now directly below the moved rows
+    changed: Tuple[Any, ...]  # Models whose display_order was reassigned
+
+
+class RowIndex(Generic[W]):
+    """
+    Row widgets in display order with UUID-keyed lookup and row numbers.
+
+    Widget lookups are O(1). Row numbers are cached and renumbered lazily:
+    a mutation only lowers the watermark below which cached numbers are
+    known to be current, and the first row() lookup past it renumbers the
+    tail once. A single add, remove or drag therefore costs no Python-level
+    work per row.
+    """
+
+    def __init__(self, model_getter: Callable[[W], Any]):
+        """
+        Initialize row index.
+
+        Args:
+            model_getter: Function returning the model (with ``id`` and
+                ``display_order``) of a row widget
+        """
+        self._model_getter = model_getter
+        self.items: List[W] = []  # Row widgets in display order
+        self._by_id: Dict[UUID, W] = {}
+        self._rows: Dict[UUID, int] = {}
+        self._valid_rows = 0  # Cached numbers below this row are current
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[W]:
+        return iter(self.items)
+
+    def __contains__(self, item_id) -> bool:
+        return parse_uuid(item_id) in self._by_id
+
+    def get(self, item_id: str | UUID) -> Optional[W]:
+        """
+        Get row widget by model ID.
+
+        Args:
+            item_id: UUID (or UUID string) of the model
+
+        Returns:
+            Row widget or None
+        """
+        return self._by_id.get(parse_uuid(item_id))
+
+    def row(self, item_id: str | UUID) -> int:
+        """
+        Get row number by model ID.
+
+        Args:
+            item_id: UUID (or UUID string) of the model
+
+        Returns:
+            int: Row number, or -1 if not found
+        """
+        key = parse_uuid(item_id)
+        row = self._rows.get(key)
+        if row is not None and row < self._valid_rows:
+            return row
+        if key not in self._by_id:
+            return -1
+        self._renumber()
+        return self._rows[key]
+
+    def append(self, widget: W):
+        """
+        Add widget as the last row.
+
+        Args:
+            widget: Row widget
+        """
+        item_id = self._model_getter(widget).id
+        self._by_id[item_id] = widget
+        self._rows[item_id] = len(self.items)
+        if self._valid_rows == len(self.items):
+            self._valid_rows += 1
+        self.items.append(widget)
+
+    def insert(self, row: int, widget: W):
+        """
+        Insert widget at row.
+
+        Args:
+            row: Target row
+            widget: Row widget
+        """
+        self.items.insert(row, widget)
+        self._by_id[self._model_getter(widget).id] = widget
+        self._invalidate(row)
+
+    def remove(self, item_id: str | UUID) -> int:
+        """
+        Remove row by model ID.
+
+        Args:
+            item_id: UUID (or UUID string) of the model
+
+        Returns:
+            int: Removed row number, or -1 if not found
+        """
+        key = parse_uuid(item_id)
+        row = self.row(key)
+        if row >= 0:
+            del self._by_id[key]
+            del self._rows[key]
+            self.items.pop(row)
+            self._invalidate(row)
+        return row
+
+    def move(self, start: int, end: int, row: int) -> int:
+        """
+        Apply a QAbstractItemModel.rowsMoved notification.
+
+        Rows start..end are moved to before the row that was at ``row``
+        (pre-move numbering), matching Qt's rowsMoved semantics.
+
+        Args:
+            start: First moved row
+            end: Last moved row
+            row: Destination row in pre-move numbering
+
+        Returns:
+            int: New row of the first moved widget, or -1 if nothing moved
+        """
+        if start <= row <= end + 1:
+            return -1
+
+        count = end - start + 1
+        block = self.items[start:end + 1]
+        del self.items[start:end + 1]
+        destination = row - count if row > end else row
+        self.items[destination:destination] = block
+        self._invalidate(min(start, destination))
+        return destination
+
+    def delta(self, first: int, count: int) -> RowMove:
+        """
+        Describe moved rows and give them display orders between their neighbours.
+
+        Only the moved models are renumbered while there is room in the gap
+        between the neighbouring display_order values; otherwise every row
+        is rebalanced to ORDER_GAP spacing.
+
+        Args:
+            first: Row of the first moved widget (as returned by move())
+            count: Number of moved rows
+
+        Returns:
+            RowMove: Moved and neighbour IDs plus the models to persist
+        """
+        models = [self._model_getter(widget) for widget in self.items[first:first + count]]
+        before = self._model_getter(self.items[first - 1]) if first > 0 else None
+        after = self._model_getter(self.items[first + count]) if first + count < len(self.items) else None
+
+        low = before.display_order if before is not None else None
+        high = after.display_order if after is not None else None
+        if low is None and high is None:
+            low, high = -ORDER_GAP, count * ORDER_GAP
+        elif low is None:
+            low = high - (count + 1) * ORDER_GAP
+        elif high is None:
+            high = low + (count + 1) * ORDER_GAP
+
+        step = (high - low) // (count + 1)
+        if step > 0:
+            for i, model in enumerate(models, start=1):
+                model.display_order = low + i * step
+            changed = tuple(models)
+        else:
+            changed = tuple(self._model_getter(widget) for widget in self.items)
+            for i, model in enumerate(changed):
+                model.display_order = i * ORDER_GAP
+
+        return RowMove(
+            moved_ids=tuple(model.id for model in models),
+            before_id=before.id if before is not None else None,
+            after_id=after.id if after is not None else None,
+            changed=changed
+        )
+
+    def clear(self):
+        """Remove all rows."""
+        self.items.clear()
+        self._by_id.clear()
+        self._rows.clear()
+        self._valid_rows = 0
+
+    def _invalidate(self, first: int):
+        """Mark cached row numbers from first onwards as stale."""
+        self._valid_rows = min(self._valid_rows, first)
+
+    def _renumber(self):
+        """Refresh cached row numbers past the watermark."""
+        items = self.items
+        rows = self._rows
+        model_getter = self._model_getter
+        for i in range(self._valid_rows, len(items)):
+            rows[model_getter(items[i]).id] = i
+        self._valid_rows = len(items)
+
+
+class ActiveTimerCounter:
+    """
+    Running/paused timer counts per template, maintained incrementally.
+
+    Each status transition updates one counter entry, so deciding whether a
+    template still has active timers does not depend on how many timers
+    exist. Mutators report when a template's count crosses zero, which is
+    the only time its buttons need to change.
+    """
+
+    def __init__(self):
+        """Initialize empty counter."""
+        self._counts: Counter[UUID] = Counter()
+        self._active: Dict[UUID, UUID] = {}  # Active timer ID -> template ID
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def count(self, template_id: str | UUID) -> int:
+        """
+        Get number of active timers for a template.
+
+        Args:
+            template_id: UUID (or UUID string) of template
+
+        Returns:
+            int: Running/paused timer count
+        """
+        return self._counts[parse_uuid(template_id)]
+
+    def has_active(self, template_id: str | UUID) -> bool:
+        """
+        Check whether a template has running/paused timers.
+
+        Args:
+            template_id: UUID (or UUID string) of template
+
+        Returns:
+            bool: True if at least one timer is active
+        """
+        return self._counts[parse_uuid(template_id)] > 0
+
+    def set_active(self, timer_id: UUID, template_id: UUID, active: bool) -> bool:
+        """
+        Record a timer status transition.
+
+        Args:
+            timer_id: Timer UUID
+            template_id: Template UUID of the timer
+            active: Whether the timer is now running or paused
+
+        Returns:
+            bool: True if the template's count crossed zero
+        """
+        was_active = timer_id in self._active
+        if active == was_active:
+            return False
+
+        if active:
+            self._active[timer_id] = template_id
+            self._counts[template_id] += 1
+            return self._counts[template_id] == 1
+
+        return self.discard(timer_id) is not None
+
+    def discard(self, timer_id: UUID) -> Optional[UUID]:
+        """
+        Forget a timer (stopped or removed).
+
+        Args:
+            timer_id: Timer UUID
+
+        Returns:
+            Template UUID if its count dropped to zero, otherwise None
+        """
+        template_id = self._active.pop(timer_id, None)
+        if template_id is None:
+            return None
+
+        self._counts[template_id] -= 1
+        if self._counts[template_id] > 0:
+            return None
+        del self._counts[template_id]
+        return template_id
+
+    def clear(self):
+        """Forget all timers."""
+        self._counts.clear()
+        self._active.clear()
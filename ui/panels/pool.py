@@ -0,0 +1,135 @@
+"""
+Row widget recycling for list panels.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+QListWidget hands item widgets to its delegate's destroyEditor() when rows
+are taken or cleared. RecyclingDelegate returns them to a WidgetPool, so
+reloading a list rebinds existing widgets to new models instead of
+constructing fresh ones.
+
+Pooled widgets implement:
+    reset()              - Stop timers/animations before being pooled
+    rebind(model, ...)   - Show a new model (called by the panel)
+
+Usage:
+    from ui.panels.pool import RecyclingDelegate, WidgetPool
+
+    pool = WidgetPool(TimerItem)
+    list_widget.setItemDelegate(RecyclingDelegate(pool, list_widget))
+
+    item_widget = pool.acquire()     # None on a miss
+    print(pool.stats().hit_rate)
+"""
+from typing import Generic, List, NamedTuple, Optional, Type, TypeVar
+
+from PySide6.QtWidgets import QStyledItemDelegate, QWidget
+
+W = TypeVar('W', bound=QWidget)
+
+DEFAULT_MAX_SIZE = 4096  # Pool never holds more widgets than the longest list shown
+
+
+class PoolStats(NamedTuple):
+    """Widget pool counters."""
+    size: int  # Widgets currently pooled
+    high_water: int  # Largest pool size seen
+    hits: int  # Acquires served from the pool
+    misses: int  # Acquires that required a new widget
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquires served from the pool (0.0 - 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class WidgetPool(Generic[W]):
+    """Free list of detached row widgets of one type."""
+
+    def __init__(self, widget_type: Type[W], max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize widget pool.
+
+        Args:
+            widget_type: Row widget class accepted by release()
+            max_size: Maximum number of pooled widgets (extras are deleted)
+        """
+        self.widget_type = widget_type
+        self.max_size = max_size
+        self._free: List[W] = []
+        self._high_water = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Optional[W]:
+        """
+        Take a pooled widget.
+
+        Returns:
+            Pooled widget to rebind, or None if the pool is empty
+        """
+        if self._free:
+            self._hits += 1
+            return self._free.pop()
+        self._misses += 1
+        return None
+
+    def release(self, widget: QWidget) -> bool:
+        """
+        Return a detached widget to the pool.
+
+        Args:
+            widget: Widget released by the list view
+
+        Returns:
+            bool: True if pooled, False if the caller should delete it
+        """
+        if not isinstance(widget, self.widget_type) or len(self._free) >= self.max_size:
+            return False
+
+        widget.reset()
+        self._free.append(widget)
+        self._high_water = max(self._high_water, len(self._free))
+        return True
+
+    def stats(self) -> PoolStats:
+        """
+        Get pool counters.
+
+        Returns:
+            PoolStats: Current size, high-water mark, hits and misses
+        """
+        return PoolStats(len(self._free), self._high_water, self._hits, self._misses)
+
+    def clear(self):
+        """Delete all pooled widgets."""
+        for widget in self._free:
+            widget.deleteLater()
+        self._free.clear()
+
+
+class RecyclingDelegate(QStyledItemDelegate):
+    """Item delegate that returns row widgets to a WidgetPool instead of deleting them."""
+
+    def __init__(self, pool: WidgetPool, parent=None):
+        """
+        Initialize delegate.
+
+        Args:
+            pool: Pool receiving released row widgets
+            parent: Parent object (the list widget)
+        """
+        super().__init__(parent)
+        self._pool = pool
+
+    def destroyEditor(self, editor, index):
+        """Pool the row widget, or delete it if the pool does not take it."""
+        if not self._pool.release(editor):
+            super().destroyEditor(editor, index)
@@ -1,18 +1,21 @@
 """
 Template management panel (left panel).
 
-Version: 1.0.1
+Version: 1.0.5
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from typing import List
+from uuid import UUID
 
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QPushButton, QVBoxLayout, QWidget
 
 from models.template import TimerTemplate
 from ui.containers.template_item import TemplateItem
+from ui.panels.indexing import RowIndex, RowMove
+from ui.panels.pool import RecyclingDelegate, WidgetPool
 from ui.theme import Theme
 
 
@@ -23,14 +26,20 @@ class TemplatePanel(QWidget):
     template_selected = Signal(TimerTemplate)
     edit_template_clicked = Signal(TimerTemplate)
     delete_template_clicked = Signal(TimerTemplate)
-    templates_reordered = Signal(list)
+    templates_reordered = Signal(RowMove)
 
     def __init__(self, parent=None):
         """Initialize template panel."""
         super().__init__(parent)
-        self.template_items: List[TemplateItem] = []
+        self._rows: RowIndex[TemplateItem] = RowIndex(lambda item_widget: item_widget.template)
+        self.item_pool: WidgetPool[TemplateItem] = WidgetPool(TemplateItem)
         self._init_ui()
 
+    @property
+    def template_items(self) -> List[TemplateItem]:
+        """Template item widgets in display order."""
+        return self._rows.items
+
     def _init_ui(self):
         """Initialize UI components."""
         layout = QVBoxLayout()
@@ -45,19 +54,14 @@ class TemplatePanel(QWidget):
         # Header label
         header = QLabel("타이머 템플릿")
         header.setFont(Theme.Fonts.header())
-        header.setStyleSheet(f"""
-            QLabel {{
-                color: {Theme.Colors.TEXT_PRIMARY};
-                background-color: transparent;
-            }}
-        """)
+        header.setProperty("role", "primary")
         layout.addWidget(header)
 
         # Add Template button
         add_btn = QPushButton("+ 템플릿 추가")
         add_btn.setFixedHeight(Theme.Spacing.BUTTON_HEIGHT)
         add_btn.setFont(Theme.Fonts.button())
-        add_btn.setStyleSheet(Theme.Styles.primary_button())
+        add_btn.setObjectName("addTemplateButton")
         add_btn.clicked.connect(self.add_template_clicked.emit)
         layout.addWidget(add_btn)
 
@@ -66,19 +70,16 @@ class TemplatePanel(QWidget):
         self.list_widget.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.list_widget.setSpacing(0)
-        self.list_widget.setStyleSheet(Theme.Styles.list_widget())
+        self.list_widget.setObjectName("itemList")
+        # Removed rows go back to item_pool instead of being deleted
+        self.list_widget.setItemDelegate(RecyclingDelegate(self.item_pool, self.list_widget))
         self.list_widget.model().rowsMoved.connect(self._on_rows_moved)
         layout.addWidget(self.list_widget)
 
         self.setLayout(layout)
 
-        # Panel styling with background
-        self.setStyleSheet(f"""
-            TemplatePanel {{
-                background-color: transparent;
-                border-right: 1px solid {Theme.Colors.BORDER};
-            }}
-        """)
+        # Panel styling with background (QWidget#templatePanel)
+        self.setObjectName("templatePanel")
 
     def set_templates(self, templates: List[TimerTemplate]):
         """
@@ -99,30 +100,46 @@ class TemplatePanel(QWidget):
             template: TimerTemplate to add
             emit_signal: Whether to emit signals (False when loading from DB)
         """
-        item_widget = TemplateItem(template)
-        item_widget.template_clicked.connect(self.template_selected.emit)
-        item_widget.edit_clicked.connect(self.edit_template_clicked.emit)
-        item_widget.delete_clicked.connect(self.delete_template_clicked.emit)
+        # Reuse a pooled widget (signals already connected) when available
+        item_widget = self.item_pool.acquire()
+        if item_widget is None:
+            item_widget = self._create_template_item(template)
+        else:
+            item_widget.rebind(template)
 
         item = QListWidgetItem()
         item.setSizeHint(item_widget.sizeHint())
-        self.list_widget.insertItem(0, item)
+        self.list_widget.addItem(item)  # Keep database display_order (newest template has the lowest)
         self.list_widget.setItemWidget(item, item_widget)
-        self.template_items.insert(0, item_widget)
+        self._rows.append(item_widget)
+
+    def _create_template_item(self, template: TimerTemplate) -> TemplateItem:
+        """
+        Create a template item widget and connect its signals.
+
+        Args:
+            template: TimerTemplate to display
+
+        Returns:
+            TemplateItem: New widget
+        """
+        item_widget = TemplateItem(template)
+        item_widget.template_clicked.connect(self.template_selected.emit)
+        item_widget.edit_clicked.connect(self.edit_template_clicked.emit)
+        item_widget.delete_clicked.connect(self.delete_template_clicked.emit)
+        return item_widget
 
-    def remove_template_item(self, template_id: str):
+    def remove_template_item(self, template_id: str | UUID):
         """
         Remove template item by ID.
 
         Args:
-            template_id: UUID string of template to remove
+            template_id: UUID (or UUID string) of template to remove
         """
-        for i, item_widget in enumerate(self.template_items):
-            if str(item_widget.template.id) == template_id:
-                item = self.list_widget.takeItem(i)
-                del item
-                self.template_items.pop(i)
-                break
+        row = self._rows.remove(template_id)
+        if row >= 0:
+            item = self.list_widget.takeItem(row)
+            del item
 
     def update_template_item(self, template: TimerTemplate):
         """
@@ -131,15 +148,14 @@ class TemplatePanel(QWidget):
         Args:
             template: Updated template instance
         """
-        for item_widget in self.template_items:
-            if item_widget.template.id == template.id:
-                item_widget.update_template(template)
-                break
+        item_widget = self._rows.get(template.id)
+        if item_widget is not None:
+            item_widget.update_template(template)
 
     def clear_templates(self):
         """Clear all template items."""
         self.list_widget.clear()
-        self.template_items.clear()
+        self._rows.clear()
 
     def _on_rows_moved(self, parent, start, end, destination, row):
         """
@@ -152,25 +168,21 @@ class TemplatePanel(QWidget):
             destination: Destination index
             row: Target row
         """
-        self.template_items.clear()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            if isinstance(widget, TemplateItem):
-                self.template_items.append(widget)
+        # Mirror the model move instead of rescanning every row
+        first = self._rows.move(start, end, row)
+        if first < 0:
+            return
 
-        templates = [item_widget.template for item_widget in self.template_items]
-        self.templates_reordered.emit(templates)
+        self.templates_reordered.emit(self._rows.delta(first, end - start + 1))
 
-    def update_template_buttons(self, template_id: str, has_running_timers: bool):
+    def update_template_buttons(self, template_id: str | UUID, has_running_timers: bool):
         """
         Update template item buttons based on child timer states.
 
         Args:
-            template_id: UUID string of template
+            template_id: UUID (or UUID string) of template
             has_running_timers: Whether this template has any running/paused timers
         """
-        for item_widget in self.template_items:
-            if str(item_widget.template.id) == template_id:
-                item_widget.set_buttons_enabled(not has_running_timers)
-                break
+        item_widget = self._rows.get(template_id)
+        if item_widget is not None:
+            item_widget.set_buttons_enabled(not has_running_timers)
@@ -1,87 +1,138 @@
 """
 Timer panel (right panel) for active timers.
 
-Version: 1.0.2
+Version: 1.0.23
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+The panel owns the TimerEngine of its timers and two QTimers:
+    deadline timer  precise, single shot at the engine's next deadline;
+                    completions come from TimerEngine.poll() when it fires
+    ticker          coarse, once per wall-clock second while timers run;
+                    checks for clock jumps and redraws all running timers
+                    in one pass
+Rows have no timers of their own, so 100 running timers cost one display
+wakeup per second, and completions stay exact however late the ticker is.
+While the window cannot be seen (set_rendering(False), driven by a
+RenderPolicy) nothing is redrawn or blinks and the ticker only checks the
+clock every BACKGROUND_CHECK_INTERVAL; showing the window redraws once.
+Timers that run out together (same deadline, or during sleep) are
+completed as one batch: one beep sequence, one BlinkGroup registration and
+one timers_completed signal (hence one toast) however many there are.
+Pre-expiry warnings (template warning_seconds) are engine deadlines as
+well and are delivered the same way, as one timers_warned batch.
+Chained templates advance inside the same engine poll (_next_stage is the
+engine's next_stage hook): a timer that runs out with a next stage keeps
+running under the next template without blinking or completing, and the
+timers advanced by one poll are reported as one stages_advanced batch.
+The timer remembers the chain's first template (chain_template_id) and
+returns to it when its last stage completes or it is stopped. The stage
+changes of one pass (advances and returns) are one timer_stages_changed
+batch, which the main window saves in one write.
 """
-import sys
-from pathlib import Path
-from typing import List
+import logging
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
 
-from PySide6.QtCore import QTimer, QUrl, Signal
-from PySide6.QtMultimedia import QSoundEffect
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QLabel, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
 
+from models.base import parse_uuid
+from models.clock import ClockJumpDetector
 from models.enums import TimerStatus
 from models.template import TimerTemplate
 from models.timer import TimerInstance
+from services.timer_engine import TimerEngine
 from ui.containers.timer_item import TimerItem
+from ui.panels.blink import BlinkGroup
+from ui.panels.indexing import ActiveTimerCounter, RowIndex, RowMove
+from ui.panels.pool import RecyclingDelegate, WidgetPool
 from ui.theme import Theme
+from ui.utils.tones import Tone
+
+if TYPE_CHECKING:
+    from ui.utils.audio import AlertPlayer
+
+logger = logging.getLogger(__name__)
 
 
 class TimerPanel(QWidget):
     """Right panel for active timer management."""
 
+    ACTIVE_STATUSES = (TimerStatus.RUNNING, TimerStatus.PAUSED)
+
     # Alert sound constants
     ALERT_BEEP_COUNT = 10  # Number of beeps
     ALERT_BEEP_INTERVAL = 500  # Milliseconds between beeps
     ALERT_VOLUME = 0.7  # Volume level (0.0 - 1.0)
-    SOUND_FILE = "alert.wav"  # Alert sound filename
+    WARNING_BEEP_COUNT = 2  # Beeps for a pre-expiry warning
+
+    TICK_INTERVAL = 1000  # Milliseconds between display refreshes (on wall-clock second boundaries)
+    BACKGROUND_CHECK_INTERVAL = 10000  # Milliseconds between clock checks while the window is hidden
 
     edit_timer_clicked = Signal(TimerInstance)
     delete_timer_clicked = Signal(TimerInstance)
-    timer_completed = Signal(TimerInstance)
-    timers_reordered = Signal(list)
+    timers_completed = Signal(list, bool)  # (timers, missed) - one batch; missed: ran out during sleep
+    timers_warned = Signal(list)  # [(timer, seconds_left)] - warning stages reached, one batch
+    stages_advanced = Signal(list)  # Timers moved to their template's next stage, one batch
+    timer_stages_changed = Signal(list)  # Timers whose chain stage changed (advanced or returned), to save
+    timers_reordered = Signal(RowMove)
     template_button_update_needed = Signal(str, bool)  # (template_id, has_running_timers)
 
     def __init__(self, parent=None):
         """Initialize timer panel."""
         super().__init__(parent)
-        self.timer_items: List[TimerItem] = []
-
-        # Initialize sound effect
-        self.sound_effect = self._init_sound_effect()
-
-        # Alert repeat control
-        self.alert_timer = QTimer()
-        self.alert_timer.timeout.connect(self._play_alert_beep)
-        self.alert_count = 0
+        self._rows: RowIndex[TimerItem] = RowIndex(lambda item_widget: item_widget.timer)
+        self._active_counts = ActiveTimerCounter()
+        self.item_pool: WidgetPool[TimerItem] = WidgetPool(TimerItem)
+        self._templates: Dict[UUID, TimerTemplate] = {}  # All templates by id (chain stages)
+        self._advanced: Dict[UUID, TimerInstance] = {}  # Moved to a next stage by the current poll
+        self._stage_changes: Dict[UUID, TimerInstance] = {}  # Chain stage changes not yet reported
+        self.engine = TimerEngine(next_stage=self._next_stage)
+
+        # Fires at the next deadline only (not every second)
+        self._deadline_timer = QTimer(self)
+        self._deadline_timer.setSingleShot(True)
+        self._deadline_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._deadline_timer.timeout.connect(self._on_deadline)
+
+        # One display refresh per second for all rows; coarse, so the OS may batch the wakeup
+        self._ticker = QTimer(self)
+        self._ticker.setSingleShot(True)
+        self._ticker.setTimerType(Qt.TimerType.CoarseTimer)
+        self._ticker.timeout.connect(self._on_tick)
+
+        # Sleep and clock changes are only noticed by comparing the clocks (on every tick)
+        self._jump_detector = ClockJumpDetector(self.engine.clock)
+        self._rendering = True  # Window can be seen (see set_rendering)
+
+        # Completed rows blink in phase from one shared timer until clicked
+        self.blinker = BlinkGroup(self)
+
+        # Alert player is created when the first timer starts (imports QtMultimedia)
+        self._alert_player: Optional["AlertPlayer"] = None
 
         self._init_ui()
 
-    def _init_sound_effect(self) -> QSoundEffect:
+    @property
+    def timer_items(self) -> List[TimerItem]:
+        """Timer item widgets in display order."""
+        return self._rows.items
+
+    def _ensure_alert_player(self) -> "AlertPlayer":
         """
-        Initialize alert sound effect.
+        Get alert player, creating it on first use.
 
         Returns:
-            QSoundEffect: Configured sound effect
+            AlertPlayer: Player mixing alert beeps into one audio stream
         """
-        sound_effect = QSoundEffect()
+        if self._alert_player is None:
+            from ui.utils.audio import AlertPlayer
 
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        if getattr(sys, 'frozen', False):
-            # Running in a PyInstaller bundle
-            base_path = Path(sys._MEIPASS)
-            print(f"[SOUND] Running in PyInstaller bundle, base_path: {base_path}")
-        else:
-            # Running in normal Python environment
-            base_path = Path(__file__).parent.parent.parent
-            print(f"[SOUND] Running in development mode, base_path: {base_path}")
-
-        sound_path = base_path / "assets" / self.SOUND_FILE
-        print(f"[SOUND] Sound file path: {sound_path}")
-        print(f"[SOUND] Sound file exists: {sound_path.exists()}")
-
-        if sound_path.exists():
-            sound_effect.setSource(QUrl.fromLocalFile(str(sound_path)))
-            sound_effect.setVolume(self.ALERT_VOLUME)
-            print(f"[SOUND] ✅ Sound effect initialized")
-        else:
-            print(f"[SOUND] ⚠️  Sound file not found: {sound_path}")
-
-        return sound_effect
+            self._alert_player = AlertPlayer(volume=self.ALERT_VOLUME, parent=self)
+        return self._alert_player
 
     def _init_ui(self):
         """Initialize UI components."""
@@ -97,12 +148,7 @@ class TimerPanel(QWidget):
         # Header label
         header = QLabel("타이머")
         header.setFont(Theme.Fonts.header())
-        header.setStyleSheet(f"""
-            QLabel {{
-                color: {Theme.Colors.TEXT_PRIMARY};
-                background-color: transparent;
-            }}
-        """)
+        header.setProperty("role", "primary")
         layout.addWidget(header)
 
         # List widget with drag & drop support
@@ -110,18 +156,16 @@ class TimerPanel(QWidget):
         self.list_widget.setDragDropMode(QListWidget.DragDropMode.InternalMove)
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self.list_widget.setSpacing(0)
-        self.list_widget.setStyleSheet(Theme.Styles.list_widget())
+        self.list_widget.setObjectName("itemList")
+        # Removed rows go back to item_pool instead of being deleted
+        self.list_widget.setItemDelegate(RecyclingDelegate(self.item_pool, self.list_widget))
         self.list_widget.model().rowsMoved.connect(self._on_rows_moved)
         layout.addWidget(self.list_widget)
 
         self.setLayout(layout)
 
-        # Panel styling with background
-        self.setStyleSheet(f"""
-            TimerPanel {{
-                background-color: transparent;
-            }}
-        """)
+        # Panel styling with background (QWidget#timerPanel)
+        self.setObjectName("timerPanel")
 
     def set_timers(self, timers_with_templates: List[tuple[TimerInstance, TimerTemplate]]):
         """
@@ -134,6 +178,20 @@ class TimerPanel(QWidget):
         for timer, template in timers_with_templates:
             self.add_timer_item(timer, template, emit_signal=False)
 
+        # Loaded timers are stopped: ones reloaded in a later chain stage start over
+        for item_widget in self.timer_items:
+            self._return_to_chain_start(item_widget)
+        self._report_stage_changes()
+
+    def set_templates(self, templates: Iterable[TimerTemplate]):
+        """
+        Set the templates timers can advance to (next chain stages).
+
+        Args:
+            templates: All templates
+        """
+        self._templates = {template.id: template for template in templates}
+
     def add_timer_item(
         self,
         timer: TimerInstance,
@@ -148,32 +206,60 @@ class TimerPanel(QWidget):
             template: Associated template
             emit_signal: Whether to emit signals
         """
-        item_widget = TimerItem(timer, template)
-        item_widget.edit_clicked.connect(self.edit_timer_clicked.emit)
-        item_widget.delete_clicked.connect(self.delete_timer_clicked.emit)
-        item_widget.timer_completed.connect(self._on_timer_completed)
-        item_widget.timer_status_changed.connect(self._on_timer_status_changed)
-        item_widget.timer_clicked.connect(self._on_timer_item_clicked)
+        # Reuse a pooled widget (signals already connected) when available
+        item_widget = self.item_pool.acquire()
+        if item_widget is None:
+            item_widget = self._create_timer_item(timer, template)
+        else:
+            item_widget.rebind(timer, template)
 
         item = QListWidgetItem()
         item.setSizeHint(item_widget.sizeHint())
         self.list_widget.addItem(item)  # Add to bottom instead of top
         self.list_widget.setItemWidget(item, item_widget)
-        self.timer_items.append(item_widget)  # Append instead of insert(0)
+        self._rows.append(item_widget)  # Append instead of insert(0)
+
+        if timer.status in self.ACTIVE_STATUSES:
+            self._set_timer_active(timer, True, emit_signal)
+
+    def _create_timer_item(self, timer: TimerInstance, template: TimerTemplate) -> TimerItem:
+        """
+        Create a timer item widget and connect its signals.
+
+        Args:
+            timer: TimerInstance to display
+            template: Associated template
+
+        Returns:
+            TimerItem: New widget
+        """
+        item_widget = TimerItem(timer, template, self.engine)
+        item_widget.edit_clicked.connect(self.edit_timer_clicked.emit)
+        item_widget.delete_clicked.connect(self.delete_timer_clicked.emit)
+        item_widget.timer_status_changed.connect(self._on_timer_status_changed)
+        item_widget.timer_clicked.connect(self._on_timer_item_clicked)
+        return item_widget
 
-    def remove_timer_item(self, timer_id: str):
+    def remove_timer_item(self, timer_id: str | UUID):
         """
         Remove timer item by ID.
 
         Args:
-            timer_id: UUID string of timer to remove
+            timer_id: UUID (or UUID string) of timer to remove
         """
-        for i, item_widget in enumerate(self.timer_items):
-            if str(item_widget.timer.id) == timer_id:
-                item = self.list_widget.takeItem(i)
-                del item
-                self.timer_items.pop(i)
-                break
+        item_widget = self._rows.get(timer_id)
+        if item_widget is not None:
+            self.blinker.discard(item_widget)
+        row = self._rows.remove(timer_id)
+        if row >= 0:
+            item = self.list_widget.takeItem(row)
+            del item
+        self.engine.discard(timer_id)
+        self._schedule_next_deadline()
+
+        template_id = self._active_counts.discard(parse_uuid(timer_id))
+        if template_id is not None:
+            self.template_button_update_needed.emit(str(template_id), False)
 
     def update_timer_item(self, timer: TimerInstance):
         """
@@ -182,10 +268,9 @@ class TimerPanel(QWidget):
         Args:
             timer: Updated timer instance
         """
-        for item_widget in self.timer_items:
-            if item_widget.timer.id == timer.id:
-                item_widget.update_timer(timer)
-                break
+        item_widget = self._rows.get(timer.id)
+        if item_widget is not None:
+            item_widget.update_timer(timer)
 
     def update_timers_by_template(self, template: TimerTemplate):
         """
@@ -194,59 +279,251 @@ class TimerPanel(QWidget):
         Args:
             template: Updated template instance
         """
+        self._templates[template.id] = template
         for item_widget in self.timer_items:
             if item_widget.timer.template_id == template.id:
                 item_widget.update_template(template)
 
     def clear_timers(self):
         """Clear all timer items."""
+        self.blinker.clear()
         self.list_widget.clear()
-        self.timer_items.clear()
+        self._rows.clear()
+        self._active_counts.clear()
+        self.engine.clear()
+        self._deadline_timer.stop()
+        self._ticker.stop()
+
+    def _schedule_next_deadline(self):
+        """Arm the deadline timer for the engine's earliest expiry (and the ticker)."""
+        delay = self.engine.seconds_until_next()
+        if delay is None:
+            self._deadline_timer.stop()
+            self._ticker.stop()
+            return
+        self._deadline_timer.start(math.ceil(delay * 1000))
+        if not self._ticker.isActive():
+            self._jump_detector.reset()
+            self._arm_ticker()
+
+    def _arm_ticker(self, min_delay: int = 0):
+        """
+        Arm the ticker for the next wall-clock second boundary.
+
+        Args:
+            min_delay: Skip boundaries closer than this many milliseconds
+        """
+        delay = self.TICK_INTERVAL - self.engine.clock.now().microsecond // 1000
+        while delay < min_delay:
+            delay += self.TICK_INTERVAL
+        self._ticker.start(delay)
+
+    def _on_tick(self):
+        """Check the clock and redraw all running timers."""
+        self._check_clock()
+        if not self.engine:
+            return
+        if self._rendering:
+            self._redraw_running()
+            # A coarse tick can fire a little before its boundary; aim for the one after
+            self._arm_ticker(self.TICK_INTERVAL // 2)
+        else:
+            self._ticker.start(self.BACKGROUND_CHECK_INTERVAL)  # Clock checks only
 
-    def _play_alert_beep(self):
-        """Play one beep in the alert sequence."""
-        self.sound_effect.play()
-        self.alert_count += 1
-        if self.alert_count >= self.ALERT_BEEP_COUNT:
-            self.alert_timer.stop()
-            self.alert_count = 0
+    def _redraw_running(self):
+        """Update and redraw the remaining time of all running timers."""
+        for timer in self.engine.refresh_all():
+            item_widget = self._rows.get(timer.id)
+            if item_widget is not None:
+                item_widget.refresh()
 
-    def _on_timer_completed(self, timer: TimerInstance):
+    def set_rendering(self, visible: bool):
         """
-        Handle timer completion.
+        Follow the window's visibility (RenderPolicy.visibility_changed).
+
+        Completions and alerts are not affected; only redraws and blinking are.
 
         Args:
-            timer: Completed timer instance
+            visible: False to stop redrawing, True to catch up and resume
         """
-        for item_widget in self.timer_items:
-            if item_widget.timer.id == timer.id:
-                # Start border blinking animation (continues until clicked)
-                item_widget.start_completion_blink()
+        if visible == self._rendering:
+            return
+        self._rendering = visible
+        self.blinker.set_suspended(not visible)
+        if visible and self.engine:
+            self._check_clock()
+            self._redraw_running()  # One catch-up redraw
+            self._arm_ticker()
+
+    def _on_deadline(self):
+        """Complete the timers whose deadline passed and wait for the next one."""
+        self._check_clock()  # A deadline due during sleep fires late; catch up first
+        self._complete_batch(self.engine.poll())
+        self._advance_batch()
+        self._warn_batch(self.engine.poll_warnings())
+        self._report_stage_changes()
+        self._schedule_next_deadline()
+
+    def _check_clock(self):
+        """Catch up running timers if the machine slept since the last check."""
+        jump = self._jump_detector.check()
+        if jump.slept:
+            logger.info(f"System slept for {jump.slept:.0f}s, catching up")
+            self._complete_batch(self.engine.catch_up(jump.slept), missed=True)
+            self._advance_batch()
+            self._warn_batch(self.engine.poll_warnings())
+            self._report_stage_changes()
+            self._schedule_next_deadline()
+        if jump.changed:
+            # Deadlines are monotonic; only new timestamps follow the wall clock
+            direction = "ahead" if jump.changed > 0 else "back"
+            logger.info(f"Wall clock set {direction} by {abs(jump.changed):.0f}s, countdowns unaffected")
+
+    def _complete_batch(self, timers: List[TimerInstance], missed: bool = False):
+        """
+        Complete timers that ran out together with one notification.
+
+        Args:
+            timers: Expired timers from TimerEngine.poll() or catch_up()
+            missed: Whether they ran out while the machine slept
+        """
+        item_widgets = [self._rows.get(timer.id) for timer in timers]
+        item_widgets = [item_widget for item_widget in item_widgets if item_widget is not None]
+        if not item_widgets:
+            return
+
+        # One beep sequence for the batch, in the tone of the first timer that ran out
+        tone = Tone.for_template(item_widgets[0].template)
+        for item_widget in item_widgets:
+            self._set_timer_active(item_widget.timer, False)
+            self._return_to_chain_start(item_widget)  # Last stage of a chain: ready to run it again
+            item_widget.complete()
+        # Border blinking continues until each row is clicked
+        self.blinker.add(item_widgets)
+        self._ensure_alert_player().play_tone(tone, self.ALERT_BEEP_COUNT, self.ALERT_BEEP_INTERVAL)
+        self.timers_completed.emit([item_widget.timer for item_widget in item_widgets], missed)
+
+    def _next_stage(self, timer: TimerInstance) -> Optional[Tuple[int, Tuple[int, ...]]]:
+        """
+        Move a timer that ran out to its template's next stage (engine next_stage hook).
+
+        Args:
+            timer: Timer whose deadline passed
+
+        Returns:
+            tuple or None: (stage seconds, warning seconds) to keep running, None to complete
+        """
+        item_widget = self._rows.get(timer.id)
+        template = self._templates.get(timer.template_id)
+        if item_widget is None or template is None or template.next_template_id is None:
+            return None
+        next_template = self._templates.get(template.next_template_id)
+        if next_template is None or next_template.duration_seconds <= 0:
+            return None
+
+        # Count the timer as active under its new template
+        self._set_timer_active(timer, False)
+        if timer.chain_template_id is None:
+            timer.chain_template_id = timer.template_id
+        timer.template_id = next_template.id
+        self._set_timer_active(timer, True)
+        item_widget.update_template(next_template)
+        self._advanced[timer.id] = timer
+        self._stage_changes[timer.id] = timer
+        return next_template.duration_seconds, next_template.warning_seconds
+
+    def _return_to_chain_start(self, item_widget: TimerItem):
+        """
+        Put a stopped or completed timer back on its chain's first template.
+
+        Args:
+            item_widget: Row of the timer (left as is unless it is in a later chain stage)
+        """
+        timer = item_widget.timer
+        if timer.chain_template_id is None:
+            return
+        first = self._templates.get(timer.chain_template_id)
+        timer.chain_template_id = None
+        if first is not None:
+            timer.template_id = first.id
+            item_widget.update_template(first)  # Stopped: remaining time becomes its duration
+        self._stage_changes[timer.id] = timer
+
+    def _report_stage_changes(self):
+        """Emit the pending chain stage changes as one batch (saved in one write)."""
+        if self._stage_changes:
+            timers = list(self._stage_changes.values())
+            self._stage_changes.clear()
+            self.timer_stages_changed.emit(timers)
+
+    def _advance_batch(self):
+        """Announce the timers the last poll moved to their next stage with one notification."""
+        if not self._advanced:
+            return
+        timers = list(self._advanced.values())
+        self._advanced.clear()
+
+        # Timers that also finished their new stage in the same poll already beeped as completed
+        running = [timer for timer in timers if self.engine.is_running(timer.id)]
+        if running:
+            self._ensure_alert_player().play_tone(
+                Tone.for_template(self._templates[running[0].template_id]),
+                self.WARNING_BEEP_COUNT, self.ALERT_BEEP_INTERVAL
+            )
+            if self._rendering:
+                for timer in running:
+                    self.engine.refresh(timer)
+                    self._rows.get(timer.id).refresh()
+        self.stages_advanced.emit(timers)
+
+    def _warn_batch(self, warnings: List[tuple[TimerInstance, int]]):
+        """
+        Announce warning stages reached together with one notification.
 
-                # Start repeating beep pattern
-                self.alert_count = 0
-                self.sound_effect.play()  # First beep immediately
-                self.alert_count = 1
-                self.alert_timer.start(self.ALERT_BEEP_INTERVAL)
+        Args:
+            warnings: (timer, seconds before the end) from TimerEngine.poll_warnings()
+        """
+        warnings = [(timer, stage) for timer, stage in warnings if self._rows.get(timer.id) is not None]
+        if not warnings:
+            return
+
+        # A short beep sequence in the tone of the first timer
+        self._ensure_alert_player().play_tone(
+            Tone.for_template(self._rows.get(warnings[0][0].id).template),
+            self.WARNING_BEEP_COUNT, self.ALERT_BEEP_INTERVAL
+        )
+        self.timers_warned.emit(warnings)
 
-                break
+    def start_timers(self, timer_ids: List[UUID]) -> List[TimerInstance]:
+        """
+        Start stopped timers (auto-start schedules); running or paused ones are left alone.
 
-        self.timer_completed.emit(timer)
+        Args:
+            timer_ids: UUIDs of timers to start
 
-    def get_timer_item(self, timer_id: str) -> TimerItem:
+        Returns:
+            list: Timers that were started
+        """
+        started = []
+        for timer_id in timer_ids:
+            item_widget = self._rows.get(timer_id)
+            if item_widget is not None and item_widget.timer.status == TimerStatus.STOPPED:
+                self.blinker.discard(item_widget)
+                item_widget.start()
+                started.append(item_widget.timer)
+        return started
+
+    def get_timer_item(self, timer_id: str | UUID) -> TimerItem:
         """
         Get timer item by timer ID.
 
         Args:
-            timer_id: UUID string
+            timer_id: UUID (or UUID string)
 
         Returns:
             TimerItem or None
         """
-        for item_widget in self.timer_items:
-            if str(item_widget.timer.id) == timer_id:
-                return item_widget
-        return None
+        return self._rows.get(timer_id)
 
     def _on_rows_moved(self, parent, start, end, destination, row):
         """
@@ -259,43 +536,71 @@ class TimerPanel(QWidget):
             destination: Destination index
             row: Target row
         """
-        self.timer_items.clear()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            if isinstance(widget, TimerItem):
-                self.timer_items.append(widget)
+        # Mirror the model move instead of rescanning every row
+        first = self._rows.move(start, end, row)
+        if first < 0:
+            return
 
-        timers = [item_widget.timer for item_widget in self.timer_items]
-        self.timers_reordered.emit(timers)
+        self.timers_reordered.emit(self._rows.delta(first, end - start + 1))
 
-    def _on_timer_status_changed(self, template_id: str, is_running: bool):
+    def has_active_timers(self, template_id: str | UUID) -> bool:
         """
-        Handle timer status change.
+        Check whether any timer using this template is running or paused.
 
         Args:
-            template_id: Template ID of the timer
-            is_running: Whether the timer is running or paused
+            template_id: UUID (or UUID string) of template
+
+        Returns:
+            bool: True if the template has active timers
         """
-        # Check if any timer using this template is running or paused
-        has_running_timers = False
-        for item_widget in self.timer_items:
-            if str(item_widget.timer.template_id) == template_id:
-                if item_widget.timer.status in [TimerStatus.RUNNING, TimerStatus.PAUSED]:
-                    has_running_timers = True
-                    break
+        return self._active_counts.has_active(template_id)
+
+    def _set_timer_active(self, timer: TimerInstance, active: bool, emit_signal: bool = True):
+        """
+        Update active timer count and notify when the template's count crosses zero.
+
+        Args:
+            timer: Timer whose status changed
+            active: Whether the timer is running or paused
+            emit_signal: Whether to emit template_button_update_needed
+        """
+        crossed = self._active_counts.set_active(timer.id, timer.template_id, active)
+        if crossed and emit_signal:
+            self.template_button_update_needed.emit(str(timer.template_id), active)
+
+    def _on_timer_status_changed(self, timer: TimerInstance):
+        """
+        Handle timer status change.
 
-        # Emit signal to update template buttons
-        self.template_button_update_needed.emit(template_id, has_running_timers)
+        Args:
+            timer: Timer with its new status
+        """
+        active = timer.status in self.ACTIVE_STATUSES
+        if active:
+            # Load QtMultimedia and render the template's tone before this timer can complete
+            item_widget = self._rows.get(timer.id)
+            if item_widget is not None:
+                self._ensure_alert_player().preload_tone(Tone.for_template(item_widget.template))
+        self._set_timer_active(timer, active)
+        if timer.status == TimerStatus.STOPPED:
+            # Stopping a chain in a later stage resets it to the first one
+            item_widget = self._rows.get(timer.id)
+            if item_widget is not None:
+                self._return_to_chain_start(item_widget)
+                self._report_stage_changes()
+        self._schedule_next_deadline()
 
     def _on_timer_item_clicked(self, timer_id: str):
         """
-        Handle timer item click - stop alert sound if playing.
+        Handle timer item click - stop blinking and alert sound.
 
         Args:
             timer_id: ID of clicked timer
         """
-        # Stop alert sound and timer
-        if self.alert_timer.isActive():
-            self.alert_timer.stop()
-            self.alert_count = 0
+        item_widget = self._rows.get(timer_id)
+        if item_widget is not None:
+            self.blinker.discard(item_widget)
+
+        # Stop alert sound
+        if self._alert_player is not None:
+            self._alert_player.stop()
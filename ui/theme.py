@@ -1,21 +1,37 @@
 """
 Centralized design system theme configuration.
 
-Version: 1.0.0
+Version: 1.1.5
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 
 Usage:
     from ui.theme import Theme
 
-    # Use color constants
-    button.setStyleSheet(f"background-color: {Theme.Colors.PRIMARY};")
+    # Install the compiled stylesheet once at startup
+    app.setStyleSheet(Theme.Styles.application())
 
-    # Use font configurations
+    # Style widgets by object name / dynamic property instead of setStyleSheet
+    button.setObjectName("primaryButton")
+    Theme.Styles.set_state(item, "blink", True)
+
+    # Use font configurations (cached QFont instances)
     label.setFont(Theme.Fonts.header())
 """
-from PySide6.QtGui import QFont
+from typing import NamedTuple
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QFont, QFontMetrics
+
+from ui.utils.assets import asset_path
+
+
+class TimerDigitMetrics(NamedTuple):
+    """Precomputed layout metrics for the timer readout."""
+    metrics: QFontMetrics
+    digit_width: int
+    readout_size: QSize
 
 
 class Theme:
@@ -61,9 +77,10 @@ class Theme:
 
     class Fonts:
         """Font configurations."""
-        FAMILY = "Pretendard"
+        FAMILY = "Pretendard UI"  # Subset fonts (subset_fonts.py), see ui/font_loader.py
+        FAMILY_FULL = "Pretendard"  # Glyphs outside the subset
         # Enhanced fallback font stack for better Windows compatibility
-        FAMILY_FALLBACK = "Pretendard, 'Malgun Gothic', 'Microsoft YaHei', -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, Roboto, 'Noto Sans', sans-serif"
+        FAMILY_FALLBACK = "'Pretendard UI', Pretendard, 'Malgun Gothic', 'Microsoft YaHei', -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, Roboto, 'Noto Sans', sans-serif"
 
         # Font sizes
         SIZE_SMALL = 10
@@ -77,10 +94,84 @@ class Theme:
         # Input font size (slightly smaller than label for better fit)
         SIZE_INPUT = 11
 
+        # Memoized fonts keyed by (family, size, weight, hinting)
+        _cache = {}
+        # Precomputed metrics for the countdown readout (see timer_metrics())
+        _timer_metrics = None
+
+        @staticmethod
+        def get(size: int, weight: QFont.Weight = QFont.Weight.Normal,
+                family: str = None,
+                hinting: QFont.HintingPreference = QFont.HintingPreference.PreferDefaultHinting) -> QFont:
+            """
+            Get a cached font instance.
+
+            The returned QFont is shared; widgets copy it in setFont(), but callers
+            that want to modify it must make their own copy (QFont(font)).
+
+            Args:
+                size: Font size in pixels
+                weight: Font weight
+                family: Font family (default: Theme.Fonts.FAMILY)
+                hinting: Hinting preference
+
+            Returns:
+                QFont: Cached font
+            """
+            key = (family or Theme.Fonts.FAMILY, size, weight, hinting)
+            font = Theme.Fonts._cache.get(key)
+            if font is None:
+                font = QFont(key[0], size, weight)
+                if key[0] == Theme.Fonts.FAMILY:
+                    font.setFamilies([Theme.Fonts.FAMILY, Theme.Fonts.FAMILY_FULL])
+                font.setHintingPreference(hinting)
+                Theme.Fonts._cache[key] = font
+            return font
+
+        @staticmethod
+        def clear_cache():
+            """Drop cached fonts and metrics (e.g. after a DPI change)."""
+            Theme.Fonts._cache.clear()
+            Theme.Fonts._timer_metrics = None
+
+        @staticmethod
+        def install_dpi_hook(app):
+            """
+            Clear the font cache whenever a screen's logical DPI changes.
+
+            Args:
+                app: QGuiApplication instance
+            """
+            def _watch(screen):
+                screen.logicalDotsPerInchChanged.connect(lambda _dpi: Theme.Fonts.clear_cache())
+
+            for screen in app.screens():
+                _watch(screen)
+            app.screenAdded.connect(_watch)
+
+        @staticmethod
+        def timer_metrics() -> 'TimerDigitMetrics':
+            """
+            Cached metrics for the countdown readout ("MM : SS").
+
+            Returns:
+                TimerDigitMetrics: Font metrics and the size of the widest readout
+            """
+            if Theme.Fonts._timer_metrics is None:
+                metrics = QFontMetrics(Theme.Fonts.timer_display())
+                widest_digit = max("0123456789", key=metrics.horizontalAdvance)
+                widest_text = f"{widest_digit * 2} : {widest_digit * 2}"
+                Theme.Fonts._timer_metrics = TimerDigitMetrics(
+                    metrics=metrics,
+                    digit_width=metrics.horizontalAdvance(widest_digit),
+                    readout_size=metrics.size(0, widest_text)
+                )
+            return Theme.Fonts._timer_metrics
+
         @staticmethod
         def regular(size: int = SIZE_NORMAL) -> QFont:
             """
-            Create regular weight font.
+            Get regular weight font (cached).
 
             Args:
                 size: Font size in pixels
@@ -88,12 +179,12 @@ class Theme:
             Returns:
                 QFont: Regular font
             """
-            return QFont(Theme.Fonts.FAMILY, size, QFont.Weight.Normal)
+            return Theme.Fonts.get(size, QFont.Weight.Normal)
 
         @staticmethod
         def bold(size: int = SIZE_NORMAL) -> QFont:
             """
-            Create bold weight font.
+            Get bold weight font (cached).
 
             Args:
                 size: Font size in pixels
@@ -101,7 +192,7 @@ class Theme:
             Returns:
                 QFont: Bold font
             """
-            return QFont(Theme.Fonts.FAMILY, size, QFont.Weight.Bold)
+            return Theme.Fonts.get(size, QFont.Weight.Bold)
 
         @staticmethod
         def header() -> QFont:
@@ -172,13 +263,64 @@ class Theme:
         INPUT_WIDTH_LARGE = 200
 
     class Styles:
-        """Pre-built stylesheet strings."""
+        """Pre-built stylesheet strings and the application stylesheet compiler."""
+
+        # Font stack shared by every widget (formerly set in main.py)
+        PLATFORM_FONT_STACK = '"Pretendard UI", "Pretendard", "Malgun Gothic", "Microsoft YaHei", "SF Pro Text", system-ui, sans-serif'
+
+        _compiled = None  # Cached result of application()
+
+        @staticmethod
+        def application() -> str:
+            """
+            Application-level stylesheet compiled from the theme.
+
+            Widgets are matched by object name and dynamic properties
+            (e.g. ``QFrame#timerListItem[blink="true"]``) instead of carrying
+            their own stylesheets, so Qt parses the rules once per process.
+            The result is built on first use and cached.
+
+            Returns:
+                str: Complete stylesheet for QApplication.setStyleSheet()
+            """
+            if Theme.Styles._compiled is None:
+                Theme.Styles._compiled = "\n".join([
+                    f"* {{ font-family: {Theme.Styles.PLATFORM_FONT_STACK}; }}",
+                    Theme.Styles.main_window(),
+                    Theme.Styles._panel_rules(),
+                    Theme.Styles._list_item_rules(),
+                    Theme.Styles._dialog_rules(),
+                    Theme.Styles._toast_rules(),
+                ])
+            return Theme.Styles._compiled
+
+        @staticmethod
+        def set_state(widget, name: str, value) -> bool:
+            """
+            Set a dynamic style property and re-polish the widget if it changed.
+
+            Args:
+                widget: Target widget
+                name: Property name used in stylesheet selectors (e.g. "blink")
+                value: New property value
+
+            Returns:
+                bool: True if the property changed and the widget was re-polished
+            """
+            if widget.property(name) == value:
+                return False
+            widget.setProperty(name, value)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
+            return True
 
         @staticmethod
-        def primary_button() -> str:
+        def primary_button(selector: str = "QPushButton") -> str:
             """Primary action button style."""
             return f"""
-                QPushButton {{
+                {selector} {{
                     background-color: {Theme.Colors.PRIMARY};
                     color: {Theme.Colors.WHITE};
                     border: none;
@@ -188,23 +330,23 @@ class Theme:
                     font-weight: bold;
                     padding: {Theme.Spacing.PADDING_MEDIUM}px {Theme.Spacing.PADDING_LARGE}px;
                 }}
-                QPushButton:hover {{
+                {selector}:hover {{
                     background-color: {Theme.Colors.PRIMARY_HOVER};
                 }}
-                QPushButton:pressed {{
+                {selector}:pressed {{
                     background-color: {Theme.Colors.PRIMARY_PRESSED};
                 }}
-                QPushButton:focus {{
+                {selector}:focus {{
                     outline: none;
                     border: none;
                 }}
             """
 
         @staticmethod
-        def secondary_button() -> str:
+        def secondary_button(selector: str = "QPushButton") -> str:
             """Secondary action button style."""
             return f"""
-                QPushButton {{
+                {selector} {{
                     background-color: {Theme.Colors.PANEL_BACKGROUND};
                     color: {Theme.Colors.TEXT_PRIMARY};
                     border: 1px solid {Theme.Colors.BORDER};
@@ -213,21 +355,21 @@ class Theme:
                     font-size: {Theme.Fonts.SIZE_NORMAL}px;
                     padding: {Theme.Spacing.PADDING_SMALL}px {Theme.Spacing.PADDING_MEDIUM}px;
                 }}
-                QPushButton:hover {{
+                {selector}:hover {{
                     background-color: {Theme.Colors.BACKGROUND};
                     border-color: {Theme.Colors.BORDER_HOVER};
                 }}
-                QPushButton:focus {{
+                {selector}:focus {{
                     outline: none;
                     border: 1px solid {Theme.Colors.BORDER};
                 }}
             """
 
         @staticmethod
-        def input_field() -> str:
+        def input_field(selector: str = "QLineEdit") -> str:
             """Standard input field style."""
             return f"""
-                QLineEdit {{
+                {selector} {{
                     border: 1px solid {Theme.Colors.BORDER};
                     border-radius: {Theme.Spacing.RADIUS_SMALL}px;
                     padding: {Theme.Spacing.PADDING_SMALL}px {Theme.Spacing.PADDING_MEDIUM}px;
@@ -236,26 +378,26 @@ class Theme:
                     background-color: {Theme.Colors.WHITE};
                     color: {Theme.Colors.TEXT_PRIMARY};
                 }}
-                QLineEdit:focus {{
+                {selector}:focus {{
                     border-color: {Theme.Colors.BORDER_FOCUS};
                     outline: none;
                 }}
             """
 
         @staticmethod
-        def list_widget() -> str:
+        def list_widget(selector: str = "QListWidget") -> str:
             """List widget style."""
             return f"""
-                QListWidget {{
+                {selector} {{
                     border: none;
                     background-color: {Theme.Colors.PANEL_BACKGROUND};
                     outline: none;
                 }}
-                QListWidget::item {{
+                {selector}::item {{
                     border: none;
                     background-color: transparent;
                 }}
-                QListWidget::item:selected {{
+                {selector}::item:selected {{
                     background-color: transparent;
                     border: none;
                 }}
@@ -295,6 +437,174 @@ class Theme:
                 }}
             """
 
+        @staticmethod
+        def _label_roles() -> str:
+            """Text color rules for QLabel[role=...] used across panels and dialogs."""
+            roles = {
+                "primary": Theme.Colors.TEXT_PRIMARY,
+                "secondary": Theme.Colors.TEXT_SECONDARY,
+                "tertiary": Theme.Colors.TEXT_TERTIARY,
+                "danger": Theme.Colors.DANGER,
+            }
+            return "\n".join(
+                f'QLabel[role="{role}"] {{ color: {color}; background-color: transparent; }}'
+                for role, color in roles.items()
+            )
+
+        @staticmethod
+        def _panel_rules() -> str:
+            """Template/timer panel rules (headers, list widgets, add button)."""
+            return f"""
+                {Theme.Styles._label_roles()}
+                QWidget#templatePanel {{
+                    background-color: transparent;
+                    border-right: 1px solid {Theme.Colors.BORDER};
+                }}
+                QWidget#timerPanel {{
+                    background-color: transparent;
+                }}
+                {Theme.Styles.list_widget("QListWidget#itemList")}
+                {Theme.Styles.primary_button("QPushButton#addTemplateButton")}
+            """
+
+        @staticmethod
+        def _list_item_rules() -> str:
+            """Timer/template row rules, including the blink state and row buttons."""
+            return f"""
+                QFrame#timerListItem, QFrame#templateListItem {{
+                    background-color: {Theme.Colors.PANEL_BACKGROUND};
+                    border: 2px solid {Theme.Colors.BORDER};
+                    border-radius: {Theme.Spacing.RADIUS_LARGE}px;
+                }}
+                QFrame#templateListItem:hover {{
+                    background-color: {Theme.Colors.BACKGROUND};
+                }}
+                #timerListItem QWidget, #templateListItem QWidget {{
+                    background-color: transparent;
+                }}
+                QFrame#timerListItem[blink="true"] {{
+                    background-color: {Theme.Colors.COMPLETION_BACKGROUND};
+                    border: 2px solid {Theme.Colors.COMPLETION_BORDER};
+                }}
+                #timeLabel {{
+                    color: {Theme.Colors.TEXT_PRIMARY};
+                    padding: 0px;
+                    margin: 0px;
+                }}
+                QPushButton#controlButton,
+                QPushButton#controlButton:hover,
+                QPushButton#controlButton:pressed,
+                QPushButton#controlButton:disabled,
+                QPushButton#controlButton:focus,
+                QPushButton#controlButton:default {{
+                    background: transparent;
+                    border: none;
+                    outline: none;
+                    padding: 0px;
+                    margin: 0px;
+                }}
+                QPushButton#actionButton {{
+                    background-color: {Theme.Colors.TEXT_TERTIARY};
+                    color: {Theme.Colors.WHITE};
+                    border: none;
+                    border-radius: {Theme.Spacing.RADIUS_SMALL}px;
+                    padding: 2px;
+                    margin: 1px;
+                    text-align: center;
+                    font-family: {Theme.Fonts.FAMILY_FALLBACK};
+                    font-size: {Theme.Fonts.SIZE_SMALL}px;
+                    font-weight: bold;
+                }}
+                QPushButton#actionButton:hover {{
+                    background-color: {Theme.Colors.TEXT_SECONDARY};
+                }}
+                QPushButton#actionButton:pressed {{
+                    background-color: #616161;
+                }}
+                QPushButton#actionButton:disabled {{
+                    background-color: {Theme.Colors.BORDER};
+                    color: {Theme.Colors.TEXT_TERTIARY};
+                }}
+                QPushButton#actionButton:focus {{
+                    outline: none;
+                    border: none;
+                }}
+            """
+
+        @staticmethod
+        def _dialog_rules() -> str:
+            """Dialog rules: inputs, combo boxes, cancel/primary/danger buttons, delete dialog details."""
+            arrow = asset_path("icons/dropdown.svg").replace("\\", "/")  # QSS url() needs forward slashes
+            return f"""
+                {Theme.Styles.dialog()}
+                {Theme.Styles.input_field()}
+                {Theme.Styles.input_field("QComboBox")}
+                QComboBox::drop-down {{
+                    border: none;
+                    width: 24px;
+                }}
+                QComboBox::down-arrow {{
+                    image: url({arrow});
+                    width: 16px;
+                    height: 16px;
+                }}
+                QPushButton#cancelButton, QPushButton#primaryButton, QPushButton#dangerButton {{
+                    color: {Theme.Colors.WHITE};
+                    border: none;
+                    border-radius: {Theme.Spacing.RADIUS_SMALL}px;
+                    font-family: {Theme.Fonts.FAMILY_FALLBACK};
+                }}
+                QPushButton#cancelButton {{
+                    background-color: #95a5a6;
+                }}
+                QPushButton#cancelButton:hover {{
+                    background-color: #7f8c8d;
+                }}
+                QPushButton#primaryButton {{
+                    background-color: {Theme.Colors.PRIMARY};
+                }}
+                QPushButton#primaryButton:hover {{
+                    background-color: {Theme.Colors.PRIMARY_HOVER};
+                }}
+                QPushButton#dangerButton {{
+                    background-color: {Theme.Colors.DANGER};
+                }}
+                QPushButton#dangerButton:hover {{
+                    background-color: {Theme.Colors.DANGER_HOVER};
+                }}
+                QPushButton#cancelButton:focus, QPushButton#primaryButton:focus, QPushButton#dangerButton:focus {{
+                    outline: none;
+                }}
+                QLabel#deleteMessage {{
+                    padding: 10px 0;
+                }}
+                QWidget#timerListBox, #timerListBox QLabel {{
+                    background-color: {Theme.Colors.BACKGROUND};
+                    border-radius: {Theme.Spacing.RADIUS_SMALL}px;
+                }}
+                QLabel#timerListEntry {{
+                    padding: 2px;
+                }}
+                QLabel#deleteTotal {{
+                    padding: 5px 0;
+                }}
+                QLabel#deleteWarning {{
+                    font-style: italic;
+                }}
+            """
+
+        @staticmethod
+        def _toast_rules() -> str:
+            """Toast notification rules."""
+            return f"""
+                QLabel#toastMessage {{
+                    background-color: {Theme.Colors.TOAST_BACKGROUND};
+                    color: {Theme.Colors.TOAST_TEXT};
+                    padding: {Theme.Spacing.PADDING_LARGE}px {Theme.Spacing.PADDING_XLARGE + 4}px;
+                    border-radius: {Theme.Spacing.RADIUS_MEDIUM}px;
+                }}
+            """
+
         @staticmethod
         def message_box(danger_text: str = "삭제", cancel_text: str = "취소") -> str:
             """
@@ -1,11 +1,35 @@
 """
 UI utility modules.
 
-Version: 1.0.0
+Version: 1.0.7
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+Exports are imported on first attribute access (PEP 562).
 """
-from ui.utils.toast import show_toast, ToastMessage
+import importlib
+
+_EXPORTS = {
+    'show_toast': 'ui.utils.toast',
+    'ToastMessage': 'ui.utils.toast',
+    'ToastManager': 'ui.utils.toast',
+    'asset_path': 'ui.utils.assets',
+    'asset_url': 'ui.utils.assets',
+    'read_asset': 'ui.utils.assets',
+    'AlertPlayer': 'ui.utils.audio',
+    'Tone': 'ui.utils.tones',
+    'ToneCache': 'ui.utils.tones',
+    'RenderPolicy': 'ui.utils.render_policy',
+    'BackgroundCall': 'ui.utils.startup',
+    'ChunkedLoader': 'ui.utils.startup',
+    'StartupTimeline': 'ui.utils.startup',
+}
+
+__all__ = ['show_toast', 'ToastMessage', 'ToastManager', 'asset_path', 'asset_url', 'read_asset', 'AlertPlayer', 'Tone', 'ToneCache', 'RenderPolicy', 'BackgroundCall', 'ChunkedLoader', 'StartupTimeline']
+
 
-__all__ = ['show_toast', 'ToastMessage']
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
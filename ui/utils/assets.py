@@ -0,0 +1,125 @@
+"""
+Shared asset resolver for fonts, icons and sounds.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Assets are served from the compiled resource bundle assets/assets.rcc
+(built by build_resources.py) when it is present: the bundle is
+memory-mapped once and every asset is read from ":/assets/..." without
+touching the filesystem. Without a bundle, paths point at the loose files
+under assets/ (the PyInstaller temp folder when frozen, the project root
+in development).
+
+Usage:
+    from ui.utils.assets import asset_path, asset_url, read_asset
+
+    QFontDatabase.addApplicationFont(asset_path("fonts/Pretendard-Bold.otf"))
+    sound_effect.setSource(asset_url("alert.wav"))
+    svg_data = read_asset("icons/play.svg")
+"""
+import sys
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QFile, QIODevice, QResource, QUrl
+
+RESOURCE_FILE = "assets.rcc"
+RESOURCE_ROOT = ":/assets"
+
+_bundle_registered: Optional[bool] = None  # Resolved on first use
+
+
+def get_base_path() -> Path:
+    """
+    Get the directory that contains assets/.
+
+    Returns:
+        Path: PyInstaller temp folder when frozen, project root otherwise
+    """
+    # PyInstaller creates a temp folder and stores path in _MEIPASS
+    if getattr(sys, 'frozen', False):
+        return Path(sys._MEIPASS)
+    return Path(__file__).parent.parent.parent
+
+
+def register_assets() -> bool:
+    """
+    Register the compiled resource bundle (once).
+
+    Returns:
+        bool: True if assets are served from the bundle
+    """
+    global _bundle_registered
+    if _bundle_registered is None:
+        bundle_path = get_base_path() / "assets" / RESOURCE_FILE
+        _bundle_registered = bundle_path.exists() and QResource.registerResource(str(bundle_path))
+        if _bundle_registered:
+            print(f"[ASSETS] Using resource bundle: {bundle_path}")
+        else:
+            print(f"[ASSETS] No resource bundle, using files under {bundle_path.parent}")
+    return _bundle_registered
+
+
+def asset_path(relative_path: str) -> str:
+    """
+    Get a path Qt can open for an asset.
+
+    Args:
+        relative_path: Path below assets/ (e.g. "icons/play.svg")
+
+    Returns:
+        str: ":/assets/..." resource path, or filesystem path
+    """
+    if register_assets():
+        return f"{RESOURCE_ROOT}/{relative_path}"
+    return str(get_base_path() / "assets" / relative_path)
+
+
+def asset_url(relative_path: str) -> QUrl:
+    """
+    Get a URL for an asset (for APIs taking QUrl, e.g. QSoundEffect).
+
+    Args:
+        relative_path: Path below assets/ (e.g. "alert.wav")
+
+    Returns:
+        QUrl: qrc: URL, or file: URL
+    """
+    if register_assets():
+        return QUrl(f"qrc{RESOURCE_ROOT}/{relative_path}")
+    return QUrl.fromLocalFile(asset_path(relative_path))
+
+
+def asset_exists(relative_path: str) -> bool:
+    """
+    Check whether an asset is available.
+
+    Args:
+        relative_path: Path below assets/
+
+    Returns:
+        bool: True if the asset exists in the bundle or on disk
+    """
+    return QFile.exists(asset_path(relative_path))
+
+
+def read_asset(relative_path: str) -> Optional[bytes]:
+    """
+    Read an asset's contents.
+
+    Args:
+        relative_path: Path below assets/
+
+    Returns:
+        bytes or None if the asset is missing
+    """
+    file = QFile(asset_path(relative_path))
+    if not file.open(QIODevice.OpenModeFlag.ReadOnly):
+        return None
+    try:
+        return file.readAll().data()
+    finally:
+        file.close()
@@ -0,0 +1,373 @@
+"""
+Alert audio: preloaded PCM clips mixed into one QAudioSink stream.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Sounds are decoded from WAV into 16-bit PCM once, at the output device's
+sample rate. AlertMixer renders repeating beep sequences into a single
+stream that QAudioSink pulls from, so overlapping alerts are summed
+instead of restarting each other. Completions that arrive while a sound's
+sequence is still beeping join it (coalesced burst): the rhythm is kept
+and the sequence is extended to a full set of beeps from the latest
+completion. Latency from play() to sound is bounded by the sink buffer
+(BUFFER_MS). Template alert tones are synthesized in process (see
+ui/utils/tones.py) and mixed the same way as decoded WAV clips.
+
+Usage:
+    from models.enums import AlertPattern
+    from ui.utils.audio import AlertPlayer
+    from ui.utils.tones import Tone
+
+    player = AlertPlayer(volume=0.7)
+    player.preload("alert.wav")          # Decode before the first completion
+    player.play("alert.wav", repeats=10, interval_ms=500)
+    player.play_tone(Tone(1200, AlertPattern.DOUBLE), repeats=10, interval_ms=500)
+    player.stop()                        # e.g. when the user clicks the item
+"""
+import io
+import sys
+import threading
+import wave
+from array import array
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QIODevice, QObject, QTimer
+
+from ui.utils.assets import read_asset
+from ui.utils.tones import Tone, ToneCache
+
+MIX_RATE = 44100  # Default mixer sample rate (used when the device has no preference)
+BUFFER_MS = 40  # Sink buffer; upper bound on play() to sound latency
+IDLE_SUSPEND_MS = 2000  # Suspend the sink after this long without sound
+
+SAMPLE_MIN = -32768
+SAMPLE_MAX = 32767
+
+
+def decode_wav(data: bytes, rate: int = MIX_RATE) -> array:
+    """
+    Decode a 16-bit PCM WAV file into mono samples at the mixer rate.
+
+    Args:
+        data: WAV file contents
+        rate: Target sample rate (linear resampling if the file differs)
+
+    Returns:
+        array: Signed 16-bit mono samples ('h')
+
+    Raises:
+        ValueError: If the file is not 16-bit PCM WAV
+    """
+    try:
+        with wave.open(io.BytesIO(data), 'rb') as wav:
+            if wav.getsampwidth() != 2 or wav.getcomptype() != 'NONE':
+                raise ValueError("only uncompressed 16-bit PCM is supported")
+            channels = wav.getnchannels()
+            source_rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"invalid WAV data: {e}") from e
+
+    samples = array('h')
+    samples.frombytes(frames)
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV is little endian
+
+    if channels > 1:
+        samples = array('h', (
+            sum(samples[i:i + channels]) // channels
+            for i in range(0, len(samples), channels)
+        ))
+
+    if source_rate != rate and samples:
+        step = source_rate / rate
+        last = len(samples) - 1
+        resampled = array('h')
+        for i in range(int(len(samples) / step)):
+            position = i * step
+            index = int(position)
+            fraction = position - index
+            following = samples[min(index + 1, last)]
+            resampled.append(int(samples[index] + (following - samples[index]) * fraction))
+        samples = resampled
+
+    return samples
+
+
+class _Sequence:
+    """Repeating beeps of one sound."""
+
+    __slots__ = ('clip', 'interval', 'remaining', 'next_start')
+
+    def __init__(self, clip: array, interval: int, remaining: int, next_start: int):
+        self.clip = clip
+        self.interval = interval  # Frames between beep starts
+        self.remaining = remaining  # Beeps not yet started
+        self.next_start = next_start  # Stream frame of the next beep
+
+
+class AlertMixer:
+    """
+    Render overlapping beep sequences into one mono 16-bit stream.
+
+    Pure Python (no Qt) so it can be driven by QAudioSink or by a benchmark.
+    play()/stop() may be called from the GUI thread while read() runs on the
+    audio thread.
+    """
+
+    def __init__(self, rate: int = MIX_RATE):
+        """
+        Initialize mixer.
+
+        Args:
+            rate: Sample rate of clips and output
+        """
+        self.rate = rate
+        self.frame = 0  # Frames rendered so far (the stream clock)
+        self.coalesced = 0  # Completions merged into a running sequence
+        self._sequences: Dict[str, _Sequence] = {}
+        self._voices: List[list] = []  # [clip, start frame] of sounding beeps
+        self._lock = threading.Lock()
+
+    def is_idle(self) -> bool:
+        """Check whether nothing is playing or scheduled."""
+        return not self._sequences and not self._voices
+
+    def play(self, key: str, clip: array, repeats: int, interval_ms: int):
+        """
+        Start (or join) a beep sequence.
+
+        Args:
+            key: Sound name; completions with the same key form one burst
+            clip: Samples from decode_wav()
+            repeats: Number of beeps
+            interval_ms: Milliseconds between beep starts
+        """
+        with self._lock:
+            sequence = self._sequences.get(key)
+            if sequence is not None:
+                sequence.remaining = max(sequence.remaining, repeats)
+                self.coalesced += 1
+                return
+            interval = max(1, self.rate * interval_ms // 1000)
+            self._sequences[key] = _Sequence(clip, interval, repeats, self.frame)
+
+    def stop(self):
+        """Silence everything from the next rendered frame."""
+        with self._lock:
+            self._sequences.clear()
+            self._voices.clear()
+
+    def read(self, frames: int) -> array:
+        """
+        Render the next frames of the stream.
+
+        Args:
+            frames: Number of frames to render
+
+        Returns:
+            array: Mixed mono samples ('h'), silence when idle
+        """
+        with self._lock:
+            start = self.frame
+            end = start + frames
+            self.frame = end
+            if not self._sequences and not self._voices:
+                return array('h', bytes(frames * 2))
+
+            for key, sequence in list(self._sequences.items()):
+                while sequence.remaining and sequence.next_start < end:
+                    self._voices.append([sequence.clip, sequence.next_start])
+                    sequence.next_start += sequence.interval
+                    sequence.remaining -= 1
+                if not sequence.remaining:
+                    del self._sequences[key]
+
+            return self._mix(start, frames)
+
+    def _mix(self, start: int, frames: int) -> array:
+        """Sum the sounding voices over [start, start + frames)."""
+        end = start + frames
+        parts = []
+        for voice in self._voices:
+            clip, voice_start = voice
+            offset = max(0, start - voice_start)
+            position = max(0, voice_start - start)
+            count = min(len(clip) - offset, frames - position)
+            if count > 0:
+                parts.append((position, clip[offset:offset + count]))
+        self._voices = [voice for voice in self._voices if voice[1] + len(voice[0]) > end]
+
+        if len(parts) == 1 and parts[0][0] == 0 and len(parts[0][1]) == frames:
+            return parts[0][1]  # One voice covering the whole buffer: no mixing needed
+
+        mixed = [0] * frames
+        for position, samples in parts:
+            for i, sample in enumerate(samples, position):
+                mixed[i] += sample
+        return array('h', [SAMPLE_MAX if s > SAMPLE_MAX else SAMPLE_MIN if s < SAMPLE_MIN else s for s in mixed])
+
+
+class _MixerDevice(QIODevice):
+    """Read-only stream device QAudioSink pulls mixed samples from."""
+
+    def __init__(self, mixer: AlertMixer, channels: int, parent=None):
+        super().__init__(parent)
+        self._mixer = mixer
+        self._channels = channels
+        self._frame_bytes = 2 * channels
+
+    def isSequential(self) -> bool:
+        return True
+
+    def bytesAvailable(self) -> int:
+        return 1 << 30  # Endless stream
+
+    def readData(self, maxlen: int) -> bytes:
+        frames = maxlen // self._frame_bytes
+        samples = self._mixer.read(frames)
+        if self._channels > 1:
+            interleaved = array('h', bytes(frames * self._frame_bytes))
+            for channel in range(self._channels):
+                interleaved[channel::self._channels] = samples
+            samples = interleaved
+        if sys.byteorder == 'big':
+            samples.byteswap()
+        return samples.tobytes()
+
+    def writeData(self, data) -> int:
+        return -1
+
+
+class AlertPlayer(QObject):
+    """
+    Alert sounds played through one QAudioSink.
+
+    QtMultimedia is imported when the player is created; clips are decoded
+    on preload() or first play().
+    """
+
+    def __init__(self, volume: float = 1.0, parent=None):
+        """
+        Initialize player and open the default audio output.
+
+        Args:
+            volume: Output volume (0.0 - 1.0)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        from PySide6.QtMultimedia import QAudioFormat, QAudioSink, QMediaDevices
+
+        device = QMediaDevices.defaultAudioOutput()
+        preferred = device.preferredFormat()
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(preferred.sampleRate() or MIX_RATE)
+        audio_format.setChannelCount(max(1, preferred.channelCount()))
+        audio_format.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+
+        self._mixer = AlertMixer(audio_format.sampleRate())
+        self._clips: Dict[str, array] = {}
+        self._tones = ToneCache()
+        self._device = _MixerDevice(self._mixer, audio_format.channelCount(), self)
+        self._device.open(QIODevice.OpenModeFlag.ReadOnly)
+
+        self._sink = QAudioSink(device, audio_format, self)
+        self._sink.setBufferSize(audio_format.bytesForDuration(BUFFER_MS * 1000))
+        self._sink.setVolume(volume)
+        self._started = False
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setInterval(IDLE_SUSPEND_MS)
+        self._idle_timer.timeout.connect(self._suspend_if_idle)
+
+        print(f"[SOUND] Audio output: {device.description()}, "
+              f"{audio_format.sampleRate()} Hz x {audio_format.channelCount()}")
+
+    def preload(self, sound: str) -> Optional[array]:
+        """
+        Decode a sound from assets/ into memory (once).
+
+        Args:
+            sound: Asset path of a 16-bit PCM WAV file (e.g. "alert.wav")
+
+        Returns:
+            array or None if the sound is missing or unsupported
+        """
+        clip = self._clips.get(sound)
+        if clip is None:
+            data = read_asset(sound)
+            if data is None:
+                print(f"[SOUND] ⚠️  Sound file not found: {sound}")
+                return None
+            try:
+                clip = decode_wav(data, self._mixer.rate)
+            except ValueError as e:
+                print(f"[SOUND] ❌ Cannot decode {sound}: {e}")
+                return None
+            self._clips[sound] = clip
+            print(f"[SOUND] ✅ Decoded {sound}: {len(clip):,} frames")
+        return clip
+
+    def preload_tone(self, tone: Tone) -> array:
+        """
+        Synthesize an alert tone at the output rate (cached).
+
+        Args:
+            tone: Frequency and pattern
+
+        Returns:
+            array: Tone samples
+        """
+        return self._tones.get(tone, self._mixer.rate)
+
+    def play(self, sound: str, repeats: int = 1, interval_ms: int = 0):
+        """
+        Play a sound, repeated; joins the running sequence of the same sound.
+
+        Args:
+            sound: Asset path of the sound
+            repeats: Number of beeps
+            interval_ms: Milliseconds between beep starts
+        """
+        clip = self.preload(sound)
+        if clip is not None:
+            self._start(sound, clip, repeats, interval_ms)
+
+    def play_tone(self, tone: Tone, repeats: int = 1, interval_ms: int = 0):
+        """
+        Play a synthesized tone, repeated; joins the running sequence of the same tone.
+
+        Args:
+            tone: Frequency and pattern
+            repeats: Number of beeps
+            interval_ms: Milliseconds between beep starts
+        """
+        self._start(tone.key, self.preload_tone(tone), repeats, interval_ms)
+
+    def _start(self, key: str, clip: array, repeats: int, interval_ms: int):
+        """Schedule a sequence on the mixer and make sure the sink is pulling."""
+        self._mixer.play(key, clip, repeats, interval_ms)
+        if not self._started:
+            self._sink.start(self._device)
+            self._started = True
+        else:
+            self._sink.resume()
+        self._idle_timer.start()
+
+    def stop(self):
+        """Silence all alerts."""
+        self._mixer.stop()
+
+    @property
+    def coalesced(self) -> int:
+        """Number of completions merged into an already running sequence."""
+        return self._mixer.coalesced
+
+    def _suspend_if_idle(self):
+        """Stop pulling silence once nothing has played for a while."""
+        if self._mixer.is_idle():
+            self._sink.suspend()
+            self._idle_timer.stop()
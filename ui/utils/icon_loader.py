@@ -1,40 +1,40 @@
 """
 SVG icon loader utility for creating QIcon from SVG files with color support.
 
-Version: 1.0.0
+Version: 1.0.3
 Author: rowan@lionrocket.ai
 Created: 2025-10-20
+Last Modified: 2026-10-19
 
 Usage:
     from ui.utils.icon_loader import create_svg_icon
 
     icon = create_svg_icon("play.svg", "#43a047", size=30)
     button.setIcon(icon)
+
+Icons are cached per (name, color, size): rows switch between a handful of
+colored icons on every status change, so a batch of 1000 completions reuses
+the same few QIcons (implicitly shared) instead of reading and rendering
+the SVG 3000 times.
 """
-import sys
-from pathlib import Path
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
-from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtCore import QSize
+from ui.utils.assets import asset_path, read_asset
+
+_icon_cache = {}  # (icon_name, color, size) -> QIcon
 
 
-def get_icon_path(icon_name: str) -> Path:
+def get_icon_path(icon_name: str) -> str:
     """
-    Get the full path to an SVG icon file.
+    Get the path to an SVG icon file.
 
     Args:
         icon_name: Name of the SVG file (e.g., "play.svg")
 
     Returns:
-        Path: Full path to the icon file
+        str: Resource path (":/assets/icons/...") or filesystem path
     """
-    # PyInstaller creates a temp folder and stores path in _MEIPASS
-    if getattr(sys, 'frozen', False):
-        base_path = Path(sys._MEIPASS)
-    else:
-        base_path = Path(__file__).parent.parent.parent
-
-    return base_path / "assets" / "icons" / icon_name
+    return asset_path(f"icons/{icon_name}")
 
 
 def create_svg_icon(icon_name: str, color: str, size: int = 24) -> QIcon:
@@ -49,19 +49,28 @@ def create_svg_icon(icon_name: str, color: str, size: int = 24) -> QIcon:
     Returns:
         QIcon: Colored icon at specified size
     """
-    icon_path = get_icon_path(icon_name)
+    key = (icon_name, color, size)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        icon = _icon_cache[key] = _render_svg_icon(icon_name, color, size)
+    return icon
 
-    if not icon_path.exists():
-        print(f"[ICON] Warning: Icon file not found: {icon_path}")
-        return QIcon()
 
+def _render_svg_icon(icon_name: str, color: str, size: int) -> QIcon:
+    """Read an SVG file and render it in the given color (uncached)."""
     # Read SVG file
-    with open(icon_path, 'r', encoding='utf-8') as f:
-        svg_data = f.read()
+    svg_bytes = read_asset(f"icons/{icon_name}")
+    if svg_bytes is None:
+        print(f"[ICON] Warning: Icon file not found: {get_icon_path(icon_name)}")
+        return QIcon()
+    svg_data = svg_bytes.decode('utf-8')
 
     # Replace currentColor with actual color
     svg_data = svg_data.replace('currentColor', color)
 
+    # QtSvg is imported on first use to keep it off the startup path
+    from PySide6.QtSvg import QSvgRenderer
+
     # Create SVG renderer
     renderer = QSvgRenderer(svg_data.encode('utf-8'))
 
@@ -0,0 +1,93 @@
+"""
+Visibility-aware render policy for a top-level window.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Tells widgets with periodic redraws whether anyone can see the window, so
+they can stop redrawing while it is hidden, minimized or (where the
+platform reports it) fully covered, and catch up with one redraw when it
+comes back. Only drawing should follow the policy: completions, alerts and
+notifications must not wait for the window to be seen.
+
+The window counts as visible when it is shown, not minimized and its
+native window is exposed. The state is re-evaluated on show/hide, window
+state changes, activation and expose events; visibility_changed is only
+emitted when it actually changes.
+
+Usage:
+    from ui.utils.render_policy import RenderPolicy
+
+    policy = RenderPolicy(window)
+    policy.visibility_changed.connect(panel.set_rendering)
+"""
+from PySide6.QtCore import QEvent, QObject, Signal
+from PySide6.QtWidgets import QWidget
+
+_WIDGET_EVENTS = (
+    QEvent.Type.Show,
+    QEvent.Type.Hide,
+    QEvent.Type.WindowStateChange,
+    QEvent.Type.WindowActivate,
+)
+
+
+class RenderPolicy(QObject):
+    """Track whether a top-level window can be seen."""
+
+    visibility_changed = Signal(bool)  # (visible) - redraw everything once when True
+
+    def __init__(self, window: QWidget):
+        """
+        Initialize render policy.
+
+        Args:
+            window: Top-level window to watch
+        """
+        super().__init__(window)
+        self._window = window
+        self._handle = None  # Native window; created when the window is first shown
+        self._visible = self._evaluate()
+        window.installEventFilter(self)
+        self._watch_handle()
+
+    def is_visible(self) -> bool:
+        """
+        Check whether the window can be seen.
+
+        Returns:
+            bool: True if redraws are worth doing
+        """
+        return self._visible
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Type.Expose or (obj is self._window and event_type in _WIDGET_EVENTS):
+            if event_type == QEvent.Type.Show:
+                self._watch_handle()
+            self._update()
+        return False
+
+    def _watch_handle(self):
+        """Also watch expose events of the native window (occlusion, unmapping)."""
+        handle = self._window.windowHandle()
+        if handle is not None and handle is not self._handle:
+            self._handle = handle
+            handle.installEventFilter(self)
+
+    def _evaluate(self) -> bool:
+        """Compute visibility from the window's current state."""
+        window = self._window
+        if not window.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _update(self):
+        """Re-evaluate visibility and announce a change."""
+        visible = self._evaluate()
+        if visible != self._visible:
+            self._visible = visible
+            self.visibility_changed.emit(visible)
@@ -0,0 +1,210 @@
+"""
+Staged startup helpers: startup timeline, time-sliced row loading and
+background database queries.
+
+Version: 1.0.1
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    from ui.utils.startup import BackgroundCall, ChunkedLoader, StartupTimeline, after_first_paint
+
+    timeline = StartupTimeline()      # Create first thing in main()
+    ...
+    timeline.mark("imports")
+    window.show()
+    after_first_paint(window, lambda: timeline.mark("first paint"))
+
+    loader = ChunkedLoader(timers, panel.add_timer_item)
+    loader.finished.connect(lambda: print(timeline.report()))
+    loader.start()                    # Adds rows between event loop passes
+
+    query = BackgroundCall(db.get_all_timers)
+    query.finished.connect(on_timers) # Delivered on the GUI thread
+    query.start()
+"""
+import json
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QThreadPool, QTimer, Signal
+
+# Time spent adding rows per event loop pass (keeps the UI responsive while loading)
+FRAME_BUDGET_MS = 12
+
+
+class StartupTimeline:
+    """Named startup milestones in milliseconds since the timeline was created."""
+
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Initialize timeline.
+
+        Args:
+            origin: time.perf_counter() value to measure from (default: now)
+        """
+        self._origin = time.perf_counter() if origin is None else origin
+        self._marks: List[Tuple[str, float]] = []
+
+    def mark(self, name: str):
+        """
+        Record a milestone.
+
+        Args:
+            name: Milestone name (e.g. "imports", "fonts", "database")
+        """
+        self._marks.append((name, (time.perf_counter() - self._origin) * 1000))
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Get milestones.
+
+        Returns:
+            Dict[str, float]: Milestone name -> milliseconds since start
+        """
+        return {name: round(elapsed, 1) for name, elapsed in self._marks}
+
+    def report(self) -> str:
+        """
+        Format milestones with time since the previous one.
+
+        Returns:
+            str: Multi-line report
+        """
+        lines = []
+        previous = 0.0
+        for name, elapsed in self._marks:
+            lines.append(f"[STARTUP] {name:<14} {elapsed:8.1f} ms  (+{elapsed - previous:.1f})")
+            previous = elapsed
+        return "\n".join(lines)
+
+    def to_json(self) -> str:
+        """Serialize milestones for scripts comparing startup runs."""
+        return json.dumps(self.as_dict())
+
+
+def after_first_paint(widget, callback: Callable[[], None]):
+    """
+    Call back once the widget has been painted for the first time.
+
+    Args:
+        widget: Widget to watch (shown, or about to be shown)
+        callback: Called on the event loop pass after the first paint
+    """
+    _FirstPaintFilter(widget, callback)
+
+
+class _FirstPaintFilter(QObject):
+    """Event filter that calls back once on the watched widget's first paint."""
+
+    def __init__(self, widget, callback: Callable[[], None]):
+        super().__init__(widget)
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            obj.removeEventFilter(self)
+            # Painting is still in progress; call back once the event loop is back
+            QTimer.singleShot(0, self._callback)
+            self.deleteLater()
+        return False
+
+
+class ChunkedLoader(QObject):
+    """
+    Feed items to a callback a time slice at a time from the event loop.
+
+    Each pass adds items until FRAME_BUDGET_MS has elapsed, then yields so
+    the window can paint and handle input before the next pass.
+    """
+
+    progressed = Signal(int)  # Items added so far (after each slice)
+    finished = Signal()  # All items added
+
+    def __init__(self, items: Iterable, add_item: Callable, budget_ms: float = FRAME_BUDGET_MS, parent=None):
+        """
+        Initialize loader.
+
+        Args:
+            items: Items to load, in order
+            add_item: Called with each item
+            budget_ms: Milliseconds of work per event loop pass
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._items = iter(items)
+        self._add_item = add_item
+        self._budget = budget_ms / 1000
+        self._active = False
+        self._count = 0
+
+    def is_active(self) -> bool:
+        """Check whether items are still being loaded."""
+        return self._active
+
+    def start(self):
+        """Start loading on the next event loop pass."""
+        self._active = True
+        QTimer.singleShot(0, self._load_slice)
+
+    def cancel(self):
+        """Stop loading; remaining items are dropped."""
+        self._active = False
+
+    def finish(self):
+        """Add all remaining items now (e.g. before a full reload)."""
+        if not self._active:
+            return
+        for item in self._items:
+            self._add_item(item)
+        self._active = False
+        self.finished.emit()
+
+    def _load_slice(self):
+        """Add items until the time budget is used up."""
+        if not self._active:
+            return
+
+        deadline = time.perf_counter() + self._budget
+        for item in self._items:
+            self._add_item(item)
+            self._count += 1
+            if time.perf_counter() >= deadline:
+                self.progressed.emit(self._count)
+                QTimer.singleShot(0, self._load_slice)
+                return
+
+        self._active = False
+        self.progressed.emit(self._count)
+        self.finished.emit()
+
+
+class BackgroundCall(QObject):
+    """
+    Run a function on the global QThreadPool and deliver its result.
+
+    finished is emitted from the worker thread; slots of objects living on
+    the GUI thread receive it through a queued connection.
+    """
+
+    finished = Signal(object)  # Function result
+
+    def __init__(self, function: Callable[[], object], parent=None):
+        """
+        Initialize background call.
+
+        Args:
+            function: Thread-safe function to run (no arguments)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._function = function
+
+    def start(self):
+        """Queue the function on the global thread pool."""
+        QThreadPool.globalInstance().start(self._run)
+
+    def _run(self):
+        self.finished.emit(self._function())
@@ -1,19 +1,36 @@
 """
 Toast message utility for user notifications.
 
-Version: 1.0.1
+Version: 1.0.4
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
+
+Each parent window has one ToastManager (created on first show_toast()).
+It shows at most MAX_VISIBLE toasts at once, stacked above the bottom edge,
+and queues the rest. Toast widgets are pooled: a dismissed toast is hidden
+and reused for the next message, so the number of widgets never exceeds
+MAX_VISIBLE however many messages are shown. Messages with the same key
+coalesce into one toast ("타이머 5개 완료") while it is queued or visible.
+
+Usage:
+    from ui.utils.toast import show_toast
+
+    show_toast(window, "저장되었습니다")
+    show_toast(window, f"'{name}' 타이머 완료", key="timer_completed", group_message="타이머 {count}개 완료")
+    show_toast(window, "타이머 3개 완료", key="timer_completed", group_message="타이머 {count}개 완료", count=3)
 """
-from PySide6.QtCore import QEasingCurve, QPropertyAnimation, Qt, QTimer
-from PySide6.QtWidgets import QGraphicsOpacityEffect, QLabel
+from collections import deque
+from typing import Deque, List, Optional
+
+from PySide6.QtCore import QEasingCurve, QObject, QPropertyAnimation, Qt, QTimer, Signal
+from PySide6.QtWidgets import QGraphicsOpacityEffect, QLabel, QWidget
 
 from ui.theme import Theme
 
 
 class ToastMessage(QLabel):
-    """Toast notification widget."""
+    """Toast notification widget (reusable: show_toast() may be called again after dismissed)."""
 
     # Animation constants
     ANIMATION_DURATION = 200  # milliseconds
@@ -21,7 +38,9 @@ class ToastMessage(QLabel):
     BOTTOM_MARGIN = 50  # pixels from bottom
     MAX_WIDTH = 400  # maximum toast width
 
-    def __init__(self, message: str, parent=None):
+    dismissed = Signal()  # Faded out and hidden
+
+    def __init__(self, message: str = "", parent=None):
         """
         Initialize toast message.
 
@@ -30,20 +49,12 @@ class ToastMessage(QLabel):
             parent: Parent widget
         """
         super().__init__(message, parent)
-        self._animation = None  # Keep reference to prevent garbage collection
         self._init_ui()
 
     def _init_ui(self):
         """Initialize UI components."""
         self.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {Theme.Colors.TOAST_BACKGROUND};
-                color: {Theme.Colors.TOAST_TEXT};
-                padding: {Theme.Spacing.PADDING_LARGE}px {Theme.Spacing.PADDING_XLARGE + 4}px;
-                border-radius: {Theme.Spacing.RADIUS_MEDIUM}px;
-            }}
-        """)
+        self.setObjectName("toastMessage")
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setWordWrap(True)
         self.setMaximumWidth(self.MAX_WIDTH)
@@ -52,6 +63,21 @@ class ToastMessage(QLabel):
         self.opacity_effect = QGraphicsOpacityEffect()
         self.setGraphicsEffect(self.opacity_effect)
 
+        # One animation and timer per widget, reused for every message
+        self._animation = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self._animation.setDuration(self.ANIMATION_DURATION)
+        self._animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._animation.finished.connect(self._on_animation_finished)
+
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self._fade_out)
+
+    @property
+    def is_fading_out(self) -> bool:
+        """Check whether the toast is on its way out (no longer extendable)."""
+        return self._animation.endValue() == 0.0 and self.isVisible()
+
     def show_toast(self, duration: int = None):
         """
         Show toast message with fade animation.
@@ -59,64 +85,214 @@ class ToastMessage(QLabel):
         Args:
             duration: Display duration in milliseconds (default: DEFAULT_DISPLAY_DURATION)
         """
-        if duration is None:
-            duration = self.DEFAULT_DISPLAY_DURATION
-
         # Position at center bottom
-        self._position_toast()
+        self.position()
 
         # Show with fade in
         self.show()
         self.raise_()
-
-        # Fade in animation
-        self._animation = self._create_fade_animation(
-            start_opacity=0.0,
-            end_opacity=1.0
-        )
-        self._animation.start()
+        self._fade(0.0, 1.0)
 
         # Auto hide after duration
-        QTimer.singleShot(duration, self._fade_out)
+        self.extend(duration)
+
+    def extend(self, duration: int = None):
+        """
+        Restart the display duration (e.g. after the message changed).
 
-    def _position_toast(self):
-        """Position toast at center bottom of parent."""
+        Args:
+            duration: Display duration in milliseconds (default: DEFAULT_DISPLAY_DURATION)
+        """
+        self._hide_timer.start(self.DEFAULT_DISPLAY_DURATION if duration is None else duration)
+
+    def dismiss(self):
+        """Hide immediately without animation."""
+        self._hide_timer.stop()
+        self._animation.stop()
+        self.hide()
+
+    def position(self, bottom: int = None):
+        """
+        Position toast at center bottom of parent.
+
+        Args:
+            bottom: Pixels between parent bottom and toast bottom (default: BOTTOM_MARGIN)
+        """
         if self.parent():
             parent_rect = self.parent().rect()
             self.adjustSize()
             x = (parent_rect.width() - self.width()) // 2
-            y = parent_rect.height() - self.height() - self.BOTTOM_MARGIN
+            y = parent_rect.height() - self.height() - (self.BOTTOM_MARGIN if bottom is None else bottom)
             self.move(x, y)
 
-    def _create_fade_animation(self, start_opacity: float, end_opacity: float) -> QPropertyAnimation:
+    def _fade(self, start_opacity: float, end_opacity: float):
         """
-        Create fade animation with consistent settings.
+        Run the fade animation.
 
         Args:
             start_opacity: Starting opacity value (0.0 - 1.0)
             end_opacity: Ending opacity value (0.0 - 1.0)
-
-        Returns:
-            QPropertyAnimation: Configured animation object
         """
-        animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        animation.setDuration(self.ANIMATION_DURATION)
-        animation.setStartValue(start_opacity)
-        animation.setEndValue(end_opacity)
-        animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-        return animation
+        self._animation.stop()
+        self._animation.setStartValue(start_opacity)
+        self._animation.setEndValue(end_opacity)
+        self._animation.start()
 
     def _fade_out(self):
         """Fade out and hide toast."""
-        self._animation = self._create_fade_animation(
-            start_opacity=1.0,
-            end_opacity=0.0
-        )
-        self._animation.finished.connect(self.hide)
-        self._animation.start()
+        self._fade(1.0, 0.0)
+
+    def _on_animation_finished(self):
+        """Hide the toast once faded out."""
+        if self._animation.endValue() == 0.0:
+            self.hide()
+            self.dismissed.emit()
+
+
+class _PendingToast:
+    """Queued (or shown) message, possibly standing for several coalesced ones."""
+
+    __slots__ = ('message', 'duration', 'key', 'group_message', 'count')
+
+    def __init__(self, message: str, duration: Optional[int], key: Optional[str], group_message: Optional[str],
+                 count: int = 1):
+        self.message = message
+        self.duration = duration
+        self.key = key
+        self.group_message = group_message
+        self.count = count
+
+    def add(self, message: str, count: int = 1):
+        """Coalesce another message (standing for count items) with the same key."""
+        self.count += count
+        self.message = self.group_message.format(count=self.count) if self.group_message else message
+
+
+class ToastManager(QObject):
+    """Queue, coalesce and pool the toasts of one parent widget."""
+
+    MAX_VISIBLE = 3  # Toasts (and fade animations) on screen at once
+    MAX_PENDING = 20  # Queued messages; the oldest is dropped beyond this
+    SPACING = 8  # Pixels between stacked toasts
+
+    def __init__(self, parent: QWidget):
+        """
+        Initialize toast manager.
+
+        Args:
+            parent: Widget toasts are shown over
+        """
+        super().__init__(parent)
+        self._parent = parent
+        self._pending: Deque[_PendingToast] = deque()
+        self._shown: List[tuple[ToastMessage, _PendingToast]] = []  # Bottom to top
+        self._pool: List[ToastMessage] = []
+        self.created = 0  # Toast widgets constructed (bounded by MAX_VISIBLE)
+        self.coalesced = 0  # Messages merged into a queued or visible toast
+        self.dropped = 0  # Messages discarded because the queue was full
+
+    @classmethod
+    def for_widget(cls, parent: QWidget) -> 'ToastManager':
+        """
+        Get the toast manager of a widget, creating it on first use.
+
+        Args:
+            parent: Widget toasts are shown over
+
+        Returns:
+            ToastManager: The widget's manager
+        """
+        manager = parent.findChild(cls, options=Qt.FindChildOption.FindDirectChildrenOnly)
+        return manager if manager is not None else cls(parent)
+
+    @property
+    def visible_count(self) -> int:
+        return len(self._shown)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def show(self, message: str, duration: int = None, key: str = None, group_message: str = None, count: int = 1):
+        """
+        Show a message now, or queue it behind the visible toasts.
+
+        Args:
+            message: Message text to display
+            duration: Display duration in milliseconds (default: ToastMessage.DEFAULT_DISPLAY_DURATION)
+            key: Messages with the same key coalesce while queued or visible
+            group_message: Text for coalesced messages, formatted with {count}
+            count: Items the message stands for (added to {count} when coalesced)
+        """
+        if key is not None and self._coalesce(key, message, count):
+            return
+
+        self._pending.append(_PendingToast(message, duration, key, group_message, count))
+        if len(self._pending) > self.MAX_PENDING:
+            self._pending.popleft()
+            self.dropped += 1
+        self._show_next()
+
+    def clear(self):
+        """Drop queued messages and hide all toasts."""
+        self._pending.clear()
+        for toast, _ in self._shown:
+            toast.dismiss()
+            self._pool.append(toast)
+        self._shown.clear()
+
+    def _coalesce(self, key: str, message: str, count: int) -> bool:
+        """Merge a message into a visible or queued toast with the same key."""
+        for toast, entry in self._shown:
+            if entry.key == key and not toast.is_fading_out:
+                entry.add(message, count)
+                toast.setText(entry.message)
+                toast.extend(entry.duration)
+                self.coalesced += 1
+                self._layout()
+                return True
+        for entry in self._pending:
+            if entry.key == key:
+                entry.add(message, count)
+                self.coalesced += 1
+                return True
+        return False
+
+    def _show_next(self):
+        """Show queued messages while there is room."""
+        while self._pending and len(self._shown) < self.MAX_VISIBLE:
+            entry = self._pending.popleft()
+            toast = self._acquire()
+            toast.setText(entry.message)
+            self._shown.append((toast, entry))
+            toast.show_toast(entry.duration)
+        self._layout()
+
+    def _acquire(self) -> ToastMessage:
+        """Take a pooled toast widget or create one."""
+        if self._pool:
+            return self._pool.pop()
+        toast = ToastMessage(parent=self._parent)
+        toast.dismissed.connect(lambda: self._on_dismissed(toast))
+        self.created += 1
+        return toast
+
+    def _on_dismissed(self, toast: ToastMessage):
+        """Return a faded-out toast to the pool and show the next message."""
+        self._shown = [(shown, entry) for shown, entry in self._shown if shown is not toast]
+        self._pool.append(toast)
+        self._show_next()
+
+    def _layout(self):
+        """Stack visible toasts upward from the bottom margin."""
+        bottom = ToastMessage.BOTTOM_MARGIN
+        for toast, _ in self._shown:
+            toast.position(bottom)
+            bottom += toast.height() + self.SPACING
 
 
-def show_toast(parent, message: str, duration: int = None):
+def show_toast(parent, message: str, duration: int = None, key: str = None, group_message: str = None,
+               count: int = 1):
     """
     Show a toast message.
 
@@ -124,10 +300,13 @@ def show_toast(parent, message: str, duration: int = None):
         parent: Parent widget
         message: Message text to display
         duration: Display duration in milliseconds (default: ToastMessage.DEFAULT_DISPLAY_DURATION)
+        key: Messages with the same key coalesce while queued or visible
+        group_message: Text for coalesced messages, formatted with {count}
+        count: Items the message stands for (added to {count} when coalesced)
 
     Returns:
-        ToastMessage: Toast instance (for testing or advanced usage)
+        ToastManager: The parent's toast manager (for testing or advanced usage)
     """
-    toast = ToastMessage(message, parent)
-    toast.show_toast(duration)
-    return toast
+    manager = ToastManager.for_widget(parent)
+    manager.show(message, duration, key, group_message, count)
+    return manager
@@ -0,0 +1,154 @@
+"""
+Alert tone synthesis with an in-memory LRU cache of rendered PCM.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+A tone is a sine wave at the template's alert frequency, shaped into one,
+two or three pulses (AlertPattern) with the same envelope as the original
+alert.wav: 10% linear fade in, 30% linear fade out, 30% volume. Samples are
+produced by chaining map() over C-level callables (math.sin,
+operator.mul, int) into an array, so there is no per-sample Python
+bytecode; a SINGLE tone at the default settings is sample-identical to
+alert.wav. Rendered buffers are kept in a small LRU cache and handed to
+AlertMixer directly, without WAV files.
+
+Usage:
+    from ui.utils.tones import Tone, ToneCache
+
+    cache = ToneCache()
+    samples = cache.get(Tone.for_template(template), rate=44100)
+"""
+import math
+import operator
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+from typing import NamedTuple, Tuple
+
+from models.enums import AlertPattern
+from models.template import DEFAULT_ALERT_FREQUENCY
+
+TONE_VOLUME = 0.3  # Peak amplitude (soft, as generate_alert_sound.py)
+FADE_IN = 0.1  # Share of each pulse spent fading in
+FADE_OUT = 0.3  # Share of each pulse spent fading out
+
+# Pattern -> (pulses, pulse seconds, gap seconds); every pattern lasts about 0.3 s
+PATTERN_SHAPES = {
+    AlertPattern.SINGLE: (1, 0.30, 0.0),
+    AlertPattern.DOUBLE: (2, 0.12, 0.06),
+    AlertPattern.TRIPLE: (3, 0.08, 0.04),
+}
+
+DEFAULT_CACHE_SIZE = 16  # Distinct tones kept rendered
+
+
+class Tone(NamedTuple):
+    """Alert tone parameters (hashable cache key)."""
+    frequency: int = DEFAULT_ALERT_FREQUENCY
+    pattern: AlertPattern = AlertPattern.SINGLE
+
+    @classmethod
+    def for_template(cls, template) -> 'Tone':
+        """
+        Get the alert tone of a template.
+
+        Args:
+            template: TimerTemplate
+
+        Returns:
+            Tone: Template's frequency and pattern
+        """
+        return cls(template.alert_frequency, template.alert_pattern)
+
+    @property
+    def key(self) -> str:
+        """Mixer sequence key; completions with the same tone coalesce."""
+        return f"tone:{self.frequency}:{self.pattern.value}"
+
+
+def _envelope(frames: int) -> array:
+    """Linear fade in/out gains for one pulse."""
+    fade_in = max(1, int(frames * FADE_IN))
+    fade_out = max(1, int(frames * FADE_OUT))
+    hold = max(0, frames - fade_in - fade_out)
+    gains = array('d', map((1.0 / fade_in).__mul__, range(fade_in)))
+    gains.extend(repeat(1.0, hold))
+    gains.extend(map((1.0 / fade_out).__mul__, range(fade_out, 0, -1)))
+    return gains[:frames]
+
+
+def _pulse(frequency: int, frames: int, rate: int) -> array:
+    """Render one enveloped sine pulse as 16-bit samples."""
+    step = 2 * math.pi * frequency / rate
+    wave = map(math.sin, map(step.__mul__, range(frames)))
+    shaped = map(operator.mul, wave, _envelope(frames))
+    return array('h', map(int, map(operator.mul, shaped, repeat(TONE_VOLUME * 32767))))
+
+
+def synthesize(tone: Tone, rate: int) -> array:
+    """
+    Render a tone.
+
+    Args:
+        tone: Frequency and pattern
+        rate: Sample rate in Hz
+
+    Returns:
+        array: Signed 16-bit mono samples ('h')
+    """
+    pulses, pulse_seconds, gap_seconds = PATTERN_SHAPES[tone.pattern]
+    pulse = _pulse(tone.frequency, int(rate * pulse_seconds), rate)
+    gap = array('h', bytes(2 * int(rate * gap_seconds)))
+
+    samples = array('h', pulse)
+    for _ in range(pulses - 1):
+        samples.extend(gap)
+        samples.extend(pulse)
+    return samples
+
+
+class ToneCache:
+    """Least-recently-used cache of rendered tones."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of rendered tones kept
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._tones: 'OrderedDict[Tuple[Tone, int], array]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tones)
+
+    def get(self, tone: Tone, rate: int) -> array:
+        """
+        Get rendered samples, synthesizing them on a miss.
+
+        Args:
+            tone: Frequency and pattern
+            rate: Sample rate in Hz
+
+        Returns:
+            array: Signed 16-bit mono samples ('h')
+        """
+        key = (tone, rate)
+        samples = self._tones.get(key)
+        if samples is not None:
+            self.hits += 1
+            self._tones.move_to_end(key)
+            return samples
+
+        self.misses += 1
+        samples = synthesize(tone, rate)
+        self._tones[key] = samples
+        if len(self._tones) > self.max_size:
+            self._tones.popitem(last=False)
+        return samples
@@ -1,12 +1,13 @@
 """
 UI widgets - reusable UI components without business logic.
 
-Version: 1.0.1
+Version: 1.0.2
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
-from ui.widgets.base_list_item import BaseListItem, format_duration, format_time_display
+from ui.widgets.base_list_item import BaseListItem, format_duration, format_time_display, format_time_seconds
+from ui.widgets.time_readout import TimeReadout
 from ui.widgets.timer_list_item import TimerListItem
 from ui.widgets.template_list_item import TemplateListItem
 
@@ -14,6 +15,8 @@ __all__ = [
     'BaseListItem',
     'format_duration',
     'format_time_display',
+    'format_time_seconds',
+    'TimeReadout',
     'TimerListItem',
     'TemplateListItem'
 ]
@@ -1,10 +1,10 @@
 """
 Base list item widget with common functionality.
 
-Version: 1.0.0
+Version: 1.0.2
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
@@ -148,34 +148,8 @@ class BaseListItem(QFrame):
         btn.setFlat(False)
         btn.setAutoFillBackground(False)
 
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Theme.Colors.TEXT_TERTIARY};
-                color: {Theme.Colors.WHITE};
-                border: none;
-                border-radius: {Theme.Spacing.RADIUS_SMALL}px;
-                padding: 2px;
-                margin: 1px;
-                text-align: center;
-                font-family: {Theme.Fonts.FAMILY_FALLBACK};
-                font-size: {Theme.Fonts.SIZE_SMALL}px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {Theme.Colors.TEXT_SECONDARY};
-            }}
-            QPushButton:pressed {{
-                background-color: #616161;
-            }}
-            QPushButton:disabled {{
-                background-color: {Theme.Colors.BORDER};
-                color: {Theme.Colors.TEXT_TERTIARY};
-            }}
-            QPushButton:focus {{
-                outline: none;
-                border: none;
-            }}
-        """)
+        # Styled by QPushButton#actionButton in Theme.Styles.application()
+        btn.setObjectName("actionButton")
         return btn
 
 
@@ -193,6 +167,13 @@ def format_duration(minutes: int, seconds: int) -> str:
     return f"{minutes:02d} 분 {seconds:02d} 초"
 
 
+# Every "MM : SS" readout string for 00:00-99:59, indexed by total seconds.
+# Built once at import so per-tick formatting is a tuple lookup.
+TIME_DISPLAY_TABLE = tuple(
+    f"{minutes:02d} : {seconds:02d}" for minutes in range(100) for seconds in range(60)
+)
+
+
 def format_time_display(minutes: int, seconds: int) -> str:
     """
     Format time for timer display.
@@ -204,4 +185,21 @@ def format_time_display(minutes: int, seconds: int) -> str:
     Returns:
         str: Formatted time (e.g., "05 : 30")
     """
+    if 0 <= minutes < 100 and 0 <= seconds < 60:
+        return TIME_DISPLAY_TABLE[minutes * 60 + seconds]
     return f"{minutes:02d} : {seconds:02d}"
+
+
+def format_time_seconds(total_seconds: int) -> str:
+    """
+    Format a total number of seconds for timer display.
+
+    Args:
+        total_seconds: Remaining seconds
+
+    Returns:
+        str: Formatted time (e.g., "05 : 30")
+    """
+    if 0 <= total_seconds < len(TIME_DISPLAY_TABLE):
+        return TIME_DISPLAY_TABLE[total_seconds]
+    return format_time_display(total_seconds // 60, total_seconds % 60)
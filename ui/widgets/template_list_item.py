@@ -1,15 +1,16 @@
 """
 Template list item component - separates item layout from business logic.
 
-Version: 1.0.1
+Version: 1.0.4
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
 from models.template import TimerTemplate
+from ui.font_loader import ensure_glyphs
 from ui.theme import Theme
 from ui.widgets.base_list_item import BaseListItem, format_duration
 
@@ -46,28 +47,15 @@ class TemplateListItem(BaseListItem):
 
         self.setLayout(main_layout)
         self.setLineWidth(2)
-        self.setStyleSheet(f"""
-            TemplateListItem {{
-                background-color: {Theme.Colors.PANEL_BACKGROUND};
-                border: 2px solid {Theme.Colors.BORDER};
-                border-radius: {Theme.Spacing.RADIUS_LARGE}px;
-            }}
-            TemplateListItem:hover {{
-                background-color: {Theme.Colors.BACKGROUND};
-            }}
-            QWidget {{
-                background-color: transparent;
-            }}
-            QLabel {{
-                background-color: transparent;
-            }}
-        """)
+        # Styled by QFrame#templateListItem in the app stylesheet
+        self.setObjectName("templateListItem")
 
     def _create_name_area(self) -> QWidget:
         """Create Area 1: Template name."""
+        ensure_glyphs(self.template.name)
         self.name_label = QLabel(self.template.name)
         self.name_label.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_LARGE))
-        self.name_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        self.name_label.setProperty("role", "primary")
         self.name_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         self.name_label.setContentsMargins(0, 0, 0, 0)
         return self._create_label_area(self.name_label)
@@ -80,7 +68,7 @@ class TemplateListItem(BaseListItem):
 
         self.duration_label = QLabel(format_duration(minutes, seconds))
         self.duration_label.setFont(Theme.Fonts.item_name())
-        self.duration_label.setStyleSheet(f"color: {Theme.Colors.TEXT_SECONDARY};")
+        self.duration_label.setProperty("role", "secondary")
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
         self.duration_label.setContentsMargins(0, 0, 0, 0)
         return self._create_label_area(self.duration_label)
@@ -97,12 +85,21 @@ class TemplateListItem(BaseListItem):
 
     def update_name(self, name: str):
         """Update template name display."""
+        ensure_glyphs(name)
         self.name_label.setText(name)
 
     def update_duration(self, minutes: int, seconds: int):
         """Update duration display."""
         self.duration_label.setText(format_duration(minutes, seconds))
 
+    def rebind(self, template: TimerTemplate):
+        """Show another template (used when the row widget is recycled)."""
+        self.template = template
+        total_seconds = int(template.duration.total_seconds())
+        self.update_name(template.name)
+        self.update_duration(total_seconds // 60, total_seconds % 60)
+        self.set_buttons_enabled(True)
+
     def set_buttons_enabled(self, enabled: bool):
         """
         Enable or disable edit/delete buttons.
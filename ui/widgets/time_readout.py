@@ -0,0 +1,116 @@
+"""
+Countdown readout widget painted from cached QStaticText layouts.
+
+Version: 1.0.0
+Author: rowan@lionrocket.ai
+Created: 2026-10-19
+Last Modified: 2026-10-19
+
+Usage:
+    from ui.widgets.time_readout import TimeReadout
+
+    readout = TimeReadout()
+    readout.set_seconds(330)  # "05 : 30"
+"""
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QPainter, QPalette, QStaticText, QTransform
+from PySide6.QtWidgets import QWidget
+
+from ui.theme import Theme
+from ui.widgets.base_list_item import format_time_seconds
+
+# Prepared glyph layouts shared by all readouts, keyed by QFont.key() then seconds
+_static_text_cache = {}
+
+
+def _static_text_table(font) -> dict:
+    """
+    Get the shared QStaticText table for a font.
+
+    Args:
+        font: Font the readout paints with
+
+    Returns:
+        dict: total_seconds -> prepared QStaticText (filled lazily)
+    """
+    return _static_text_cache.setdefault(font.key(), {})
+
+
+class TimeReadout(QWidget):
+    """
+    Fixed-size "MM : SS" readout.
+
+    Unlike QLabel, updating the value does no text layout: each distinct value
+    is laid out once per font into a QStaticText shared across all readouts,
+    and paintEvent only draws the prepared glyphs.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize readout.
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self._seconds = 0
+        self.setFont(Theme.Fonts.timer_display())
+        self.setFixedSize(Theme.Fonts.timer_metrics().readout_size)
+        self._glyphs = _static_text_table(self.font())
+
+    def seconds(self) -> int:
+        """Currently displayed total seconds."""
+        return self._seconds
+
+    def set_seconds(self, total_seconds: int):
+        """
+        Display a new value; repaints only if it changed.
+
+        Args:
+            total_seconds: Remaining seconds to display
+        """
+        if total_seconds != self._seconds:
+            self._seconds = total_seconds
+            self.update()
+
+    def set_time(self, minutes: int, seconds: int):
+        """
+        Display minutes and seconds.
+
+        Args:
+            minutes: Minutes value
+            seconds: Seconds value
+        """
+        self.set_seconds(minutes * 60 + seconds)
+
+    def text(self) -> str:
+        """Displayed text (for tests and accessibility)."""
+        return format_time_seconds(self._seconds)
+
+    def _static_text(self) -> QStaticText:
+        """Get (or prepare) the static text for the current value."""
+        static_text = self._glyphs.get(self._seconds)
+        if static_text is None:
+            static_text = QStaticText(format_time_seconds(self._seconds))
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), self.font())
+            self._glyphs[self._seconds] = static_text
+        return static_text
+
+    def changeEvent(self, event):
+        """Switch glyph tables when the (style sheet) font changes."""
+        if event.type() == QEvent.Type.FontChange:
+            self._glyphs = _static_text_table(self.font())
+        super().changeEvent(event)
+
+    def paintEvent(self, event):
+        """Draw the prepared glyphs centered in the widget."""
+        static_text = self._static_text()
+        size = static_text.size()
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawStaticText(
+            QPointF((self.width() - size.width()) / 2, (self.height() - size.height()) / 2),
+            static_text
+        )
@@ -1,10 +1,10 @@
 """
 Timer list item component - separates item layout from widget container.
 
-Version: 1.0.1
+Version: 1.0.7
 Author: rowan@lionrocket.ai
 Created: 2025-10-19
-Last Modified: 2025-10-19
+Last Modified: 2026-10-19
 """
 from PySide6.QtCore import Qt, Signal, QSize, QEvent
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
@@ -12,8 +12,10 @@ from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLay
 from models.enums import TimerStatus
 from models.template import TimerTemplate
 from models.timer import TimerInstance
+from ui.font_loader import ensure_glyphs
 from ui.theme import Theme
-from ui.widgets.base_list_item import BaseListItem, format_time_display
+from ui.widgets.base_list_item import BaseListItem
+from ui.widgets.time_readout import TimeReadout
 from ui.utils.icon_loader import create_svg_icon
 
 
@@ -55,21 +57,10 @@ class TimerListItem(BaseListItem):
 
         self.setLayout(main_layout)
 
-        # Set initial normal state style with visible border
+        # Normal state style comes from QFrame#timerListItem in the app stylesheet
         self.setLineWidth(2)
-        self.setStyleSheet(f"""
-            TimerListItem {{
-                background-color: {Theme.Colors.PANEL_BACKGROUND};
-                border: 2px solid {Theme.Colors.BORDER};
-                border-radius: {Theme.Spacing.RADIUS_LARGE}px;
-            }}
-            QWidget {{
-                background-color: transparent;
-            }}
-            QLabel {{
-                background-color: transparent;
-            }}
-        """)
+        self.setObjectName("timerListItem")
+        self.setProperty("blink", False)
 
     def _create_info_area(self) -> QWidget:
         """Create Area 1: Template name (1-1) + Customer name (1-2) stacked vertically."""
@@ -81,15 +72,16 @@ class TimerListItem(BaseListItem):
         layout.setSpacing(0)
 
         # Area 1-1: Customer name (larger, bold, primary)
+        ensure_glyphs(self.timer.customer_name)
         self.customer_label = QLabel(self.timer.customer_name)
         self.customer_label.setFont(Theme.Fonts.bold(Theme.Fonts.SIZE_LARGE))
-        self.customer_label.setStyleSheet(f"color: {Theme.Colors.TEXT_PRIMARY};")
+        self.customer_label.setProperty("role", "primary")
         self.customer_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
 
         # Area 1-2: Template name (smaller, regular, secondary)
         self.template_label = QLabel(self.template.name)
         self.template_label.setFont(Theme.Fonts.regular(Theme.Fonts.SIZE_MEDIUM))
-        self.template_label.setStyleSheet(f"color: {Theme.Colors.TEXT_SECONDARY};")
+        self.template_label.setProperty("role", "secondary")
         self.template_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
 
         # Add with stretch for vertical centering (customer name first)
@@ -157,48 +149,8 @@ class TimerListItem(BaseListItem):
         # Install event filter to handle hover/pressed icon color changes
         btn.installEventFilter(self)
 
-        # Transparent background, no borders
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                background-color: transparent;
-                border: 0px;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }}
-            QPushButton:hover {{
-                background: transparent;
-                background-color: transparent;
-                border: 0px;
-                border: none;
-            }}
-            QPushButton:pressed {{
-                background: transparent;
-                background-color: transparent;
-                border: 0px;
-                border: none;
-            }}
-            QPushButton:disabled {{
-                background: transparent;
-                background-color: transparent;
-                border: 0px;
-                border: none;
-            }}
-            QPushButton:focus {{
-                background: transparent;
-                background-color: transparent;
-                outline: none;
-                border: 0px;
-                border: none;
-            }}
-            QPushButton:default {{
-                background: transparent;
-                background-color: transparent;
-                border: 0px;
-                border: none;
-            }}
-        """)
+        # Transparent background, no borders (QPushButton#controlButton)
+        btn.setObjectName("controlButton")
         return btn
 
     def _create_control_button(self, symbol: str, color: str, hover: str, pressed: str) -> QPushButton:
@@ -266,15 +218,13 @@ class TimerListItem(BaseListItem):
 
     def _create_time_area(self) -> QWidget:
         """Create Area 3: Time display."""
-        self.time_label = QLabel("00 : 00")
-        self.time_label.setFont(Theme.Fonts.timer_display())
-        self.time_label.setStyleSheet(f"""
-            color: {Theme.Colors.TEXT_PRIMARY};
-            padding: 0px;
-            margin: 0px;
-        """)
-        self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        return self._create_label_area(self.time_label)
+        # Painted from cached QStaticText; fixed size from cached digit metrics,
+        # so per-tick updates neither lay out text nor invalidate the row layout
+        self.time_readout = TimeReadout()
+        self.time_readout.setObjectName("timeLabel")
+        area = self._create_label_area(self.time_readout)
+        area.layout().setAlignment(self.time_readout, Qt.AlignmentFlag.AlignCenter)
+        return area
 
     def _create_actions_area(self) -> QWidget:
         """Create Area 4: Edit/Delete buttons."""
@@ -288,10 +238,13 @@ class TimerListItem(BaseListItem):
 
     def update_display(self, minutes: int, seconds: int):
         """Update time display."""
-        self.time_label.setText(format_time_display(minutes, seconds))
+        self.time_readout.set_time(minutes, seconds)
 
     def update_button_states(self, status: TimerStatus):
         """Update button enabled states and colors based on timer status."""
+        # Expose status to stylesheet selectors (QFrame#timerListItem[status="running"])
+        Theme.Styles.set_state(self, "status", status.value)
+
         # Inactive color (gray)
         inactive_color = "#9e9e9e"  # Theme.Colors.TEXT_TERTIARY
         icon_size = 30
@@ -349,49 +302,29 @@ class TimerListItem(BaseListItem):
     def update_customer_name(self, name: str):
         """Update customer name display."""
         self.timer.customer_name = name
+        ensure_glyphs(name)
         self.customer_label.setText(name)
 
     def update_template_name(self, name: str):
-        """Update template name display."""
-        self.template.name = name
+        """Update template name display (the template model is left alone)."""
         self.template_label.setText(name)
 
+    def set_template(self, template: TimerTemplate):
+        """Show the timer under another template (edited template or next chain stage)."""
+        self.template = template
+        self.update_template_name(template.name)
+
+    def rebind(self, timer: TimerInstance, template: TimerTemplate):
+        """Show another timer (used when the row widget is recycled)."""
+        self.timer = timer
+        self.template = template
+        ensure_glyphs(timer.customer_name)
+        self.customer_label.setText(timer.customer_name)
+        self.template_label.setText(template.name)
+
     def set_blink_border(self, show_border: bool):
-        """Set blinking border state by changing border color only."""
-        print(f"[DEBUG] set_blink_border called: show_border = {show_border}")
-
-        if show_border:
-            # Show blinking border - change color to green
-            self.setStyleSheet(f"""
-                TimerListItem {{
-                    background-color: {Theme.Colors.COMPLETION_BACKGROUND};
-                    border: 2px solid {Theme.Colors.COMPLETION_BORDER};
-                    border-radius: {Theme.Spacing.RADIUS_LARGE}px;
-                }}
-                QWidget {{
-                    background-color: transparent;
-                }}
-                QLabel {{
-                    background-color: transparent;
-                }}
-            """)
-        else:
-            # Normal state - default gray border
-            self.setStyleSheet(f"""
-                TimerListItem {{
-                    background-color: {Theme.Colors.PANEL_BACKGROUND};
-                    border: 2px solid {Theme.Colors.BORDER};
-                    border-radius: {Theme.Spacing.RADIUS_LARGE}px;
-                }}
-                QWidget {{
-                    background-color: transparent;
-                }}
-                QLabel {{
-                    background-color: transparent;
-                }}
-            """)
-
-        print(f"[DEBUG] Border updated for show_border={show_border}")
+        """Set blinking border state via the dynamic "blink" style property."""
+        Theme.Styles.set_state(self, "blink", show_border)
 
     def eventFilter(self, obj, event):
         """Handle hover and press events for control buttons to change icon colors."""